@@ -0,0 +1,309 @@
+from argparse import ArgumentParser, Namespace
+import csv
+import json
+import platform
+import sys
+import tracemalloc
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from typing import Callable, Dict, List, Sequence, Tuple
+from heuristics.core.activities.generator import ActivitiesGenerator, GeneratedNetwork
+from heuristics.core.activities.initializer import ActivitiesInitializer
+from heuristics.core.activities.loader import ActivitiesLoader
+from heuristics.core.cpm import CriticalPathMethod as CPM
+from heuristics.core.project import Project
+from heuristics.methods.validation import methods
+
+
+class BenchmarkResult():
+    """Time and peak memory of a single stage run on a generated network of a given size."""
+
+    stage: str
+    """Name of the stage (see BenchmarkRunner.stages)."""
+
+    size: int
+    """Number of activities of the network."""
+
+    seconds: float
+    """The lowest wall time of the stage over the repeats, in seconds."""
+
+    peak_memory: int
+    """Peak memory allocated by Python during the stage, in bytes."""
+
+    ## Public methods
+    def __init__(self, stage: str, size: int, seconds: float, peak_memory: int):
+        self.stage = stage
+        self.size = size
+        self.seconds = seconds
+        self.peak_memory = peak_memory
+
+    @property
+    def key(self) -> Tuple[str, int]:
+        """The stage and size, which identify the result in a baseline."""
+        return self.stage, self.size
+
+    def to_dict(self) -> Dict[str, object]:
+        """Returns the result as a dict for writing it as JSON or CSV."""
+
+        return {'stage': self.stage, 'size': self.size, 'seconds': self.seconds,
+                'peak_memory': self.peak_memory}
+
+    ## Magic methods
+    def __repr__(self) -> str:
+        return (f"BenchmarkResult(stage={self.stage!r}, size={self.size}," +
+                f" seconds={self.seconds:.6f}, peak_memory={self.peak_memory})")
+
+
+class BenchmarkRunner():
+    """
+    Times the stages of scheduling a project over a ladder of generated network sizes.
+
+    The networks are generated by ActivitiesGenerator into a temporary directory, so the
+    benchmarks need neither data files nor network access. Every stage is timed separately
+    from its inputs, which are prepared before the timer starts:
+
+    - loader: parsing the data file into activities (ActivitiesLoader),
+    - initializer: wiring the predecessors and successors (ActivitiesInitializer),
+    - cpm: solving the project by CriticalPathMethod,
+    - shm, phm, phmdp: scheduling the solved project by the heuristic method.
+
+    The time of a stage is the lowest of `repeats` runs. The peak memory is measured by
+    tracemalloc in one more run, as tracing slows down the stage.
+    """
+
+    stages = ("loader", "initializer", "cpm", "shm", "phm", "phmdp")
+    """Names of the stages that can be benchmarked, in the order they are run."""
+
+    sizes: Tuple[int, ...]
+    """Numbers of activities of the generated networks."""
+
+    stage_names: Tuple[str, ...]
+    """Names of the benchmarked stages."""
+
+    repeats: int
+    """Number of timed runs of each stage."""
+
+    seed: int
+    """Seed of the generated networks (see ActivitiesGenerator)."""
+
+    resource_strength: float
+    """Resource strength of the generated networks (see ActivitiesGenerator)."""
+
+    ## Public methods
+    def __init__(self, sizes: Sequence[int] = (1000, 10000, 100000),
+                 stage_names: Sequence[str] = stages, repeats: int = 3, seed: int = 0,
+                 resource_strength: float = 0.5):
+        for stage_name in stage_names:
+            if stage_name not in self.stages:
+                raise ValueError(f"Unsupported benchmark stage '{stage_name}'!" +
+                                 f"\n Currently, only '{', '.join(self.stages)}' are" +
+                                 " supported.")
+
+        if repeats < 1 or any(size < 1 for size in sizes):
+            raise ValueError("Creating BenchmarkRunner failed!" +
+                             "\n Parameters 'sizes' and 'repeats' must be positive!")
+
+        self.sizes = tuple(sizes)
+        self.stage_names = tuple(stage_name for stage_name in self.stages
+                                 if stage_name in stage_names)
+        self.repeats = repeats
+        self.seed = seed
+        self.resource_strength = resource_strength
+
+    def run(self) -> List[BenchmarkResult]:
+        """Runs the stages for each of the sizes and returns their results."""
+
+        results = []
+        with TemporaryDirectory() as temp_dir:
+            for size in self.sizes:
+                acts_file_path = Path(temp_dir, f"network_{size}.csv")
+                generator = ActivitiesGenerator(size, resource_strength=self.resource_strength,
+                                                seed=self.seed)
+                network = generator.write(acts_file_path)
+
+                for stage_name in self.stage_names:
+                    setup, stage = self._get_stage(stage_name, acts_file_path, network)
+                    results.append(BenchmarkResult(stage_name, size,
+                                                   *self._measure(setup, stage)))
+
+        return results
+
+    @staticmethod
+    def compare(results: Sequence[BenchmarkResult], baseline: Sequence[BenchmarkResult],
+                time_threshold: float = 0.25, memory_threshold: float = 0.25) -> List[str]:
+        """
+        Returns the descriptions of the results that regressed compared to the baseline.
+
+        A result regresses if its time or peak memory exceeds the one of the baseline result
+        of the same stage and size by more than the threshold, e.g. 0.25 allows 25 % more.
+        Results missing in the baseline are skipped.
+        """
+
+        baseline_results = {result.key: result for result in baseline}
+        regressions = []
+        for result in results:
+            baseline_result = baseline_results.get(result.key)
+            if baseline_result is None:
+                continue
+
+            for name, value, baseline_value, threshold in (
+                    ("time", result.seconds, baseline_result.seconds, time_threshold),
+                    ("peak memory", result.peak_memory, baseline_result.peak_memory,
+                     memory_threshold)):
+                if value > baseline_value * (1 + threshold):
+                    regressions.append(f"{result.stage} ({result.size} activities): {name}" +
+                                       f" {value:.6g} exceeds baseline {baseline_value:.6g}" +
+                                       f" by more than {threshold:.0%}")
+
+        return regressions
+
+    @staticmethod
+    def to_json_file(results: Sequence[BenchmarkResult], json_file_path: str):
+        """Writes the results together with a description of the machine to a JSON file."""
+
+        data = {'python': platform.python_version(), 'machine': platform.platform(),
+                'results': [result.to_dict() for result in results]}
+        with open(json_file_path, "w", encoding="utf-8") as file:
+            json.dump(data, file, indent=2)
+
+    @staticmethod
+    def from_json_file(json_file_path: str) -> List[BenchmarkResult]:
+        """Loads the results written by `to_json_file`, e.g. a stored baseline."""
+
+        with open(json_file_path, encoding="utf-8") as file:
+            data = json.load(file)
+
+        return [BenchmarkResult(result['stage'], result['size'], result['seconds'],
+                                result['peak_memory']) for result in data['results']]
+
+    @staticmethod
+    def to_csv_file(results: Sequence[BenchmarkResult], csv_file_path: str = None):
+        """Writes the results to a CSV file, or to the standard output if no path is given."""
+
+        if csv_file_path is None:
+            BenchmarkRunner._write_csv(results, sys.stdout)
+            return
+
+        with open(csv_file_path, "w", encoding="utf-8", newline="") as file:
+            BenchmarkRunner._write_csv(results, file)
+
+    ## Private methods
+    def _measure(self, setup: Callable[[], object],
+                 stage: Callable[[object], object]) -> Tuple[float, int]:
+        """
+        Returns the lowest time of the stage over the repeats and its peak memory.
+
+        The setup prepares a fresh input of the stage before every run.
+        """
+
+        seconds = float("inf")
+        for _ in range(self.repeats):
+            stage_input = setup()
+            time_start = perf_counter()
+            stage(stage_input)
+            seconds = min(seconds, perf_counter() - time_start)
+
+        stage_input = setup()
+        tracemalloc.start()
+        try:
+            tracemalloc.reset_peak()
+            stage(stage_input)
+            _, peak_memory = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        return seconds, peak_memory
+
+    @staticmethod
+    def _get_stage(stage_name: str, acts_file_path: Path,
+                   network: GeneratedNetwork) -> Tuple[Callable[[], object],
+                                                       Callable[[object], object]]:
+        """Returns the setup and the stage itself for the stage name."""
+
+        r_max = network.r_max
+        if stage_name == "loader":
+            return lambda: acts_file_path, ActivitiesLoader.get_activities
+        if stage_name == "initializer":
+            return (lambda: ActivitiesLoader.get_activities(acts_file_path),
+                    ActivitiesInitializer.init_activities)
+
+        project = Project.from_file_and_args(acts_file_path, r_max)
+        if stage_name == "cpm":
+            return lambda: CPM.from_project(project), CPM.solve
+
+        cpm = CPM.from_project(project)
+        cpm.solve()
+        method_class = methods[stage_name]
+        return lambda: method_class.from_cpm(cpm, r_max), method_class.solve
+
+    @staticmethod
+    def _write_csv(results: Sequence[BenchmarkResult], file):
+        """Writes the results to an opened file as CSV."""
+
+        writer = csv.DictWriter(file, ("stage", "size", "seconds", "peak_memory"))
+        writer.writeheader()
+        writer.writerows(result.to_dict() for result in results)
+
+    ## Magic methods
+    def __repr__(self) -> str:
+        return (f"BenchmarkRunner(sizes={self.sizes}, stage_names={self.stage_names}," +
+                f" repeats={self.repeats}, seed={self.seed})")
+
+
+def _parse_arguments(argv: Sequence[str] = None) -> Namespace:
+    """Parses the command-line arguments of the entry point."""
+
+    parser = ArgumentParser(prog="python -m heuristics.benchmarks.runner",
+                            description="Times the loader, initializer, CPM and heuristic" +
+                                        " methods on generated networks of growing sizes.")
+    parser.add_argument("-s", "--sizes", nargs="+", type=int, default=[1000, 10000, 100000],
+                        help="numbers of activities of the generated networks")
+    parser.add_argument("--stages", nargs="+", default=list(BenchmarkRunner.stages),
+                        choices=list(BenchmarkRunner.stages), help="stages to benchmark")
+    parser.add_argument("-n", "--repeats", type=int, default=3,
+                        help="number of timed runs of each stage (default: 3)")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the generated networks")
+    parser.add_argument("-o", "--output", default=None,
+                        help="path to the JSON file with results")
+    parser.add_argument("--csv", default=None,
+                        help="path to the CSV file with results (default: standard output)")
+    parser.add_argument("-b", "--baseline", default=None,
+                        help="path to the JSON file with baseline results to compare with")
+    parser.add_argument("--time-threshold", type=float, default=0.25,
+                        help="allowed relative increase of time (default: 0.25)")
+    parser.add_argument("--memory-threshold", type=float, default=0.25,
+                        help="allowed relative increase of peak memory (default: 0.25)")
+
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str] = None) -> int:
+    """
+    Entry point running the benchmarks given on the command line.
+
+    Returns 1 if any result regressed compared to the baseline, 0 otherwise.
+    """
+
+    args = _parse_arguments(argv)
+
+    runner = BenchmarkRunner(args.sizes, args.stages, args.repeats, args.seed)
+    results = runner.run()
+
+    if args.output is not None:
+        BenchmarkRunner.to_json_file(results, args.output)
+    BenchmarkRunner.to_csv_file(results, args.csv)
+
+    if args.baseline is None:
+        return 0
+
+    regressions = BenchmarkRunner.compare(results, BenchmarkRunner.from_json_file(args.baseline),
+                                          args.time_threshold, args.memory_threshold)
+    for regression in regressions:
+        print(f"Regression: {regression}", file=sys.stderr)
+
+    return int(bool(regressions))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,7 +3,12 @@ from heuristics.core.activities.activity_id import ActivityID as ID
 
 
 class Activity:
-    """Activity of the Critical Path Method (CPM)."""
+    """
+    Activity of the Critical Path Method (CPM).
+
+    Activities of a project stored in a ProjectGraph are read through the lightweight
+    ActivityView instead.
+    """
 
     id: ID
     """ID of the activity."""
@@ -37,16 +42,6 @@ class Activity:
     The value is in time units.
     """
 
-    # Properties related to heuristic methods
-    actual_start: int
-    """The time that the activity is actually scheduled to begin by a heuristic method."""
-
-    actual_end: int
-    """The time that the activity is actually scheduled to end by a heuristic method."""
-
-    priority: int
-    """The priority of the activity according to a heuristic method."""
-
     ## Public methods
     def __init__(self, id, duration: int, resources: int,
                  predecessors: List['Activity'] = None, successors: List['Activity'] = None,
@@ -70,10 +65,6 @@ class Activity:
 
         self.time_reserve = time_reserve
 
-        self.actual_start = None
-        self.actual_end = None
-        self.priority = None
-
     def as_dict(self) -> Dict:
         """
         Returns a selection of properties of an Activity instance as a dict.
@@ -119,8 +110,9 @@ class Activity:
         Returns the time frame of the activity, along with its id (label) and resources
         depending on the type of the heuristic method used.
 
-        The time frame of an activity is the interval when the activity is scheduled by a
-        heuristic method.
+        The time frame of an activity is the interval when the activity is scheduled by CPM.
+        The time frames of activities scheduled by other heuristic methods are stored in their
+        Schedule, see Schedule.get_time_frame.
         """
 
         if heuristic_method == "cpm":
@@ -129,23 +121,9 @@ class Activity:
                     'end': self.earliest_end,
                     'resource': self.resources}
 
-        if heuristic_method in ["shm", "phm", "phmdp"]:
-            return {'label': str(self.id),
-                    'start': self.actual_start,
-                    'end': self.actual_end,
-                    'resource': self.resources}
-
         raise ValueError(f"Cannot get time frame of heuristic method '{heuristic_method}!'" +
-                         "\n Currently, only 'cpm, shm, phm, phmdp'" +
-                         " are supported.")
-
-    def is_scheduled(self) -> bool:
-        """Returns True if the activity is scheduled."""
-        return self.actual_start is not None
-
-    def is_finished(self, time: int):
-        """Returns True if the activity is finished."""
-        return self.actual_end is not None and self.actual_end <= time
+                         "\n Currently, only 'cpm' is supported. The time frames of other" +
+                         " heuristic methods are stored in their Schedule.")
 
     ## Private methods
     @staticmethod
@@ -1,4 +1,5 @@
 from typing import Tuple
+from weakref import WeakValueDictionary
 
 
 class ActivityID:
@@ -7,19 +8,32 @@ class ActivityID:
 
     The ActivityID is made up of the node the activity starts from and the node the
     activity ends in.
+
+    ActivityID instances are immutable and interned: creating an ActivityID for the same
+    nodes twice returns the same instance while it is in use. This makes them cheap to
+    store, compare and use as dictionary keys.
     """
 
-    start_node: int
-    """The node that the activity starts from."""
-    end_node: int
-    """The node that the activity ends in."""
+    __slots__ = ("_nodes", "__weakref__")
+
+    _nodes: Tuple[int, int]
+    """The start node and the end node of the activity."""
+
+    _interned: WeakValueDictionary = WeakValueDictionary()
+    """Instances of ActivityID that are in use, keyed by their nodes."""
 
     ## Public methods
-    def __init__(self, start_node: int, end_node: int):
-        self._validate_id(start_node, end_node)
+    def __new__(cls, start_node: int, end_node: int):
+        act_id = cls._interned.get((start_node, end_node))
+        if act_id is None:
+            cls._validate_id(start_node, end_node)
 
-        self.start_node = start_node
-        self.end_node = end_node
+            act_id = super().__new__(cls)
+            nodes = (int(start_node), int(end_node))
+            object.__setattr__(act_id, "_nodes", nodes)
+            cls._interned[nodes] = act_id
+
+        return act_id
 
     @classmethod
     def from_str(cls, id: str):
@@ -28,14 +42,29 @@ class ActivityID:
 
         return cls(start_node, end_node)
 
+    @property
+    def start_node(self) -> int:
+        """The node that the activity starts from."""
+        return self._nodes[0]
+
+    @property
+    def end_node(self) -> int:
+        """The node that the activity ends in."""
+        return self._nodes[1]
+
     def as_dict(self) -> dict:
+        """Returns the ActivityID as a dict comprising: start node, end node."""
+
+        return {'start_node': self._nodes[0], 'end_node': self._nodes[1]}
+
+    def as_tuple(self) -> Tuple[int, int]:
         """Returns the ActivityID as a tuple comprising: start node, end node."""
 
-        return vars(self)
+        return self._nodes
 
     ## Private methods
     @staticmethod
-    def _parse_id( id: str) -> Tuple[int, int]:
+    def _parse_id(id: str) -> Tuple[int, int]:
         """Parses the start and end node from the id in string form '<start_node>-<end_node>'."""
 
         return [int(num) for num in id.split('-')]
@@ -63,18 +92,32 @@ class ActivityID:
         return f"ActivityID({self.as_dict()})"
 
     def __str__(self) -> str:
-        return f"{self.start_node}-{self.end_node}"
+        return f"{self._nodes[0]}-{self._nodes[1]}"
 
     def __eq__(self, other) -> bool:
+        if self is other:
+            return True
+
         if not isinstance(other, ActivityID):
             raise NotImplementedError("Determining equality of ActivityID instances failed!" +
                                       f"\n Cannot compare instances of '{type(self)}' and" +
                                       f" '{type(other)}'")
 
-        return self.as_dict() == other.as_dict()
+        return self._nodes == other._nodes
 
     def __lt__(self, other):
-        return (self.start_node, self.end_node) < (other.start_node, other.end_node)
+        return self._nodes < other._nodes
 
     def __hash__(self):
-        return hash(frozenset(self.as_dict()))
+        return hash(self._nodes)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"Cannot set '{name}' of ActivityID '{self}'!" +
+                             "\n ActivityID instances are immutable.")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"Cannot delete '{name}' of ActivityID '{self}'!" +
+                             "\n ActivityID instances are immutable.")
+
+    def __reduce__(self):
+        return (ActivityID, self._nodes)
@@ -0,0 +1,430 @@
+import gzip
+import lzma
+from array import array
+from math import ceil, sqrt
+from pathlib import Path
+from random import Random
+from typing import Iterator, List, TextIO, Tuple
+
+
+class GeneratedNetwork():
+    """Summary of a network generated by ActivitiesGenerator."""
+
+    num_activities: int
+    """Number of activities (arcs) of the network."""
+
+    num_nodes: int
+    """Number of nodes of the network, including the start and end node."""
+
+    depth: int
+    """Number of layers of nodes between the start and end node."""
+
+    width: int
+    """Max. number of nodes in a layer."""
+
+    earliest_end: int
+    """The earliest end of the project, i.e. the end of the earliest starts schedule."""
+
+    r_min: int
+    """The highest resources of a single activity, below which no schedule exists."""
+
+    r_peak: int
+    """The peak resources of the earliest starts schedule."""
+
+    r_max: int
+    """
+    Max. resources available in a single time unit intended for the network.
+
+    It is determined by the resource strength RS as: r_min + RS * (r_peak - r_min).
+    """
+
+    ## Public methods
+    def __init__(self, num_activities: int, num_nodes: int, depth: int, width: int,
+                 earliest_end: int, r_min: int, r_peak: int, r_max: int):
+        self.num_activities = num_activities
+        self.num_nodes = num_nodes
+        self.depth = depth
+        self.width = width
+        self.earliest_end = earliest_end
+        self.r_min = r_min
+        self.r_peak = r_peak
+        self.r_max = r_max
+
+    ## Magic methods
+    def __repr__(self) -> str:
+        return (f"GeneratedNetwork(activities={self.num_activities}, nodes={self.num_nodes}," +
+                f" depth={self.depth}, width={self.width}, earliest_end={self.earliest_end}," +
+                f" r_min={self.r_min}, r_peak={self.r_peak}, r_max={self.r_max})")
+
+
+class ActivitiesGenerator():
+    """
+    Seeded generator of activity-on-arrow networks in the format read by ActivitiesLoader.
+
+    The nodes are arranged into `depth` layers of at most `width` nodes between the start
+    node 1 and the end node, and numbered layer by layer, so every activity goes from a node
+    to a node with a greater ID. Every node is reached from the start node and reaches the
+    end node. Most activities connect neighbouring layers, the others skip layers with
+    exponentially decreasing probability.
+
+    The network complexity is the number of activities per node. If both `depth` and `width`
+    are given, then they determine the number of nodes and the complexity is ignored.
+    Otherwise, the number of nodes is determined by the complexity and the missing one of
+    `depth` and `width` by the other (or both as about the square root of the number of
+    nodes). The complexity is capped at what the nodes can hold, so if `depth` is omitted,
+    then networks of 4 or more activities are generated with any complexity. Layers narrower
+    than a given `width` are used if needed. A given `depth` limits the numbers of activities,
+    e.g. a network of depth 1 has an even number of activities.
+
+    The activities are written to disk as they are generated, keeping only the earliest start
+    of every node and the change of the resources at every time of the earliest starts
+    schedule, so the memory grows with the number of nodes and the length of the schedule,
+    but not with the number of activities.
+    The same seed and parameters always produce the same network.
+    """
+
+    header: str = "activity_id duration resources"
+    """The header line of the generated files."""
+
+    num_activities: int
+    """Number of activities to generate."""
+
+    depth: int
+    """Number of layers of nodes between the start and end node."""
+
+    width: int
+    """Max. number of nodes in a layer."""
+
+    complexity: float
+    """Number of activities per node (network complexity)."""
+
+    resource_strength: float
+    """
+    Resource strength RS between 0 and 1, which determines the intended r_max (see
+    GeneratedNetwork.r_max). The lower it is, the more the resources delay the activities.
+    """
+
+    durations: Tuple[int, int]
+    """The min. and max. duration of an activity."""
+
+    resources: Tuple[int, int]
+    """The min. and max. resources of an activity."""
+
+    seed: int
+    """Seed of the random number generator."""
+
+    ## Private properties
+    _layer_widths: List[int]
+    """Number of nodes in each layer, including the start and end node as layers."""
+
+    ## Public methods
+    def __init__(self, num_activities: int, depth: int = None, width: int = None,
+                 complexity: float = 1.5, resource_strength: float = 0.5,
+                 durations: Tuple[int, int] = (1, 10), resources: Tuple[int, int] = (1, 10),
+                 seed: int = 0):
+        self._validate_arguments(num_activities, depth, width, complexity, resource_strength,
+                                 durations, resources)
+
+        self.num_activities = num_activities
+        self.complexity = complexity
+        self.resource_strength = resource_strength
+        self.durations = tuple(durations)
+        self.resources = tuple(resources)
+        self.seed = seed
+
+        if depth is None or width is None:
+            num_layer_nodes = max(1, round(num_activities / complexity) - 2)
+            # The width is the max. number of nodes in a layer, so narrower layers are used
+            # if no number of nodes in layers of the width can have the activities
+            for layer_width in ((None,) if width is None else range(width, 0, -1)):
+                if self._set_feasible_layers(num_layer_nodes, depth, layer_width):
+                    break
+            else:
+                self._set_layers(num_layer_nodes, depth, width)
+        else:
+            self._set_layers(depth * width, depth, width)
+        self._validate_num_activities()
+
+    def iter_rows(self) -> Iterator[Tuple[int, int, int, int]]:
+        """
+        Yields the activities in ascending order of their start nodes as tuples comprising:
+        start node, end node, duration, resources.
+        """
+
+        rng = Random(self.seed)
+        layer_widths = self._layer_widths
+        layer_firsts = self._get_layer_first_nodes()
+        num_layers = len(layer_widths)
+
+        # The activities above the required ones are spread among the layers and then among
+        # the nodes of a layer in proportion to the number of their free targets
+        layer_free_targets = self._get_layer_free_targets()
+        num_extra_acts = self.num_activities - self._get_num_required_activities()
+        num_free_targets, num_prev_free_targets = sum(layer_free_targets), 0
+
+        for layer in range(num_layers - 1):
+            next_width, next_first = layer_widths[layer + 1], layer_firsts[layer + 1]
+
+            # Every node of the next layer gets a parent in this layer and every node of this
+            # layer gets at least one child
+            children = [[] for _ in range(layer_widths[layer])]
+            next_nodes = list(range(next_first, next_first + next_width))
+            rng.shuffle(next_nodes)
+            for idx, next_node in enumerate(next_nodes):
+                children[idx % layer_widths[layer]].append(next_node)
+            for node_children in children:
+                if not node_children:
+                    node_children.append(rng.randrange(next_first, next_first + next_width))
+
+            num_layer_extra_acts = \
+                num_extra_acts * (num_prev_free_targets + layer_free_targets[layer]) // \
+                max(1, num_free_targets) - \
+                num_extra_acts * num_prev_free_targets // max(1, num_free_targets)
+            num_prev_free_targets += layer_free_targets[layer]
+            num_node_targets = layer_firsts[-1] - next_first
+            num_prev_node_free_targets = 0
+
+            for idx, node_children in enumerate(children):
+                node = layer_firsts[layer] + idx
+                targets = set(node_children)
+
+                if layer < num_layers - 2:
+                    num_node_free_targets = num_node_targets - len(node_children)
+                    num_node_extra_acts = \
+                        num_layer_extra_acts * (num_prev_node_free_targets +
+                                                num_node_free_targets) // \
+                        max(1, layer_free_targets[layer]) - \
+                        num_layer_extra_acts * num_prev_node_free_targets // \
+                        max(1, layer_free_targets[layer])
+                    num_prev_node_free_targets += num_node_free_targets
+                    self._add_extra_targets(rng, targets, layer, layer_firsts,
+                                            num_node_extra_acts)
+
+                for target in sorted(targets):
+                    yield (node, target, rng.randint(*self.durations),
+                           rng.randint(*self.resources))
+
+    def write(self, acts_file_path: str) -> GeneratedNetwork:
+        """
+        Writes the activities to a file and returns the summary of the network.
+
+        The file is compressed using gzip or xz if its suffix is '.gz' or '.xz'.
+        """
+
+        num_nodes = sum(self._layer_widths)
+        node_earliest_starts = array("q", bytes(8 * (num_nodes + 1)))
+        resource_changes = array("q")
+        num_activities, r_min = 0, 0
+
+        with self._open(acts_file_path) as file:
+            file.write(self.header + "\n")
+            lines = []
+            for start_node, end_node, duration, resources in self.iter_rows():
+                lines.append(f"{start_node}-{end_node} {duration} {resources}\n")
+                if len(lines) >= 65536:
+                    file.writelines(lines)
+                    lines.clear()
+
+                # Nodes are numbered in topological order, so the earliest start of the start
+                # node is final once its activities are generated
+                earliest_end = node_earliest_starts[start_node] + duration
+                if earliest_end > node_earliest_starts[end_node]:
+                    node_earliest_starts[end_node] = earliest_end
+
+                if duration > 0 and resources > 0:
+                    if earliest_end >= len(resource_changes):
+                        num_new_times = max(earliest_end + 1, 2 * len(resource_changes)) - \
+                            len(resource_changes)
+                        resource_changes.extend(array("q", bytes(8 * num_new_times)))
+                    resource_changes[node_earliest_starts[start_node]] += resources
+                    resource_changes[earliest_end] -= resources
+
+                num_activities += 1
+                r_min = max(r_min, resources)
+
+            file.writelines(lines)
+
+        r_peak = max(r_min, self._get_peak_resources(resource_changes))
+        r_max = r_min + round(self.resource_strength * (r_peak - r_min))
+
+        return GeneratedNetwork(num_activities, num_nodes, self.depth,
+                                max(self._layer_widths), node_earliest_starts[num_nodes],
+                                r_min, r_peak, r_max)
+
+    ## Private methods
+    def _set_layers(self, num_layer_nodes: int, depth: int, width: int):
+        """
+        Arranges the nodes between the start and end node into layers. The missing one of
+        `depth` and `width` is determined by the other (or both as about the square root of
+        the number of nodes).
+        """
+
+        if depth is None and width is None:
+            depth = max(1, round(sqrt(num_layer_nodes)))
+        if width is None:
+            width = ceil(num_layer_nodes / depth)
+        elif depth is None:
+            depth = ceil(num_layer_nodes / width)
+
+        self.width = width
+        self._layer_widths = [1] + [min(width, num_layer_nodes - layer * width)
+                                    for layer in range(depth)] + [1]
+        self._layer_widths = [layer_width for layer_width in self._layer_widths
+                              if layer_width > 0]
+        self.depth = len(self._layer_widths) - 2
+
+    def _set_feasible_layers(self, num_layer_nodes: int, depth: int, width: int) -> bool:
+        """
+        Arranges the number of nodes closest to the given one, with which the network can
+        have the requested number of activities, into layers (see `_set_layers`).
+
+        The complexity is capped at what the nodes can hold, so a small network gets more
+        nodes and a large one fewer nodes than the complexity gives. Returns False if no
+        number of nodes fits, e.g. a network of depth 1 has an even number of activities.
+        """
+
+        # Every node but the start node is the end of an activity
+        max_num_layer_nodes = max(1, self.num_activities - 1)
+        for offset in range(max(num_layer_nodes, max_num_layer_nodes - num_layer_nodes) + 1):
+            for candidate in (num_layer_nodes + offset, num_layer_nodes - offset)[:offset + 1]:
+                if not 1 <= candidate <= max_num_layer_nodes:
+                    continue
+
+                self._set_layers(candidate, depth, width)
+                if self._get_num_required_activities() <= self.num_activities <= \
+                        self._get_max_num_activities():
+                    return True
+
+        return False
+
+    def _get_layer_first_nodes(self) -> List[int]:
+        """Returns the first node of each layer."""
+
+        layer_firsts, node = [], 1
+        for layer_width in self._layer_widths:
+            layer_firsts.append(node)
+            node += layer_width
+
+        return layer_firsts
+
+    def _get_num_required_activities(self) -> int:
+        """
+        Returns the number of activities that connect every node to the previous and next
+        layer.
+        """
+
+        return sum(max(width, next_width) for width, next_width
+                   in zip(self._layer_widths, self._layer_widths[1:]))
+
+    def _get_max_num_activities(self) -> int:
+        """Returns the max. number of activities that the layers can hold."""
+        return self._get_num_required_activities() + sum(self._get_layer_free_targets())
+
+    def _get_layer_free_targets(self) -> List[int]:
+        """
+        Returns the number of activities that the nodes of each layer can start above the
+        required ones. The end node is never the end of these activities.
+        """
+
+        layer_widths = self._layer_widths
+        layer_free_targets, num_later_nodes = [0] * len(layer_widths), 0
+        for layer in range(len(layer_widths) - 3, -1, -1):
+            num_later_nodes += layer_widths[layer + 1]
+            layer_free_targets[layer] = layer_widths[layer] * num_later_nodes - \
+                max(layer_widths[layer], layer_widths[layer + 1])
+
+        return layer_free_targets
+
+    def _add_extra_targets(self, rng: Random, targets: set, layer: int,
+                           layer_firsts: List[int], num_extra_acts: int):
+        """
+        Adds `num_extra_acts` new targets of a node in the layer.
+
+        The layer of a target is the next layer with probability 1/2, the one after it with
+        probability 1/4, etc. The end node is never an extra target.
+        """
+
+        layer_widths = self._layer_widths
+        last_layer = len(layer_widths) - 2
+        num_targets = len(targets) + num_extra_acts
+
+        for _ in range(4 * num_extra_acts):
+            if len(targets) == num_targets:
+                return
+
+            target_layer = layer + 1
+            while target_layer < last_layer and rng.random() < 0.5:
+                target_layer += 1
+            targets.add(layer_firsts[target_layer] + rng.randrange(layer_widths[target_layer]))
+
+        # The random choices failed in a dense network, so the free targets are taken in order
+        target = layer_firsts[layer + 1]
+        while len(targets) < num_targets:
+            targets.add(target)
+            target += 1
+
+    def _validate_num_activities(self):
+        """Validates that the network can have the requested number of activities."""
+
+        min_num_acts = self._get_num_required_activities()
+        max_num_acts = self._get_max_num_activities()
+        if not min_num_acts <= self.num_activities <= max_num_acts:
+            raise ValueError("Creating ActivitiesGenerator failed!" +
+                             f"\n A network with depth '{self.depth}' and width" +
+                             f" '{self.width}' can have between '{min_num_acts}' and" +
+                             f" '{max_num_acts}' activities, not '{self.num_activities}'.")
+
+    @staticmethod
+    def _validate_arguments(num_activities: int, depth: int, width: int, complexity: float,
+                            resource_strength: float, durations: Tuple[int, int],
+                            resources: Tuple[int, int]):
+        """Validates that the arguments of the generator are correct."""
+
+        main_failure_msg = "Creating ActivitiesGenerator failed!"
+        if num_activities < 1 or (depth is not None and depth < 1) or \
+           (width is not None and width < 1) or complexity <= 0:
+            raise ValueError(main_failure_msg + "\n Parameters 'num_activities', 'depth'," +
+                             " 'width' and 'complexity' must be positive!")
+
+        if not 0 <= resource_strength <= 1:
+            raise ValueError(main_failure_msg +
+                             "\n Parameter 'resource_strength' must be between 0 and 1!")
+
+        for name, (min_value, max_value) in (("durations", durations),
+                                             ("resources", resources)):
+            if not 0 <= min_value <= max_value:
+                raise ValueError(main_failure_msg + f"\n Parameter '{name}' must be a range" +
+                                 " of nonnegative integers!")
+
+    @staticmethod
+    def _get_peak_resources(resource_changes: array) -> int:
+        """
+        Returns the peak resources of a schedule given the change of its resources at every
+        time.
+
+        Activities ending at a time release their resources before others start at it.
+        """
+
+        peak_resources, resources = 0, 0
+        for resource_change in resource_changes:
+            resources += resource_change
+            peak_resources = max(peak_resources, resources)
+
+        return peak_resources
+
+    @staticmethod
+    def _open(acts_file_path: str) -> TextIO:
+        """Opens the file for writing text, compressing it according to its suffix."""
+
+        suffix = Path(acts_file_path).suffix
+        if suffix == ".gz":
+            return gzip.open(acts_file_path, "wt", encoding="utf-8")
+        if suffix == ".xz":
+            return lzma.open(acts_file_path, "wt", encoding="utf-8")
+
+        return open(acts_file_path, "w", encoding="utf-8")
+
+    ## Magic methods
+    def __repr__(self) -> str:
+        return (f"ActivitiesGenerator(num_activities={self.num_activities}," +
+                f" depth={self.depth}, width={self.width}, seed={self.seed})")
@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Dict
 from heuristics.core.activities.activity import Activity
 
 
@@ -8,7 +8,14 @@ class ActivitiesInitializer():
     ## Public methods
     @staticmethod
     def init_activities(activities: List[Activity]):
-        """Initializes the predecessors and successors of provided activities."""
+        """
+        Initializes the predecessors and successors of provided activities.
+
+        The activities are wired using indexes of their start and end nodes, which are built
+        once. Therefore, the initialization takes linear time in the number of activities.
+        The predecessors and successors of an activity keep the order in which they appear
+        in `activities`.
+        """
 
         if (not isinstance(activities, List) or
             (len(activities) > 0 and
@@ -16,6 +23,26 @@ class ActivitiesInitializer():
             raise TypeError("Initializing Activities from 'activities' failed!" +
                             "\n Input variable must a 'List' with 'Activity' instances.")
 
+        acts_by_start_node = ActivitiesInitializer._get_activities_by_node(activities, "start")
+        acts_by_end_node = ActivitiesInitializer._get_activities_by_node(activities, "end")
+
+        for act in activities:
+            act.predecessors = acts_by_end_node.get(act.id.start_node, []).copy()
+            act.successors = acts_by_start_node.get(act.id.end_node, []).copy()
+
+    ## Private methods
+    @staticmethod
+    def _get_activities_by_node(activities: List[Activity],
+                                node_type: str) -> Dict[int, List[Activity]]:
+        """
+        Returns an index of the activities grouped by their start or end node.
+
+        The activities in each group keep the order in which they appear in `activities`.
+        """
+
+        acts_by_node = {}
         for act in activities:
-            act.determine_predecessors(activities)
-            act.determine_successors(activities)
+            node = act.id.start_node if node_type == "start" else act.id.end_node
+            acts_by_node.setdefault(node, []).append(act)
+
+        return acts_by_node
@@ -1,71 +1,205 @@
-from csv import reader as csv_reader
-from re import fullmatch
-from pathlib import Path
-from typing import List
+import gzip
+import io
+import lzma
+from re import compile as re_compile
+from itertools import islice
+from typing import BinaryIO, Iterator, List, TextIO, Tuple
 from heuristics.core.activities.activity import Activity
+from heuristics.core.activities.activity_id import ActivityID as ID
 from heuristics.exceptions.data_not_found import DataNotFoundError
 
 
 class ActivitiesLoader():
-    """Loader of activities from a file."""
+    """
+    Loader of activities from a file.
+
+    The file may be plain text, or compressed using gzip or xz. The compression is
+    detected from the first bytes of the file.
+    """
+
+    chunk_size: int = 65536
+    """Default number of lines parsed at once when the activities are streamed."""
+
+    _activity_pattern_str = "[1-9][0-9]*-[1-9][0-9]*"
+    _integer_pattern_str = "[0-9]+"
+
+    _line_pattern = re_compile("([1-9][0-9]*)-([1-9][0-9]*) ([0-9]+) ([0-9]+)")
+    """Pattern of a valid activity line, used as the fast path when parsing lines."""
+    _activity_pattern = re_compile(_activity_pattern_str)
+    _integer_pattern = re_compile(_integer_pattern_str)
+
+    _gzip_magic = b"\x1f\x8b"
+    _xz_magic = b"\xfd7zXZ\x00"
 
     ## Public methods
     @staticmethod
-    def get_activities(acts_file_path: str) -> List[Activity]:
-        """Returns the activities parsed from the file."""
+    def get_activities(acts_file_path: str, digest=None) -> List[Activity]:
+        """
+        Returns the activities parsed from the file.
+
+        If a `digest` (see hashlib) is given, then it is updated with the bytes of the file
+        as they are read (see `iter_activity_rows`).
+        """
 
-        acts_file_path = acts_file_path if isinstance(acts_file_path, Path) else \
-                                           Path(acts_file_path)
         activities = []
-        with open(acts_file_path, encoding="utf-8") as file:
-            lines = csv_reader(file, delimiter=' ')
-            next(lines) # Skip CSV headers
-            for line in lines:
-                act = ActivitiesLoader._get_activity_from_line(line)
-                ActivitiesLoader._check_if_duplicate_activity(act, activities)
-                activities.append(act)
+        for acts_chunk in ActivitiesLoader.iter_activities(acts_file_path, digest=digest):
+            activities.extend(acts_chunk)
 
         return activities
 
+    @staticmethod
+    def iter_activities(acts_file_path: str, chunk_size: int = None,
+                        digest=None) -> Iterator[List[Activity]]:
+        """
+        Yields the activities parsed from the file in chunks of at most `chunk_size`
+        activities.
+
+        If a `digest` (see hashlib) is given, then it is updated with the bytes of the file
+        as they are read (see `iter_activity_rows`).
+        """
+
+        for rows in ActivitiesLoader.iter_activity_rows(acts_file_path, chunk_size, digest):
+            yield [Activity(ID(start_node, end_node), duration, resources)
+                   for start_node, end_node, duration, resources in rows]
+
+    @staticmethod
+    def iter_activity_rows(acts_file_path: str, chunk_size: int = None,
+                           digest=None) -> Iterator[List[Tuple[int, int, int, int]]]:
+        """
+        Yields the activity lines parsed from the file in chunks of at most `chunk_size` rows.
+
+        Each row is a tuple comprising: start node, end node, duration, resources.
+        No Activity instances are created, which makes this the fastest way to read the file.
+        Duplicate activities are detected across all chunks.
+
+        If a `digest` (see hashlib) is given, then it is updated with the raw (possibly
+        compressed) bytes of the file as they are read, so the file does not have to be read
+        again to hash it. The digest covers the whole file once all rows are yielded.
+        """
+
+        chunk_size = chunk_size or ActivitiesLoader.chunk_size
+        if chunk_size < 1:
+            raise ValueError(f"Invalid chunk size '{chunk_size}'!" +
+                             "\n The chunk size must be greater than zero.")
+
+        loaded_ids = set()
+        with open(acts_file_path, "rb") as raw_file, \
+             ActivitiesLoader._open(raw_file, digest) as file:
+            next(file, None) # Skip CSV headers
+            line_num = 1
+            while True:
+                lines = list(islice(file, chunk_size))
+                if not lines:
+                    break
+
+                rows = []
+                for line in lines:
+                    line_num += 1
+                    row = ActivitiesLoader._get_row_from_line(line.rstrip("\r\n"), line_num)
+                    ActivitiesLoader._check_if_duplicate_row(row, loaded_ids, line_num)
+                    rows.append(row)
+
+                yield rows
+
     ## Private methods
     @staticmethod
-    def _get_activity_from_line(line: List[str]) -> Activity:
-        """Formats an activity line into a dict."""
+    def _open(raw_file: BinaryIO, digest=None) -> TextIO:
+        """
+        Opens the binary file as text, decompressing it if it is compressed using gzip or xz.
+        If a `digest` is given, then it is updated with the bytes read from the binary file.
+        """
+
+        magic = raw_file.read(len(ActivitiesLoader._xz_magic))
+        raw_file.seek(0)
+        if digest is not None:
+            raw_file = io.BufferedReader(_DigestReader(raw_file, digest))
+
+        if magic.startswith(ActivitiesLoader._gzip_magic):
+            return gzip.open(raw_file, "rt", encoding="utf-8")
+        if magic.startswith(ActivitiesLoader._xz_magic):
+            return lzma.open(raw_file, "rt", encoding="utf-8")
+
+        return io.TextIOWrapper(raw_file, encoding="utf-8")
+
+    @staticmethod
+    def _get_row_from_line(line: str, line_num: int) -> Tuple[int, int, int, int]:
+        """
+        Parses an activity line into a tuple comprising: start node, end node, duration,
+        resources.
+        """
 
-        ActivitiesLoader._validate_activity_line(line)
+        match = ActivitiesLoader._line_pattern.fullmatch(line)
+        if match is None:
+            # The line is invalid, find out why
+            ActivitiesLoader._validate_activity_line(line.split(" "), line_num)
+            raise ValueError(f"Error parsing data line {line_num} '{line}'!" +
+                             "\n The values must be separated by single spaces.")
 
-        activity_id = str(line[0])
-        duration = int(line[1])
-        resources = int(line[2])
+        start_node, end_node, duration, resources = (int(val) for val in match.groups())
+        if start_node > end_node:
+            raise ValueError(f"Error parsing data line {line_num} '{line}'!" +
+                             "\n The ActivityID of the start node must be smaller than the" +
+                             " ActivityID of the end node.")
 
-        return Activity(activity_id, duration, resources)
+        return start_node, end_node, duration, resources
 
     @staticmethod
-    def _check_if_duplicate_activity(act: Activity, activities: List[Activity]):
-        """Checks if the activity is already present in activities."""
-        if act.id in [a.id for a in activities]:
+    def _check_if_duplicate_row(row: Tuple[int, int, int, int], loaded_ids: set,
+                                line_num: int):
+        """
+        Checks if the activity in the row was already loaded.
+
+        If it was not, then its ID is added to the `loaded_ids`.
+        """
+
+        act_id = row[:2]
+        if act_id in loaded_ids:
             raise ValueError("Failed loading data from file!" +
-                             f"\n Activity with ID '{act.id}' was already loaded.")
+                             f"\n Activity with ID '{act_id[0]}-{act_id[1]}' on line" +
+                             f" {line_num} was already loaded.")
+        loaded_ids.add(act_id)
 
     @staticmethod
-    def _validate_activity_line(line: List[str]) -> None:
+    def _validate_activity_line(line: List[str], line_num: int) -> None:
         """Verifies that the activity line contains the required data."""
 
         if line.count(None) > 0 or line.count("") > 0 or len(line) != 3:
-            raise DataNotFoundError(f"Error parsing data line '{' '.join(line)}'!" +
+            raise DataNotFoundError(f"Error parsing data line {line_num} '{' '.join(line)}'!" +
                                     "\n The line must contain 3 values that are not NoneType.")
 
         # Check activity ID
-        activity_pattern = "[1-9][0-9]*-[1-9][0-9]*"
-        if not fullmatch(activity_pattern, line[0]):
+        activity_pattern = ActivitiesLoader._activity_pattern_str
+        if not ActivitiesLoader._activity_pattern.fullmatch(line[0]):
             raise ValueError(f"Error parsing data Activity ID '{line[0]}' from" +
-                             f"line '{' '.join(line)}'" +
+                             f" line {line_num} '{' '.join(line)}'" +
                              f"\n Activity ID should match the pattern '{activity_pattern}'")
 
         # Check duration/resources
-        integer_pattern = "[0-9]+"
-        if not fullmatch(integer_pattern, line[1]) or \
-           not fullmatch(integer_pattern, line[2]):
-            raise ValueError(f"Error parsing data line '{' '.join(line)}'" +
+        integer_pattern = ActivitiesLoader._integer_pattern_str
+        if not ActivitiesLoader._integer_pattern.fullmatch(line[1]) or \
+           not ActivitiesLoader._integer_pattern.fullmatch(line[2]):
+            raise ValueError(f"Error parsing data line {line_num} '{' '.join(line)}'" +
                              "\n Activity duration/resources should match" +
                              f" the pattern '{integer_pattern}'")
+
+
+class _DigestReader(io.RawIOBase):
+    """Reader of a binary file that updates a digest with the bytes it reads."""
+
+    def __init__(self, file: BinaryIO, digest):
+        super().__init__()
+        self._file = file
+        self._digest = digest
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        num_bytes = self._file.readinto(buffer)
+        self._digest.update(memoryview(buffer)[:num_bytes])
+
+        return num_bytes
+
+    def close(self):
+        self._file.close()
+        super().close()
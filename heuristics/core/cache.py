@@ -0,0 +1,179 @@
+from collections import OrderedDict
+from hashlib import blake2b
+import os
+import sys
+from typing import Tuple
+from heuristics.core.activities.loader import ActivitiesLoader
+from heuristics.core.project import Project
+
+
+class ProjectCache():
+    """
+    Least recently used (LRU) cache of projects loaded from data files.
+
+    Each data file is parsed and its activities are wired only once. The cache then hands out
+    copies of the project (see Project.copy), so every heuristic method gets its own
+    activities to schedule.
+
+    A cached project is keyed by the resolved path of its file and is valid as long as
+    the modification time and size of the file do not change. If they do, the content hash
+    of the file decides whether the file has to be parsed again. The hash is computed from
+    the bytes read while the file is parsed, so a missed file is read only once.
+    The parameters of the project (r_max, start, ...) are applied to the copies, so projects
+    with different parameters share a single parsed file.
+
+    The least recently used projects are evicted when there are more than `max_entries`
+    projects or when their estimated size exceeds `max_bytes`.
+    """
+
+    max_entries: int
+    """Max. number of cached projects."""
+    max_bytes: int
+    """Max. estimated size of all cached projects in bytes."""
+
+    hits: int
+    """Number of projects handed out without parsing the file."""
+    misses: int
+    """Number of projects handed out after parsing the file."""
+
+    ## Private properties
+    _entries: 'OrderedDict[str, _CachedProject]'
+    """Cached projects keyed by the resolved paths of their files, least recent first."""
+
+    ## Public methods
+    def __init__(self, max_entries: int = 16, max_bytes: int = 512 * 1024 * 1024):
+        if max_entries < 1 or max_bytes < 0:
+            raise ValueError("Creating ProjectCache failed!" +
+                             "\n Parameter 'max_entries' must be positive and 'max_bytes'" +
+                             " nonnegative!")
+
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+        self._entries = OrderedDict()
+
+    def get_project(self, data_file_path: str, r_max: int, start: int = 0, end: int = None,
+                    planned_end: int = None) -> Project:
+        """
+        Returns a new copy of the project loaded from the data file with the given
+        properties.
+
+        The file is parsed only if it is not cached or it has changed since it was cached.
+        """
+
+        key = os.path.realpath(data_file_path)
+        stamp = self._get_stamp(key)
+
+        entry = self._entries.get(key)
+        if entry is not None and (entry.stamp == stamp or
+                                  entry.digest == self._get_digest(key)):
+            entry.stamp = stamp
+            self._entries.move_to_end(key)
+            self.hits += 1
+        else:
+            self._entries.pop(key, None)
+            # The file is hashed while it is parsed, so it is read only once
+            digest = blake2b()
+            activities = ActivitiesLoader.get_activities(key, digest)
+            entry = _CachedProject(Project(activities, r_max), stamp, digest.digest())
+            self.misses += 1
+            self._add_entry(key, entry)
+
+        project = entry.project.copy()
+        project.r_max = r_max
+        project.start = start
+        project.earliest_end = end
+        project.planned_end = planned_end
+
+        return project
+
+    def clear(self):
+        """Removes all cached projects."""
+
+        self._entries.clear()
+
+    @property
+    def nbytes(self) -> int:
+        """The estimated size of all cached projects in bytes."""
+        return sum(entry.nbytes for entry in self._entries.values())
+
+    ## Private methods
+    def _add_entry(self, key: str, entry: '_CachedProject'):
+        """
+        Adds the project to the cache and evicts the least recently used projects over
+        the limits.
+
+        A project larger than `max_bytes` on its own is not cached.
+        """
+
+        if entry.nbytes > self.max_bytes:
+            return
+
+        self._entries[key] = entry
+
+        nbytes = self.nbytes
+        while len(self._entries) > self.max_entries or nbytes > self.max_bytes:
+            _, evicted_entry = self._entries.popitem(last=False)
+            nbytes -= evicted_entry.nbytes
+
+    @staticmethod
+    def _get_stamp(path: str) -> Tuple[int, int]:
+        """Returns the modification time in nanoseconds and the size of the file."""
+
+        stat = os.stat(path)
+
+        return stat.st_mtime_ns, stat.st_size
+
+    @staticmethod
+    def _get_digest(path: str) -> bytes:
+        """Returns the hash of the content of the file."""
+
+        digest = blake2b()
+        with open(path, "rb") as file:
+            for chunk in iter(lambda: file.read(1024 * 1024), b""):
+                digest.update(chunk)
+
+        return digest.digest()
+
+    ## Magic methods
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, data_file_path: str) -> bool:
+        return os.path.realpath(data_file_path) in self._entries
+
+    def __repr__(self) -> str:
+        return (f"ProjectCache(projects={len(self)}, nbytes={self.nbytes}," +
+                f" hits={self.hits}, misses={self.misses})")
+
+
+class _CachedProject():
+    """Project cached by ProjectCache along with the state of its file."""
+
+    project: Project
+    """The cached project. It is never handed out, only its copies are."""
+    stamp: Tuple[int, int]
+    """The modification time and size of the file when it was last checked."""
+    digest: bytes
+    """The hash of the content of the file."""
+    nbytes: int
+    """The estimated size of the project in bytes."""
+
+    def __init__(self, project: Project, stamp: Tuple[int, int], digest: bytes):
+        self.project = project
+        self.stamp = stamp
+        self.digest = digest
+        self.nbytes = self._estimate_nbytes(project)
+
+    @staticmethod
+    def _estimate_nbytes(project: Project) -> int:
+        """Returns the estimated size of the project's activities in bytes."""
+
+        nbytes = sys.getsizeof(project.activities)
+        for act in project.activities:
+            nbytes += (sys.getsizeof(act) + sys.getsizeof(act.__dict__) +
+                       sys.getsizeof(act.predecessors) + sys.getsizeof(act.successors))
+
+        return nbytes
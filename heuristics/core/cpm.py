@@ -1,6 +1,14 @@
-from typing import List
+from heapq import heapify, heappush, heappop
+from typing import List, Set, Tuple, TYPE_CHECKING, Union
 from heuristics.core.activities.activity import Activity
+from heuristics.core.activities.activity_id import ActivityID as ID
 from heuristics.core.project import Project
+from heuristics.core.stats import SolveStats
+
+if TYPE_CHECKING:
+    from heuristics.core.cache import ProjectCache
+    from heuristics.core.graph import ProjectGraph
+    from heuristics.core.graph_file import ProjectGraphFile
 
 
 class CriticalPathMethod():
@@ -9,12 +17,51 @@ class CriticalPathMethod():
 
     To solve a problem a new instance of CriticalPathMethod must be created.
     This is because the project is initialized in the constructor.
+
+    The problem can be solved using one of the following engines:
+    - "python" - walks the activities one by one (default).
+    - "vectorized" - walks topological levels of activities using NumPy, see
+      VectorizedCriticalPathMethod. The results are copied back to the activities.
+    Both engines produce the same results.
+
+    The "vectorized" engine keeps the graph it creates from the activities as the project's
+    graph, so the activities are converted only by the first solve. A project backed by
+    a graph (see `from_graph` and Project.from_binary) is solved without creating its
+    activities. Levels narrower than VectorizedCriticalPathMethod.min_vectorized_level_width
+    are walked one activity at a time, so the engine pays off on wide networks rather than
+    on deep and narrow ones.
+
+    If a ProjectCache is given, then the project is a copy of the cached one and the file is
+    parsed only if it is not cached yet.
+
+    Once solved, the duration of an activity can be changed using `update_duration`, which
+    recomputes only the activities affected by the change.
     """
 
+    engines = ("python", "vectorized")
+    """Engines that can be used to solve the problem."""
+
     ## Public properties
     project: Project
     """The project whose timeline CPM solves."""
 
+    engine: str
+    """The engine used to solve the problem."""
+
+    graph: 'ProjectGraph'
+    """
+    Array-backed graph of the project used by the "vectorized" engine.
+
+    It is None until the problem is solved by the "vectorized" engine, which then keeps it
+    as the project's graph.
+    """
+
+    solved: bool
+    """True if the problem has been solved."""
+
+    stats: SolveStats
+    """The stats collected by the last solve, None if they were not collected."""
+
     ## Private properties
     _final_activities: List[Activity]
     """
@@ -22,43 +69,256 @@ class CriticalPathMethod():
     These activities have no successors.
 
     This variable is used to avoid recomputing the list of final activities during the run
-    of the algorithm.
+    of the algorithm. It is None until the final activities are first needed, so that
+    the "vectorized" engine does not create the activities of a project backed by a graph.
     """
 
+    _proj_latest_end: int
+    """The latest end of the final activities determined in the backward walk."""
+
     ## Public methods
     def __init__(self, acts_file_path, r_max: int,
-                 proj_start: int = 0, planned_proj_end: int = None):
+                 proj_start: int = 0, planned_proj_end: int = None, engine: str = "python",
+                 project_cache: 'ProjectCache' = None):
+        if project_cache is not None:
+            project = project_cache.get_project(acts_file_path, r_max,
+                                                proj_start, None, planned_proj_end)
+        else:
+            project = Project.from_file_and_args(acts_file_path, r_max,
+                                                 proj_start, None, planned_proj_end)
+        self._init_from_project(project, engine)
+
+    @classmethod
+    def from_project(cls, project: Project, engine: str = None) -> 'CriticalPathMethod':
+        """
+        Overloaded constructor for solving an already loaded Project, e.g. one created using
+        Project.from_binary.
+
+        If the project has a graph, then the "vectorized" engine solves it directly without
+        creating its activities. If no engine is given, then it is used for projects backed
+        by a graph and the "python" engine for the others.
+        """
+
+        cpm = cls.__new__(cls)
+        cpm._init_from_project(project, engine)
+
+        return cpm
 
-        self.project = Project.from_file_and_args(acts_file_path, r_max,
-                                                  proj_start, None, planned_proj_end)
+    @classmethod
+    def from_graph(cls, graph: Union['ProjectGraph', 'ProjectGraphFile'], r_max: int,
+                   proj_start: int = 0, planned_proj_end: int = None) -> 'CriticalPathMethod':
+        """
+        Overloaded constructor for solving a ProjectGraph, or the one memory-mapped from
+        a ProjectGraphFile, by the "vectorized" engine without creating any activities.
+        """
 
-        self._final_activities = self._get_final_activities()
+        # NumPy is imported only when a graph is solved
+        # pylint: disable=import-outside-toplevel
+        from heuristics.core.graph_file import ProjectGraphFile
 
-    def solve(self):
-        """Solves the timing problem using the CPM algorithm."""
+        if isinstance(graph, ProjectGraphFile):
+            graph = graph.load_graph("c")
 
-        # Determine the earliest starts and ends of activities
-        self._forward_walk()
-        # Determine the latest starts and ends of activities
-        self._backward_walk()
+        return cls.from_project(Project(None, r_max, proj_start, None, planned_proj_end, graph),
+                                "vectorized")
+
+    @classmethod
+    def from_solved_graph(cls, graph: 'ProjectGraph', r_max: int, proj_start: int,
+                          proj_earliest_end: int, planned_proj_end: int) -> 'CriticalPathMethod':
+        """
+        Overloaded constructor for a ProjectGraph that already holds the results of CPM,
+        e.g. one sent to a worker process (see `get_solved_graph`).
+
+        The instance is solved, so neither the activities are created nor is CPM solved again.
+        """
+
+        cpm = cls.from_project(Project(None, r_max, proj_start, proj_earliest_end,
+                                       planned_proj_end, graph), "vectorized")
+        cpm.solved = True
+
+        return cpm
+
+    def get_solved_graph(self) -> Tuple['ProjectGraph', int, int, int, int]:
+        """
+        Returns the solved project as the arguments of `from_solved_graph`: its graph with
+        the results of CPM, r_max, start, earliest end and planned end.
+
+        The arrays of the graph are cheap to pickle, so the project is sent to worker
+        processes this way. The graph of the "vectorized" engine already holds the results,
+        otherwise it is created from the activities.
+        """
+
+        if not self.solved:
+            raise RuntimeError("Getting the solved graph of the project failed!" +
+                               "\n The problem must be solved first.")
+
+        # NumPy is imported only when the graph is created
+        # pylint: disable=import-outside-toplevel
+        from heuristics.core.graph import ProjectGraph
+
+        project = self.project
+        graph = self.graph if self.graph is not None else ProjectGraph.from_project(project)
+
+        return graph, project.r_max, project.start, project.earliest_end, project.planned_end
+
+    def solve(self, stats: SolveStats = None):
+        """
+        Solves the timing problem using the CPM algorithm.
+
+        If stats are given, then the phases of the algorithm are measured in them
+        (see SolveStats).
+        """
+
+        self.stats = stats
+        if self.engine == "vectorized":
+            with SolveStats.measure(stats, "cpm_vectorized"):
+                self._solve_vectorized()
+        else:
+            # Determine the earliest starts and ends of activities
+            with SolveStats.measure(stats, "cpm_forward_walk"):
+                self._forward_walk()
+            # Determine the latest starts and ends of activities
+            with SolveStats.measure(stats, "cpm_backward_walk"):
+                self._backward_walk()
+
+            # Determine how many time units each activity can be delayed before
+            # the end of the project must be postponed
+            with SolveStats.measure(stats, "cpm_time_reserves"):
+                self._calculate_time_reserves()
+            # Determine when the project starts and ends
+            self._calculate_project_start_end()
+
+        if stats is not None:
+            stats.count("cpm_activities", self.project.num_activities)
+        self.solved = True
+
+    def update_duration(self, activity_id, new_duration: int) -> List[Activity]:
+        """
+        Changes the duration of an activity and updates the solution incrementally.
 
-        # Determine how many time units each activity can be delayed before
-        # the end of the project must be postponed
-        self._calculate_time_reserves()
-        # Determine when the project starts and ends
-        self._calculate_project_start_end()
+        The earliest starts and ends are propagated forward and the latest starts and ends
+        are propagated backward only through the activities affected by the change.
+        The propagation stops at activities whose values do not change.
+        The time reserves of the affected activities, the project's end and the total
+        resources required by the project are updated as well.
+
+        Returns the activities whose values changed sorted by ID.
+        """
+
+        if not self.solved:
+            raise RuntimeError(f"Updating duration of activity '{activity_id}' failed!" +
+                               "\n The problem must be solved before it can be updated.")
+
+        act = self._get_activity_by_id(activity_id)
+        if new_duration is None or new_duration < 0:
+            raise ValueError(f"Updating duration of activity '{act.id}' failed!" +
+                             "\n The duration must be nonnegative.")
+
+        self.project.total_resources_required += (new_duration - act.duration) * act.resources
+        act.duration = new_duration
+        act.total_resources = act.resources * new_duration
+
+        changed_positions = set()
+        self._propagate_earliest_times(self.project.positions[act.id], changed_positions)
+
+        # The planned end was checked by the full solve, so it is not warned about again
+        old_proj_latest_end = self._proj_latest_end
+        proj_earliest_end = max(final_act.earliest_end
+                                for final_act in self._get_final_activities())
+        self._proj_latest_end = proj_earliest_end if self.project.planned_end is None else \
+            max(proj_earliest_end, self.project.planned_end)
+        if self._proj_latest_end != old_proj_latest_end:
+            # The latest ends of all final activities are different
+            start_positions = [self.project.positions[final_act.id]
+                               for final_act in self._get_final_activities()]
+            start_positions.append(self.project.positions[act.id])
+        else:
+            start_positions = [self.project.positions[act.id]]
+        self._propagate_latest_times(start_positions, changed_positions)
+
+        changed_activities = [self.project.activities[pos] for pos in sorted(changed_positions)]
+        for changed_act in changed_activities:
+            self._calculate_time_reserve(changed_act)
+        self.project.earliest_end = self._proj_latest_end
+
+        if self.project.graph is not None:
+            self._update_graph(act, changed_positions)
+
+        return changed_activities
 
     ## Private methods
+    def _init_from_project(self, project: Project, engine: str):
+        """Initializes the properties of CPM for the given project."""
+
+        if engine is None:
+            engine = "python" if project.graph is None else "vectorized"
+
+        if engine not in self.engines:
+            raise ValueError(f"Unsupported CPM engine '{engine}'!" +
+                             f"\n Currently, only '{', '.join(self.engines)}' are supported.")
+
+        self.project = project
+        self.engine = engine
+        self.graph = None
+        self.solved = False
+        self.stats = None
+
+        self._final_activities = None
+        self._proj_latest_end = None
+
+    def _solve_vectorized(self):
+        """
+        Solves the timing problem using the CPM algorithm over topological levels of
+        the project's graph and copies the results to the activities.
+
+        The activities of a project backed by a graph are not created if they do not exist
+        yet, as they are created with the results of the graph.
+        """
+
+        # NumPy is imported only when the vectorized engine is used
+        # pylint: disable=import-outside-toplevel
+        import numpy as np
+        from heuristics.core.graph import ProjectGraph
+        from heuristics.core.cpm_vectorized import VectorizedCriticalPathMethod
+
+        # The graph of a project loaded from a binary file or solved before is reused
+        if self.project.graph is None:
+            self.project.graph = ProjectGraph.from_project(self.project)
+        self.graph = self.project.graph
+        self.project.start, self.project.earliest_end = VectorizedCriticalPathMethod(
+            self.graph).solve(self.project.start, self.project.planned_end)
+
+        if not self.project.has_activities:
+            return
+
+        # The activities of the project and of the graph are both sorted by ID, so only
+        # the results are copied, the positions are created by Project when needed
+        activities = self.project.activities
+        results = zip(activities,
+                      *(getattr(self.graph, name).tolist() for name in self.graph.cpm_arrays))
+        for act, e_start, e_end, l_start, l_end, reserve in results:
+            act.earliest_start, act.earliest_end = e_start, e_end
+            act.latest_start, act.latest_end = l_start, l_end
+            act.time_reserve = reserve
+        is_final = self.graph.succ_ptr[1:] == self.graph.succ_ptr[:-1]
+        self._final_activities = [activities[pos] for pos in np.flatnonzero(is_final).tolist()]
+        self._proj_latest_end = self.project.earliest_end
+
     def _forward_walk(self):
         """
         Performs the forward walk of the CPM algorithm.
 
-        This involves computing the earliest starts and ends of activities.
+        This involves computing the earliest starts and ends of activities. The positions
+        of activities are indexed by the same pass, so that updating a duration does not pay
+        for it.
         """
 
-        for act in self.project.activities:
+        positions = {}
+        for pos, act in enumerate(self.project.activities):
             act.earliest_start = self._get_earliest_start(act)
             act.earliest_end = act.earliest_start + act.duration
+            positions[act.id] = pos
+        self.project.positions = positions
 
     def _backward_walk(self):
         """
@@ -67,6 +327,8 @@ class CriticalPathMethod():
         This involves computing the latest starts and ends of activities.
         """
 
+        self._proj_latest_end = self._get_project_latest_end()
+
         activities_rev = reversed(self.project.activities.copy())
         for act in activities_rev:
             act.latest_end = self._get_latest_end(act)
@@ -81,15 +343,21 @@ class CriticalPathMethod():
         """
 
         for act in self.project.activities:
-            if (act.latest_start - act.earliest_start) == \
-               (act.latest_end - act.earliest_end):
-                act.time_reserve = act.latest_start - act.earliest_start
-            else:
-                raise RuntimeError("CPM failed!\n The time reserves of Activity with ID"
-                                   f"'{act.id}' do not match!" +
-                                   "\n The difference between earliest_start-latest_start and" +
-                                   " earliest_end-latest_end should be the same"
-                                   "\n The results are incorrect.")
+            self._calculate_time_reserve(act)
+
+    @staticmethod
+    def _calculate_time_reserve(act: Activity):
+        """Calculates the time reserve of an activity."""
+
+        if (act.latest_start - act.earliest_start) == \
+           (act.latest_end - act.earliest_end):
+            act.time_reserve = act.latest_start - act.earliest_start
+        else:
+            raise RuntimeError("CPM failed!\n The time reserves of Activity with ID"
+                               f"'{act.id}' do not match!" +
+                               "\n The difference between earliest_start-latest_start and" +
+                               " earliest_end-latest_end should be the same"
+                               "\n The results are incorrect.")
 
     def _get_earliest_start(self, act: Activity) -> int:
         """
@@ -115,33 +383,135 @@ class CriticalPathMethod():
 
         The latest end of an activity is equal to the earliest (min) latest start time from
         of its successors.
-        If the activity has no successors, then its latest end is set to its earliest end, or
-        it is set to the the project's planned end if it is specified and valid.
+        If the activity has no successors, then its latest end is set to the latest end of
+        the final activities, see `_get_project_latest_end`.
         """
 
         if self._is_final(act):
-            proj_earliest_end = max(act.earliest_end for act in self._final_activities)
-            if self.project.planned_end is not None:
-                if self.project.planned_end < proj_earliest_end:
-                    print(f"Warning: Provided planned end of project '{self.project.planned_end}'" +
-                          " not used as its value is smaller than the earliest possible end of" +
-                          f" the project '{act.earliest_end}'.")
-                else:
-                    proj_earliest_end = self.project.planned_end
-            return proj_earliest_end
+            return self._proj_latest_end
 
         if len(act.successors) == 1:
             return act.successors[0].latest_start
 
         return min(succ.latest_start for succ in act.successors)
 
+    def _get_project_latest_end(self) -> int:
+        """
+        Returns the time when the final activities must end.
+
+        It is the earliest end of the project, or the project's planned end if it is
+        specified and valid.
+        """
+
+        proj_earliest_end = max(act.earliest_end for act in self._get_final_activities())
+        if self.project.planned_end is not None:
+            if self.project.planned_end < proj_earliest_end:
+                print(f"Warning: Provided planned end of project '{self.project.planned_end}'" +
+                      " not used as its value is smaller than the earliest possible end of" +
+                      f" the project '{proj_earliest_end}'.")
+            else:
+                proj_earliest_end = self.project.planned_end
+
+        return proj_earliest_end
+
+    def _propagate_earliest_times(self, start_position: int, changed_positions: Set[int]):
+        """
+        Recomputes the earliest starts and ends from the activity at the given position
+        forward through its successors.
+
+        The activities are processed in topological order, and the successors of an activity
+        are only visited if its values changed. The positions of activities whose values
+        changed are added to `changed_positions`.
+        """
+
+        activities = self.project.activities
+        queue = [start_position]
+        queued = {start_position}
+        while queue:
+            act = activities[heappop(queue)]
+
+            earliest_start = self._get_earliest_start(act)
+            earliest_end = earliest_start + act.duration
+            if earliest_start == act.earliest_start and earliest_end == act.earliest_end:
+                continue
+
+            act.earliest_start, act.earliest_end = earliest_start, earliest_end
+            for succ in act.successors:
+                succ_position = self.project.positions[succ.id]
+                if succ_position not in queued:
+                    queued.add(succ_position)
+                    heappush(queue, succ_position)
+            changed_positions.add(self.project.positions[act.id])
+
+    def _propagate_latest_times(self, start_positions: List[int], changed_positions: Set[int]):
+        """
+        Recomputes the latest starts and ends from the activities at the given positions
+        backward through their predecessors.
+
+        The activities are processed in reverse topological order, and the predecessors of
+        an activity are only visited if its values changed. The positions of activities whose
+        values changed are added to `changed_positions`.
+        """
+
+        activities = self.project.activities
+        # Positions are negated to pop the activities in reverse topological order
+        queued = set(start_positions)
+        queue = [-position for position in queued]
+        heapify(queue)
+        while queue:
+            act = activities[-heappop(queue)]
+
+            latest_end = self._get_latest_end(act)
+            latest_start = latest_end - act.duration
+            if latest_start == act.latest_start and latest_end == act.latest_end:
+                continue
+
+            act.latest_start, act.latest_end = latest_start, latest_end
+            for pred in act.predecessors:
+                pred_position = self.project.positions[pred.id]
+                if pred_position not in queued:
+                    queued.add(pred_position)
+                    heappush(queue, -pred_position)
+            changed_positions.add(self.project.positions[act.id])
+
+    def _get_activity_by_id(self, activity_id) -> Activity:
+        """Returns the activity of the project with the given ID."""
+
+        activity_id = activity_id if isinstance(activity_id, ID) else ID.from_str(activity_id)
+        if activity_id not in self.project.positions:
+            raise ValueError(f"Activity with ID '{activity_id}' is not part of the project!")
+
+        return self.project.activities[self.project.positions[activity_id]]
+
+    def _update_graph(self, act: Activity, changed_positions: Set[int]):
+        """
+        Updates the duration of an activity and the values of the changed activities in
+        the project's graph.
+        """
+
+        # Activities of the project and of the graph are both sorted by ID
+        graph = self.project.graph
+        graph.durations[self.project.positions[act.id]] = act.duration
+        if not graph.has_cpm_results():
+            return
+
+        for pos in changed_positions:
+            changed_act = self.project.activities[pos]
+            for name in graph.cpm_arrays:
+                getattr(graph, name)[pos] = getattr(changed_act, name)
+
     def _calculate_project_start_end(self):
         self.project.start = min(act.earliest_start for act in self.project.activities)
         self.project.earliest_end = max(act.latest_end for act in self.project.activities)
 
     def _get_final_activities(self) -> List[Activity]:
-        """Returns the list of final activities of the project."""
-        return [act for act in self.project.activities if self._is_final(act)]
+        """Returns the list of final activities of the project, determined only once."""
+
+        if self._final_activities is None:
+            self._final_activities = [act for act in self.project.activities
+                                      if self._is_final(act)]
+
+        return self._final_activities
 
     @staticmethod
     def _is_first(act: Activity):
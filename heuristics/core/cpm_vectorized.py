@@ -0,0 +1,386 @@
+from typing import List, Optional, Tuple
+import numpy as np
+from heuristics.core.graph import ProjectGraph
+
+
+
+class VectorizedCriticalPathMethod():
+    """
+    Solver for a project timing problem using the Critical Path Method (CPM) over the arrays
+    of a ProjectGraph.
+
+    The activities are grouped into topological levels: an activity belongs to the level
+    following the last level of its predecessors.
+    All activities of a wide level are processed at once using NumPy segment reductions
+    (`np.maximum.reduceat` and `np.minimum.reduceat`) over the CSR predecessors/successors,
+    which are gathered in the order of the levels once, so a level only slices them.
+    Consecutive narrow levels, where NumPy calls would cost more than they save, are
+    processed one activity at a time over plain lists.
+
+    The results are the same as those of CriticalPathMethod.
+    """
+
+    min_vectorized_level_width: int = 64
+    """Min. number of activities in a level for it to be processed using NumPy."""
+
+    ## Public properties
+    graph: ProjectGraph
+    """The graph of the project whose timeline CPM solves. The results are stored in it."""
+
+    ## Private properties
+    _blocks: List[Tuple[np.ndarray, Optional[tuple], Optional[tuple]]]
+    """
+    Topologically ordered blocks of activities.
+
+    Each block is either a single wide level processed using NumPy, or a run of consecutive
+    narrow levels processed one activity at a time. The activities of a block are followed
+    by the segments of their predecessors and successors (see `_get_segments`), which are
+    None if the block is not vectorized.
+    """
+
+    _lists: dict
+    """
+    The CSR arrays and durations of the graph as lists used when walking narrow levels.
+
+    They are created only if there are narrow levels, whose values are computed over lists
+    mirroring the arrays (see `_get_known_values`).
+    """
+
+    ## Public methods
+    def __init__(self, graph: ProjectGraph):
+        self.graph = graph
+        self._blocks = self._get_blocks()
+        self._lists = None
+
+    def solve(self, proj_start: int = 0, planned_proj_end: int = None) -> Tuple[int, int]:
+        """
+        Solves the timing problem using the CPM algorithm.
+
+        Returns the start and the earliest end of the project.
+        """
+
+        graph = self.graph
+        num_acts = graph.num_activities
+        for name in graph.cpm_arrays:
+            setattr(graph, name, np.zeros(num_acts, dtype=graph.time_dtype))
+
+        if num_acts == 0:
+            return proj_start, planned_proj_end
+
+        # Determine the earliest starts and ends of activities
+        self._forward_walk(proj_start)
+        # Determine the latest starts and ends of activities
+        self._backward_walk(self._get_project_latest_end(planned_proj_end))
+
+        # Determine how many time units each activity can be delayed before
+        # the end of the project must be postponed
+        self._calculate_time_reserves()
+
+        # Determine when the project starts and ends
+        return int(graph.earliest_start.min()), int(graph.latest_end.max())
+
+    @classmethod
+    def get_topological_levels(cls, graph: ProjectGraph) -> List[np.ndarray]:
+        """
+        Returns the indexes of the activities grouped into topological levels.
+
+        The first level contains the activities without predecessors. Every other activity
+        is in the level following the last level of its predecessors.
+        """
+
+        order, level_ptr = cls._get_levels_csr(graph)
+
+        return [order[level_ptr[level]:level_ptr[level + 1]]
+                for level in range(len(level_ptr) - 1)]
+
+    ## Private methods
+    @classmethod
+    def _get_levels_csr(cls, graph: ProjectGraph) -> Tuple[np.ndarray, List[int]]:
+        """
+        Returns the topological levels in the CSR format: the indexes of the activities
+        sorted by their level, and the offsets of the levels.
+
+        The levels are peeled off one by one using NumPy (Kahn's algorithm). If the levels
+        turn out to be narrow on average, then the NumPy calls cost more than they save and
+        the levels are determined one activity at a time instead.
+        """
+
+        remaining_preds = np.diff(graph.pred_ptr).astype(np.int64)
+        level = np.flatnonzero(remaining_preds == 0)
+
+        levels = []
+        num_leveled_acts = 0
+        while len(level) > 0:
+            levels.append(level)
+            num_leveled_acts += len(level)
+            if len(levels) > cls.min_vectorized_level_width and \
+               num_leveled_acts < len(levels) * cls.min_vectorized_level_width:
+                return cls._get_levels_csr_sequentially(graph)
+
+            succs = graph.succ_idx[cls._get_segment_positions(
+                graph.succ_ptr, level)[0]]
+            candidates, num_finished_preds = np.unique(succs, return_counts=True)
+            remaining_preds[candidates] -= num_finished_preds
+            level = candidates[remaining_preds[candidates] == 0]
+
+        if num_leveled_acts != graph.num_activities:
+            raise RuntimeError("CPM failed!\n The activities contain a cycle, so they cannot" +
+                               " be sorted topologically.")
+
+        level_ptr = [0]
+        level_ptr.extend(np.cumsum([len(level) for level in levels]).tolist())
+
+        return np.concatenate(levels) if levels else level, level_ptr
+
+    @staticmethod
+    def _get_levels_csr_sequentially(graph: ProjectGraph) -> Tuple[np.ndarray, List[int]]:
+        """
+        Returns the topological levels in the CSR format, determining the level of one
+        activity at a time.
+        """
+
+        # The activities of the graph are sorted by ID, which is a topological order
+        # unless an activity starts and ends in the same node.
+        pred_ptr, pred_idx = graph.pred_ptr.tolist(), graph.pred_idx.tolist()
+        depths = [0] * graph.num_activities
+        for index in range(graph.num_activities):
+            depth = 0
+            for pred in pred_idx[pred_ptr[index]:pred_ptr[index + 1]]:
+                if pred >= index:
+                    raise RuntimeError("CPM failed!\n The activities contain a cycle, so they" +
+                                       " cannot be sorted topologically.")
+                if depths[pred] >= depth:
+                    depth = depths[pred] + 1
+            depths[index] = depth
+
+        depths = np.array(depths, dtype=np.int64)
+        order = np.argsort(depths, kind="stable")
+        level_ptr = [0]
+        level_ptr.extend(np.cumsum(np.bincount(depths)).tolist())
+
+        return order, level_ptr
+
+    def _get_blocks(self) -> List[Tuple[np.ndarray, Optional[tuple], Optional[tuple]]]:
+        """Returns the levels split into vectorized blocks and runs of narrow levels."""
+
+        graph = self.graph
+        order, level_ptr = self._get_levels_csr(graph)
+        pred_segments = self._get_segments(graph.pred_ptr, graph.pred_idx, order, level_ptr)
+        succ_segments = self._get_segments(graph.succ_ptr, graph.succ_idx, order, level_ptr)
+
+        blocks = []
+        narrow_start = 0
+        for level in range(len(level_ptr) - 1):
+            level_start, level_end = level_ptr[level], level_ptr[level + 1]
+            if level_end - level_start >= self.min_vectorized_level_width:
+                if narrow_start < level_start:
+                    blocks.append((order[narrow_start:level_start], None, None))
+                blocks.append((order[level_start:level_end], pred_segments[level],
+                               succ_segments[level]))
+                narrow_start = level_end
+
+        if narrow_start < len(order):
+            blocks.append((order[narrow_start:], None, None))
+
+        return blocks
+
+    def _get_segments(self, ptr: np.ndarray, idx: np.ndarray, order: np.ndarray,
+                      level_ptr: List[int]) -> List[Optional[tuple]]:
+        """
+        Returns for each level the CSR segments of its activities, or None if the level is
+        too narrow to be vectorized.
+
+        The segments of a level comprise the indexes of the segments concatenated, the offsets
+        of the non-empty segments in the concatenation and the mask of the activities whose
+        segment is not empty. The indexes of all levels are gathered at once.
+        """
+
+        if len(order) == 0:
+            return []
+
+        positions, offsets, counts = self._get_segment_positions(ptr, order)
+        segments_idx = idx[positions]
+
+        segments = []
+        for level in range(len(level_ptr) - 1):
+            level_start, level_end = level_ptr[level], level_ptr[level + 1]
+            if level_end - level_start < self.min_vectorized_level_width:
+                segments.append(None)
+                continue
+
+            level_offsets = offsets[level_start:level_end]
+            non_empty = counts[level_start:level_end] > 0
+            first = level_offsets[0]
+            last = offsets[level_end] if level_end < len(order) else len(segments_idx)
+            segments.append((segments_idx[first:last], level_offsets[non_empty] - first,
+                             non_empty))
+
+        return segments
+
+    def _forward_walk(self, proj_start: int):
+        """
+        Performs the forward walk of the CPM algorithm block by block.
+
+        The earliest start of an activity is the max. earliest end of its predecessors, or
+        the project's start if it has none.
+        """
+
+        graph = self.graph
+        earliest_start, earliest_end = graph.earliest_start, graph.earliest_end
+        known_ends = self._get_known_values()
+        for block, pred_segments, _ in self._blocks:
+            if pred_segments is not None:
+                earliest_start[block] = self._reduce_segments(
+                    np.maximum, earliest_end, pred_segments, proj_start)
+                earliest_end[block] = earliest_start[block] + graph.durations[block]
+                self._update_known_values(known_ends, earliest_end, block)
+            else:
+                self._walk_sequentially(max, earliest_start, earliest_end, known_ends,
+                                        block, proj_start, 1)
+
+    def _backward_walk(self, proj_latest_end: int):
+        """
+        Performs the backward walk of the CPM algorithm block by block in reverse order.
+
+        The latest end of an activity is the min. latest start of its successors, or
+        the project's latest end if it has none.
+        """
+
+        graph = self.graph
+        latest_start, latest_end = graph.latest_start, graph.latest_end
+        known_starts = self._get_known_values()
+        for block, _, succ_segments in reversed(self._blocks):
+            if succ_segments is not None:
+                latest_end[block] = self._reduce_segments(
+                    np.minimum, latest_start, succ_segments, proj_latest_end)
+                latest_start[block] = latest_end[block] - graph.durations[block]
+                self._update_known_values(known_starts, latest_start, block)
+            else:
+                self._walk_sequentially(min, latest_end, latest_start, known_starts,
+                                        block[::-1], proj_latest_end, -1)
+
+    def _get_known_values(self) -> Optional[List[int]]:
+        """
+        Returns the list mirroring the values computed by a walk, from which the narrow
+        levels read them, or None if there are no narrow levels.
+        """
+
+        if all(pred_segments is not None for _, pred_segments, _ in self._blocks):
+            return None
+
+        if self._lists is None:
+            graph = self.graph
+            self._lists = {name: getattr(graph, name).tolist()
+                           for name in ("pred_ptr", "pred_idx", "succ_ptr", "succ_idx",
+                                        "durations")}
+
+        return [0] * self.graph.num_activities
+
+    @staticmethod
+    def _update_known_values(known_values: Optional[List[int]], values: np.ndarray,
+                             block: np.ndarray):
+        """Copies the values of the activities of a vectorized block to the known values."""
+
+        if known_values is not None:
+            for index, value in zip(block.tolist(), values[block].tolist()):
+                known_values[index] = value
+
+    def _walk_sequentially(self, reduction, targets: np.ndarray, values: np.ndarray,
+                           known_values: List[int], block: np.ndarray, default: int,
+                           direction: int):
+        """
+        Walks the activities of the block one by one in the order of the block.
+
+        The target of an activity is set to the reduction of the known values over its
+        predecessors (forward) or successors (backward), or to `default` if it has none.
+        Its own value is then set to its target plus `direction` times its duration.
+        The values are computed over lists and stored in the arrays once per block.
+        """
+
+        forward = direction > 0
+        ptr = self._lists["pred_ptr" if forward else "succ_ptr"]
+        idx = self._lists["pred_idx" if forward else "succ_idx"]
+        durations = self._lists["durations"]
+
+        get_value = known_values.__getitem__
+        block = block.tolist()
+        block_targets = []
+        for index in block:
+            segment = idx[ptr[index]:ptr[index + 1]]
+            target = reduction(map(get_value, segment)) if segment else default
+            block_targets.append(target)
+            known_values[index] = target + direction * durations[index]
+
+        targets[block] = block_targets
+        values[block] = [known_values[index] for index in block]
+
+    def _calculate_time_reserves(self):
+        """Calculates the time reserves of activities."""
+
+        graph = self.graph
+        start_reserves = graph.latest_start - graph.earliest_start
+        end_reserves = graph.latest_end - graph.earliest_end
+        if not np.array_equal(start_reserves, end_reserves):
+            act_id = graph.activity(int(np.flatnonzero(start_reserves != end_reserves)[0])).id
+            raise RuntimeError("CPM failed!\n The time reserves of Activity with ID"
+                               f"'{act_id}' do not match!" +
+                               "\n The difference between earliest_start-latest_start and" +
+                               " earliest_end-latest_end should be the same"
+                               "\n The results are incorrect.")
+
+        graph.time_reserve[:] = start_reserves
+
+    def _get_project_latest_end(self, planned_proj_end: int) -> int:
+        """
+        Returns the time when the final activities must end.
+
+        It is the earliest end of the project, or the planned end of the project if it is
+        specified and valid.
+        """
+
+        graph = self.graph
+        is_final = graph.succ_ptr[1:] == graph.succ_ptr[:-1]
+        proj_earliest_end = int(graph.earliest_end[is_final].max())
+
+        if planned_proj_end is not None:
+            if planned_proj_end < proj_earliest_end:
+                print(f"Warning: Provided planned end of project '{planned_proj_end}'" +
+                      " not used as its value is smaller than the earliest possible end of" +
+                      f" the project '{proj_earliest_end}'.")
+            else:
+                proj_earliest_end = planned_proj_end
+
+        return proj_earliest_end
+
+    @staticmethod
+    def _reduce_segments(reduction: np.ufunc, values: np.ndarray, segments: tuple,
+                         default: int) -> np.ndarray:
+        """
+        Returns for each activity of a level the reduction of `values` over its segment
+        (its predecessors or successors, see `_get_segments`).
+
+        Activities with an empty segment get the `default` value.
+        """
+
+        segments_idx, offsets, non_empty = segments
+        result = np.full(len(non_empty), default, dtype=values.dtype)
+        if len(segments_idx) > 0:
+            result[non_empty] = reduction.reduceat(values[segments_idx], offsets)
+
+        return result
+
+    @staticmethod
+    def _get_segment_positions(ptr: np.ndarray, rows: np.ndarray):
+        """
+        Returns the positions of the CSR segments of the given rows concatenated, the offsets
+        of the segments in the concatenation and the lengths of the segments.
+        """
+
+        firsts = ptr[rows].astype(np.int64)
+        counts = ptr[rows + 1] - firsts
+        offsets = np.zeros(len(rows), dtype=np.int64)
+        np.cumsum(counts[:-1], out=offsets[1:])
+
+        positions = np.repeat(firsts - offsets, counts) + np.arange(offsets[-1] + counts[-1])
+
+        return positions, offsets, counts
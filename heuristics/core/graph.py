@@ -0,0 +1,512 @@
+from array import array
+from operator import attrgetter
+from typing import Iterator, List, Optional
+import numpy as np
+from heuristics.core.activities.activity import Activity
+from heuristics.core.activities.activity_id import ActivityID as ID
+from heuristics.core.activities.loader import ActivitiesLoader
+from heuristics.core.project import Project
+
+
+class ProjectGraph():
+    """
+    Compact, array-backed representation of the activities of a project.
+
+    The properties of the activities are stored column-wise in typed NumPy arrays
+    (struct of arrays), where the i-th element of each array belongs to the i-th activity.
+    The activities are sorted in ascending order according to their ID, so the order of
+    the activities is the same as in Project, and it is a topological order of the network.
+
+    The predecessors and successors of the activities are stored in the compressed sparse
+    row (CSR) format:
+    - The indexes of the predecessors of the i-th activity are
+      `pred_idx[pred_ptr[i]:pred_ptr[i + 1]]`.
+    - The indexes of the successors of the i-th activity are
+      `succ_idx[succ_ptr[i]:succ_ptr[i + 1]]`.
+
+    Activity-like objects are only created on demand as lightweight, read-only views, see
+    `ActivityView`. They are not Activity instances, which are created from the graph only
+    by `to_activities`.
+    """
+
+    index_dtype = np.int32
+    """Data type of nodes, durations, resources and indexes into the arrays."""
+    time_dtype = np.int64
+    """Data type of the points in time computed by the Critical Path Method (CPM)."""
+
+    start_nodes: np.ndarray
+    """The nodes that the activities start from."""
+    end_nodes: np.ndarray
+    """The nodes that the activities end in."""
+
+    durations: np.ndarray
+    """Durations of the activities."""
+    resources: np.ndarray
+    """Resources required for the activities in a single time unit."""
+
+    pred_ptr: np.ndarray
+    """Offsets of the predecessors of each activity in `pred_idx`."""
+    pred_idx: np.ndarray
+    """Indexes of the predecessors of all activities."""
+    succ_ptr: np.ndarray
+    """Offsets of the successors of each activity in `succ_idx`."""
+    succ_idx: np.ndarray
+    """Indexes of the successors of all activities."""
+
+    earliest_start: Optional[np.ndarray]
+    """Earliest starts of the activities, or None if they are not known."""
+    earliest_end: Optional[np.ndarray]
+    """Earliest ends of the activities, or None if they are not known."""
+    latest_start: Optional[np.ndarray]
+    """Latest starts of the activities, or None if they are not known."""
+    latest_end: Optional[np.ndarray]
+    """Latest ends of the activities, or None if they are not known."""
+    time_reserve: Optional[np.ndarray]
+    """Time reserves of the activities, or None if they are not known."""
+
+    base_arrays = ("start_nodes", "end_nodes", "durations", "resources",
+                   "pred_ptr", "pred_idx", "succ_ptr", "succ_idx")
+    """Names of the arrays describing the activities and their dependencies."""
+
+    cpm_arrays = ("earliest_start", "earliest_end", "latest_start", "latest_end",
+                  "time_reserve")
+    """Names of the arrays holding the results of the Critical Path Method (CPM)."""
+
+    ## Public methods
+    def __init__(self, start_nodes, end_nodes, durations, resources):
+        """
+        Creates the graph from the nodes, durations and resources of the activities.
+
+        The activities do not have to be sorted. The predecessors and successors are
+        determined from the nodes of the activities.
+        """
+
+        start_nodes, end_nodes, durations, resources = (
+            self._as_index_array(values, name)
+            for values, name in ((start_nodes, "nodes"), (end_nodes, "nodes"),
+                                 (durations, "durations"), (resources, "resources")))
+        self._validate_arrays(start_nodes, end_nodes, durations, resources)
+
+        order = np.lexsort((end_nodes, start_nodes))
+        self.start_nodes = start_nodes[order]
+        self.end_nodes = end_nodes[order]
+        self.durations = durations[order]
+        self.resources = resources[order]
+        self._validate_unique_ids()
+
+        self.pred_ptr, self.pred_idx = self._get_predecessors_csr()
+        self.succ_ptr, self.succ_idx = self._get_successors_csr()
+
+        for name in self.cpm_arrays:
+            setattr(self, name, None)
+
+    @classmethod
+    def from_arrays(cls, **arrays: np.ndarray) -> 'ProjectGraph':
+        """
+        Overloaded constructor for creating the graph from its arrays, e.g. memory-mapped ones.
+
+        All arrays listed in `base_arrays` must be provided, the arrays listed in `cpm_arrays`
+        are optional. The arrays are used as they are - they are not copied, sorted or
+        validated.
+        """
+
+        missing_arrays = [name for name in cls.base_arrays if name not in arrays]
+        if missing_arrays:
+            raise ValueError("Creating ProjectGraph failed!" +
+                             f"\n The arrays '{', '.join(missing_arrays)}' are missing.")
+
+        graph = cls.__new__(cls)
+        for name in cls.base_arrays + cls.cpm_arrays:
+            setattr(graph, name, arrays.get(name))
+
+        return graph
+
+    @classmethod
+    def from_project(cls, project: Project) -> 'ProjectGraph':
+        """
+        Overloaded constructor for creating the graph from the activities of a Project.
+
+        The results of the Critical Path Method (CPM) are copied as well if all activities
+        have them.
+        """
+
+        activities = project.activities
+        num_acts = len(activities)
+        with_cpm_results = num_acts > 0 and all(act.time_reserve is not None
+                                                for act in activities)
+
+        # Each column is read by a single pass over the activities, which NumPy converts
+        # at once
+        nodes = np.array([act.id.as_tuple() for act in activities],
+                         dtype=np.int64).reshape(num_acts, 2)
+        names = ("duration", "resources") + (cls.cpm_arrays if with_cpm_results else ())
+        columns = [np.fromiter(map(attrgetter(name), activities), dtype=np.int64,
+                               count=num_acts) for name in names]
+
+        graph = cls(nodes[:, 0], nodes[:, 1], *columns[:2])
+        if with_cpm_results:
+            order = np.lexsort((nodes[:, 1], nodes[:, 0]))
+            for name, values in zip(cls.cpm_arrays, columns[2:]):
+                setattr(graph, name, values[order].astype(cls.time_dtype))
+
+        return graph
+
+    @classmethod
+    def from_file(cls, acts_file_path: str) -> 'ProjectGraph':
+        """
+        Overloaded constructor for loading the graph straight from a data file.
+
+        No Activity instances are created during loading.
+        """
+
+        columns = [array('q') for _ in range(4)]
+        for rows in ActivitiesLoader.iter_activity_rows(acts_file_path):
+            for column, values in zip(columns, zip(*rows)):
+                column.extend(values)
+
+        return cls(*(np.frombuffer(column, dtype=np.int64) for column in columns))
+
+    @property
+    def num_activities(self) -> int:
+        """Number of activities in the graph."""
+        return len(self.start_nodes)
+
+    @property
+    def total_resources_required(self) -> int:
+        """The total number of resources used to complete all activities."""
+        return int(np.dot(self.durations.astype(np.int64), self.resources.astype(np.int64)))
+
+    @property
+    def nbytes(self) -> int:
+        """Number of bytes consumed by the arrays of the graph."""
+
+        arrays = (getattr(self, name) for name in self.base_arrays + self.cpm_arrays)
+
+        return sum(arr.nbytes for arr in arrays if arr is not None)
+
+    def has_cpm_results(self) -> bool:
+        """Returns True if the results of the Critical Path Method (CPM) are known."""
+        return all(getattr(self, name) is not None for name in self.cpm_arrays)
+
+    def index_of(self, act_id: ID) -> int:
+        """Returns the index of the activity with the given ID."""
+
+        first = np.searchsorted(self.start_nodes, act_id.start_node, side="left")
+        last = np.searchsorted(self.start_nodes, act_id.start_node, side="right")
+        index = first + np.searchsorted(self.end_nodes[first:last], act_id.end_node)
+        if index == last or self.end_nodes[index] != act_id.end_node:
+            raise ValueError(f"Activity with ID '{act_id}' is not part of the project graph!")
+
+        return int(index)
+
+    def predecessors_of(self, index: int) -> np.ndarray:
+        """Returns the indexes of the predecessors of the activity at the given index."""
+        return self.pred_idx[self.pred_ptr[index]:self.pred_ptr[index + 1]]
+
+    def successors_of(self, index: int) -> np.ndarray:
+        """Returns the indexes of the successors of the activity at the given index."""
+        return self.succ_idx[self.succ_ptr[index]:self.succ_ptr[index + 1]]
+
+    def activity(self, index: int) -> 'ActivityView':
+        """Returns a view of the activity at the given index."""
+
+        if not -self.num_activities <= index < self.num_activities:
+            raise IndexError(f"Activity index '{index}' is out of range!")
+
+        return ActivityView(self, index % self.num_activities)
+
+    def activity_views(self) -> Iterator['ActivityView']:
+        """Yields views of all activities in the graph in ascending order by ID."""
+
+        for index in range(self.num_activities):
+            yield ActivityView(self, index)
+
+    def to_activities(self) -> List[Activity]:
+        """
+        Returns the activities of the graph as Activity instances.
+
+        The activities are sorted in ascending order according to their ID, and their
+        predecessors and successors are initialized from the graph.
+        """
+
+        columns = [self.start_nodes.tolist(), self.end_nodes.tolist(),
+                   self.durations.tolist(), self.resources.tolist()]
+        if self.has_cpm_results():
+            columns.extend(getattr(self, name).tolist() for name in self.cpm_arrays)
+        else:
+            columns.extend([None] * self.num_activities for _ in self.cpm_arrays)
+
+        activities = [Activity(ID(start_node, end_node), duration, resources,
+                               earliest_start=e_start, earliest_end=e_end,
+                               latest_start=l_start, latest_end=l_end, time_reserve=reserve)
+                      for start_node, end_node, duration, resources,
+                          e_start, e_end, l_start, l_end, reserve in zip(*columns)]
+
+        pred_ptr, pred_idx = self.pred_ptr.tolist(), self.pred_idx.tolist()
+        succ_ptr, succ_idx = self.succ_ptr.tolist(), self.succ_idx.tolist()
+        for index, act in enumerate(activities):
+            act.predecessors = [activities[pred]
+                                for pred in pred_idx[pred_ptr[index]:pred_ptr[index + 1]]]
+            act.successors = [activities[succ]
+                              for succ in succ_idx[succ_ptr[index]:succ_ptr[index + 1]]]
+
+        return activities
+
+    ## Private methods
+    @classmethod
+    def _as_index_array(cls, values, name: str) -> np.ndarray:
+        """
+        Returns the values as an array of `index_dtype`.
+
+        The values are checked to fit into the data type first, as casting would silently
+        wrap them around.
+        """
+
+        limits = np.iinfo(cls.index_dtype)
+        try:
+            values = np.asarray(values, dtype=np.int64)
+            out_of_range = len(values) > 0 and (values.min() < limits.min or
+                                                values.max() > limits.max)
+        except OverflowError:
+            out_of_range = True
+
+        if out_of_range:
+            raise ValueError("Creating ProjectGraph failed!" +
+                             f"\n The {name} of activities must be between '{limits.min}'" +
+                             f" and '{limits.max}'.")
+
+        return values.astype(cls.index_dtype)
+
+    @staticmethod
+    def _validate_arrays(start_nodes: np.ndarray, end_nodes: np.ndarray,
+                         durations: np.ndarray, resources: np.ndarray):
+        """Validates that the arrays describing the activities are correct."""
+
+        main_failure_msg = "Creating ProjectGraph failed!"
+        if not len(start_nodes) == len(end_nodes) == len(durations) == len(resources):
+            raise ValueError(main_failure_msg +
+                             "\n The nodes, durations and resources must have the same length.")
+
+        if np.any(start_nodes < 1) or np.any(start_nodes > end_nodes):
+            raise ValueError(main_failure_msg + "\n The nodes of activities must be greater" +
+                             " than zero, and the start node must not be greater than the" +
+                             " end node!")
+
+        if np.any(durations < 0) or np.any(resources < 0):
+            raise ValueError(main_failure_msg + "\n The durations and resources of" +
+                             " activities must be nonnegative!")
+
+    def _validate_unique_ids(self):
+        """Validates that no two activities of the sorted graph have the same ID."""
+
+        duplicates = np.flatnonzero((self.start_nodes[1:] == self.start_nodes[:-1]) &
+                                    (self.end_nodes[1:] == self.end_nodes[:-1]))
+        if len(duplicates) > 0:
+            act_id = f"{self.start_nodes[duplicates[0]]}-{self.end_nodes[duplicates[0]]}"
+            raise ValueError("Creating ProjectGraph failed!" +
+                             f"\n Activity with ID '{act_id}' is present more than once.")
+
+    def _get_predecessors_csr(self):
+        """
+        Returns the predecessors of the activities in the CSR format.
+
+        The predecessors of an activity are the activities ending in its start node.
+        They are sorted in ascending order according to their ID.
+        """
+
+        order_by_end = np.argsort(self.end_nodes, kind="stable").astype(self.index_dtype)
+        first, last = self._get_node_ranges(self.end_nodes[order_by_end], self.start_nodes)
+
+        ptr, positions = self._get_csr_from_ranges(first, last)
+
+        return ptr, order_by_end[positions]
+
+    def _get_successors_csr(self):
+        """
+        Returns the successors of the activities in the CSR format.
+
+        The successors of an activity are the activities starting in its end node.
+        As the activities are sorted by their start node, the successors of each activity
+        are a contiguous range of activities.
+        """
+
+        first, last = self._get_node_ranges(self.start_nodes, self.end_nodes)
+
+        ptr, positions = self._get_csr_from_ranges(first, last)
+
+        return ptr, positions.astype(self.index_dtype)
+
+    @staticmethod
+    def _get_node_ranges(sorted_nodes: np.ndarray, nodes: np.ndarray):
+        """
+        Returns for each of the nodes the range `[first, last)` of its positions in
+        the sorted nodes.
+
+        The nodes of a network are usually numbered densely, so the ranges are looked up in
+        the table of the first position of every node, which is faster than searching
+        the sorted nodes.
+        """
+
+        num_table_nodes = int(max(sorted_nodes.max(), nodes.max())) + 2 if len(nodes) else 0
+        if num_table_nodes > 4 * len(nodes) + 1024:
+            return (np.searchsorted(sorted_nodes, nodes, side="left"),
+                    np.searchsorted(sorted_nodes, nodes, side="right"))
+
+        firsts = np.zeros(num_table_nodes + 1, dtype=np.int64)
+        np.cumsum(np.bincount(sorted_nodes, minlength=num_table_nodes), out=firsts[1:])
+
+        return firsts[nodes], firsts[nodes + 1]
+
+    def _get_csr_from_ranges(self, first: np.ndarray, last: np.ndarray):
+        """
+        Returns the offsets and the concatenated positions of ranges `[first[i], last[i])`.
+        """
+
+        counts = last - first
+        ptr = np.zeros(len(counts) + 1, dtype=np.int64)
+        np.cumsum(counts, out=ptr[1:])
+
+        positions = np.repeat(first - ptr[:-1], counts) + np.arange(ptr[-1])
+
+        return ptr.astype(self.index_dtype), positions
+
+    ## Magic methods
+    def __len__(self) -> int:
+        return self.num_activities
+
+    def __repr__(self) -> str:
+        return f"ProjectGraph(num_activities={self.num_activities}, nbytes={self.nbytes})"
+
+
+class ActivityView():
+    """
+    Lightweight, read-only view of an activity stored in a ProjectGraph.
+
+    The view only holds a reference to the graph and the index of the activity, every
+    property is read from the arrays of the graph when it is accessed.
+
+    It is a separate type rather than Activity itself: Activity stays the mutable object
+    that the loader wires and the "python" CPM engine updates, while code working with
+    a graph reads its arrays or these views. A view is converted by `to_activity` where
+    an Activity is needed.
+    """
+
+    __slots__ = ("graph", "index")
+
+    graph: ProjectGraph
+    """The graph that the activity is part of."""
+    index: int
+    """Index of the activity in the arrays of the graph."""
+
+    ## Public methods
+    def __init__(self, graph: ProjectGraph, index: int):
+        self.graph = graph
+        self.index = index
+
+    @property
+    def id(self) -> ID:
+        """ID of the activity."""
+        return ID(int(self.graph.start_nodes[self.index]), int(self.graph.end_nodes[self.index]))
+
+    @property
+    def duration(self) -> int:
+        """Duration of the activity."""
+        return int(self.graph.durations[self.index])
+
+    @property
+    def resources(self) -> int:
+        """Resources required for the activity in a single time unit."""
+        return int(self.graph.resources[self.index])
+
+    @property
+    def total_resources(self) -> int:
+        """Total resources required by this activity."""
+        return self.duration * self.resources
+
+    @property
+    def predecessors(self) -> List['ActivityView']:
+        """Activities that must be completed before this activity can begin."""
+        return [ActivityView(self.graph, int(pred))
+                for pred in self.graph.predecessors_of(self.index)]
+
+    @property
+    def successors(self) -> List['ActivityView']:
+        """Activities waiting for this activity for be completed."""
+        return [ActivityView(self.graph, int(succ))
+                for succ in self.graph.successors_of(self.index)]
+
+    @property
+    def earliest_start(self) -> Optional[int]:
+        """Earliest possible time the activity can start."""
+        return self._get_cpm_value("earliest_start")
+
+    @property
+    def earliest_end(self) -> Optional[int]:
+        """Earliest possible time the activity can end."""
+        return self._get_cpm_value("earliest_end")
+
+    @property
+    def latest_start(self) -> Optional[int]:
+        """Latest permissible time the activity can start."""
+        return self._get_cpm_value("latest_start")
+
+    @property
+    def latest_end(self) -> Optional[int]:
+        """Latest permissible time the activity can end."""
+        return self._get_cpm_value("latest_end")
+
+    @property
+    def time_reserve(self) -> Optional[int]:
+        """
+        How much the activity can be delayed before the end of the project
+        it is a part of must be delayed.
+        """
+        return self._get_cpm_value("time_reserve")
+
+    def as_dict(self):
+        """
+        Returns the properties of the activity as a dict.
+
+        The predecessors and successors are not returned.
+        """
+
+        props = {'id': self.id, 'duration': self.duration, 'resources': self.resources,
+                 'total_resources': self.total_resources}
+        props.update((name, self._get_cpm_value(name)) for name in ProjectGraph.cpm_arrays)
+
+        return props
+
+    def to_activity(self) -> Activity:
+        """
+        Returns the activity as an Activity instance.
+
+        The predecessors and successors of the returned activity are not initialized.
+        """
+
+        props = self.as_dict()
+        del props['total_resources']
+
+        return Activity(**props)
+
+    ## Private methods
+    def _get_cpm_value(self, name: str) -> Optional[int]:
+        """Returns the value of the activity in the CPM array with the given name."""
+
+        values = getattr(self.graph, name)
+
+        return None if values is None else int(values[self.index])
+
+    ## Magic methods
+    def __repr__(self) -> str:
+        return f"ActivityView({self.as_dict()})"
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, ActivityView):
+            raise NotImplementedError("Determining equality of ActivityView instances failed!" +
+                                      f"\n Cannot compare instances of '{type(self)}' and" +
+                                      f" '{type(other)}'")
+
+        return self.graph is other.graph and self.index == other.index
+
+    def __hash__(self):
+        return hash((id(self.graph), self.index))
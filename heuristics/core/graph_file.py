@@ -0,0 +1,192 @@
+import json
+import struct
+from pathlib import Path
+from typing import Dict, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from heuristics.core.graph import ProjectGraph
+
+
+class ProjectGraphFile():
+    """
+    Binary file holding the arrays of a ProjectGraph, which are memory-mapped when loaded.
+
+    The file consists of:
+    - The magic bytes identifying the format.
+    - The version of the format and the length of the header (both unsigned 32-bit
+      little-endian integers).
+    - The header - JSON describing the data type, offset and length of each array, and
+      optionally the start and earliest end of the project if the CPM arrays are included.
+    - The raw data of the arrays, each aligned to `alignment` bytes.
+
+    As the arrays are memory-mapped, loading a graph is nearly instant and does not copy
+    the data. Processes loading the same file share the pages of the file.
+
+    NumPy is imported only when a graph is written or loaded, so checking whether a file is
+    in this format (see `is_graph_file`) does not import it.
+    """
+
+    magic = b"HMADPGF\x00"
+    """Magic bytes at the beginning of every file."""
+    version = 1
+    """Version of the format written by this class."""
+    alignment = 64
+    """Alignment of the arrays in the file in bytes."""
+
+    path: Path
+    """Path to the file."""
+    header: Dict
+    """Header of the file."""
+
+    ## Public methods
+    def __init__(self, path: str):
+        """Opens an existing file and reads its header."""
+
+        self.path = path if isinstance(path, Path) else Path(path)
+        self.header = self._read_header()
+
+    @classmethod
+    def write(cls, graph: 'ProjectGraph', path: str, proj_start: int = None,
+              proj_earliest_end: int = None) -> 'ProjectGraphFile':
+        """
+        Writes the arrays of the graph to a binary file.
+
+        The CPM arrays are written only if the graph has CPM results. The start and earliest
+        end of the project are stored with them.
+        """
+
+        # pylint: disable=import-outside-toplevel
+        import numpy as np
+
+        names = list(graph.base_arrays)
+        if graph.has_cpm_results():
+            names.extend(graph.cpm_arrays)
+
+        header = {'num_activities': graph.num_activities, 'arrays': {}, 'project': None}
+        if graph.has_cpm_results():
+            header['project'] = {'start': proj_start, 'earliest_end': proj_earliest_end}
+
+        # Offsets of arrays are relative to the end of the header, so that they do not
+        # depend on the length of the header.
+        offset = 0
+        for name in names:
+            arr = getattr(graph, name)
+            offset = cls._align(offset)
+            header['arrays'][name] = {'dtype': arr.dtype.str, 'offset': offset,
+                                      'length': len(arr)}
+            offset += arr.nbytes
+
+        header_bytes = json.dumps(header).encode("utf-8")
+        data_start = cls._align(len(cls.magic) + 8 + len(header_bytes))
+        header_bytes += b" " * (data_start - len(cls.magic) - 8 - len(header_bytes))
+
+        path = path if isinstance(path, Path) else Path(path)
+        with open(path, "wb") as file:
+            file.write(cls.magic)
+            file.write(struct.pack("<II", cls.version, len(header_bytes)))
+            file.write(header_bytes)
+            for name in names:
+                array_info = header['arrays'][name]
+                file.seek(data_start + array_info['offset'])
+                file.write(np.ascontiguousarray(getattr(graph, name)).tobytes())
+
+        return cls(path)
+
+    @classmethod
+    def convert(cls, acts_file_path: str, binary_file_path: str, solve_cpm: bool = False,
+                proj_start: int = 0, planned_proj_end: int = None) -> 'ProjectGraphFile':
+        """
+        Converts a data file with activities to the binary format.
+
+        If `solve_cpm` is True, then the problem is solved using the Critical Path Method
+        and the results are stored in the binary file as well.
+        """
+
+        # pylint: disable=import-outside-toplevel
+        from heuristics.core.cpm_vectorized import VectorizedCriticalPathMethod
+        from heuristics.core.graph import ProjectGraph
+
+        graph = ProjectGraph.from_file(acts_file_path)
+        proj_earliest_end = None
+        if solve_cpm:
+            proj_start, proj_earliest_end = VectorizedCriticalPathMethod(graph).solve(
+                proj_start, planned_proj_end)
+
+        return cls.write(graph, binary_file_path, proj_start, proj_earliest_end)
+
+    @classmethod
+    def is_graph_file(cls, path: str) -> bool:
+        """Returns True if the file at the given path is in this binary format."""
+
+        with open(path, "rb") as file:
+            return file.read(len(cls.magic)) == cls.magic
+
+    @property
+    def proj_start(self) -> Optional[int]:
+        """The start of the project stored with the CPM arrays, or None."""
+        return None if self.header['project'] is None else self.header['project']['start']
+
+    @property
+    def proj_earliest_end(self) -> Optional[int]:
+        """The earliest end of the project stored with the CPM arrays, or None."""
+        return None if self.header['project'] is None else \
+                       self.header['project']['earliest_end']
+
+    def load_graph(self, mode: str = "r") -> 'ProjectGraph':
+        """
+        Returns the graph with its arrays memory-mapped from the file.
+
+        The `mode` is passed to `numpy.memmap`:
+        - "r" - the arrays are read-only.
+        - "c" - copy-on-write: the arrays can be modified, but the changes are not written
+          to the file.
+        - "r+" - the changes of the arrays are written to the file.
+        """
+
+        # pylint: disable=import-outside-toplevel
+        import numpy as np
+        from heuristics.core.graph import ProjectGraph
+
+        data_start = self._align(len(self.magic) + 8 + self.header['header_length'])
+        arrays = {}
+        for name, array_info in self.header['arrays'].items():
+            dtype = np.dtype(array_info['dtype'])
+            if array_info['length'] == 0:
+                # Empty arrays cannot be memory-mapped
+                arrays[name] = np.zeros(0, dtype=dtype)
+            else:
+                arrays[name] = np.memmap(self.path, dtype=dtype, mode=mode,
+                                         offset=data_start + array_info['offset'],
+                                         shape=(array_info['length'],))
+
+        return ProjectGraph.from_arrays(**arrays)
+
+    ## Private methods
+    def _read_header(self) -> Dict:
+        """Reads and validates the header of the file."""
+
+        with open(self.path, "rb") as file:
+            magic = file.read(len(self.magic))
+            if magic != self.magic:
+                raise ValueError(f"Failed reading '{self.path}'!" +
+                                 "\n The file is not a binary project graph file.")
+
+            version, header_length = struct.unpack("<II", file.read(8))
+            if version > self.version:
+                raise ValueError(f"Failed reading '{self.path}'!" +
+                                 f"\n Version '{version}' of the format is not supported.")
+
+            header = json.loads(file.read(header_length).decode("utf-8"))
+
+        header['header_length'] = header_length
+
+        return header
+
+    @classmethod
+    def _align(cls, offset: int) -> int:
+        """Returns the smallest offset aligned to `alignment` bytes that is >= `offset`."""
+        return -(-offset // cls.alignment) * cls.alignment
+
+    ## Magic methods
+    def __repr__(self) -> str:
+        return f"ProjectGraphFile('{self.path}', num_activities={self.header['num_activities']})"
@@ -1,8 +1,12 @@
-from typing import List
+from typing import Dict, List, Optional, TYPE_CHECKING
 from heuristics.core.activities.activity import Activity
+from heuristics.core.activities.activity_id import ActivityID as ID
 from heuristics.core.activities.loader import ActivitiesLoader
 from heuristics.core.activities.initializer import ActivitiesInitializer
 
+if TYPE_CHECKING:
+    from heuristics.core.graph import ProjectGraph
+
 class Project():
     """
     Project that is analyzed/planned using heuristics.
@@ -16,12 +20,16 @@ class Project():
       - The desired end of the project.
 
     - Results:
-      - The actual time when the project can be completed earliest.
+      - The earliest possible end of the project according to the activity dependencies.
       - Total resources required to complete the entire project.
-    """
+      The actual end of the project scheduled by a heuristic method is kept by its Schedule.
 
-    activities: List[Activity]
-    """List of activities."""
+    A project loaded from a binary file is backed by its memory-mapped graph, and its
+    Activity instances are created only once they are first needed (see `activities`).
+    The CPM engines and the heuristic methods read the columns of activities by their
+    positions instead (see `get_column`), so such a project is solved and scheduled
+    without creating them.
+    """
 
     r_max: int
     """Max. resources available for all activities in a single time unit."""
@@ -42,27 +50,58 @@ class Project():
     It is equal to the sum of total resources of all activities.
     """
 
-    actual_end: int
+    graph: 'ProjectGraph'
+    """
+    Array-backed graph of the project, e.g. memory-mapped from a binary file.
+
+    It is None unless the project was created from a graph or solved by the "vectorized"
+    CPM engine, which keeps the graph it creates.
     """
-    The time that the project can actually end according to a heuristic method which takes
-    into account the max. resources available at one point in time.
+
+    columns = ("duration", "resources", "earliest_start", "earliest_end", "latest_start",
+               "latest_end", "time_reserve")
+    """Properties of activities that can be read as columns (see `get_column`)."""
+
+    ## Private properties
+    _activities: Optional[List[Activity]]
+    """List of activities, None until they are created from the graph."""
+
+    _positions: Dict[ID, int]
+    """
+    Positions of activities in the list of activities, keyed by their ID.
+
+    The dict is created when it is first needed.
     """
 
     ## Public methods
-    def __init__(self, activities: List[Activity], r_max: int,
-                 start: int = 0, end: int = None, planned_end: int = None):
-        ActivitiesInitializer.init_activities(activities)
-        self._sort_activities_by_id(activities)
+    def __init__(self, activities: Optional[List[Activity]], r_max: int,
+                 start: int = 0, end: int = None, planned_end: int = None,
+                 graph: 'ProjectGraph' = None):
+        """
+        Creates the project from its activities.
+
+        If a graph is given, then the activities must be the ones created from the graph, or
+        None to create them only once they are needed.
+        """
 
-        self.activities = activities
+        # Activities created from a graph are already initialized and sorted
+        if graph is None:
+            ActivitiesInitializer.init_activities(activities)
+            self._sort_activities_by_id(activities)
+
+        self._activities = activities
         self.r_max = r_max
 
         self.start = start
         self.earliest_end = end
         self.planned_end = planned_end
-        self.total_resources_required = self._get_total_resources_required(self.activities)
+        self.total_resources_required = graph.total_resources_required \
+                                        if activities is None else \
+                                        self._get_total_resources_required(activities)
+
+        self.graph = graph
 
-        self.actual_end = None
+        self._positions = None
 
     @classmethod
     def from_file_and_args(cls, data_file_path: str, r_max: int,
@@ -76,7 +115,171 @@ class Project():
 
         return cls(activities, r_max, start, end, planned_end)
 
+    @classmethod
+    def from_binary(cls, binary_file_path: str, r_max: int, start: int = None,
+                    end: int = None, planned_end: int = None, mode: str = "c"):
+        """
+        Overloaded constructor for loading a Project from a binary file created by
+        ProjectGraphFile.
+
+        The arrays of the file are memory-mapped using `mode` (see ProjectGraphFile.load_graph)
+        and kept as the project's graph, no Activity instances are created until they are
+        needed. If the file contains the results of CPM, then the activities have them, and
+        the start and end of the project default to those stored in the file.
+        """
+
+        # NumPy is imported only when a binary file is loaded
+        # pylint: disable=import-outside-toplevel
+        from heuristics.core.graph_file import ProjectGraphFile
+
+        graph_file = ProjectGraphFile(binary_file_path)
+        graph = graph_file.load_graph(mode)
+
+        start = graph_file.proj_start if start is None else start
+        end = graph_file.proj_earliest_end if end is None else end
+
+        return cls(None, r_max, 0 if start is None else start, end, planned_end, graph)
+
+    @property
+    def activities(self) -> List[Activity]:
+        """
+        List of activities sorted by ID.
+
+        The activities of a project backed by a graph are created from the graph when they
+        are first needed, with the results of CPM if the graph has them.
+        """
+
+        if self._activities is None:
+            self._activities = self.graph.to_activities()
+
+        return self._activities
+
+    @activities.setter
+    def activities(self, activities: List[Activity]):
+        self._activities = activities
+        self._positions = None
+
+    @property
+    def has_activities(self) -> bool:
+        """True if the Activity instances of the project have been created."""
+        return self._activities is not None
+
+    @property
+    def num_activities(self) -> int:
+        """Number of activities of the project, which does not create them."""
+        return self.graph.num_activities if self._activities is None else len(self._activities)
+
+    def get_column(self, name: str) -> List[int]:
+        """
+        Returns the values of a property of all activities by their positions
+        (see `columns`).
+
+        The values are read from the activities if they have been created, as they may have
+        been changed, or from the graph otherwise.
+        """
+
+        if name not in self.columns:
+            raise ValueError(f"Unsupported column '{name}'!" +
+                             f"\n Currently, only '{', '.join(self.columns)}' are supported.")
+
+        if self._activities is not None:
+            return [getattr(act, name) for act in self._activities]
+
+        # The activities of the project and of the graph are both sorted by ID
+        values = getattr(self.graph, "durations" if name == "duration" else name)
+
+        return [None] * self.graph.num_activities if values is None else values.tolist()
+
+    def get_predecessors_positions(self) -> List[List[int]]:
+        """Returns the positions of the predecessors of each activity by its position."""
+
+        if self._activities is None:
+            return self._get_csr_lists(self.graph.pred_ptr, self.graph.pred_idx)
+
+        positions = self.positions
+        return [[positions[pred.id] for pred in act.predecessors] for act in self._activities]
+
+    def get_num_predecessors(self) -> List[int]:
+        """Returns the number of predecessors of each activity by its position."""
+
+        if self._activities is None:
+            return (self.graph.pred_ptr[1:] - self.graph.pred_ptr[:-1]).tolist()
+
+        return [len(act.predecessors) for act in self._activities]
+
+    def get_successors_positions(self) -> List[List[int]]:
+        """Returns the positions of the successors of each activity by its position."""
+
+        if self._activities is None:
+            return self._get_csr_lists(self.graph.succ_ptr, self.graph.succ_idx)
+
+        positions = self.positions
+        return [[positions[succ.id] for succ in act.successors] for act in self._activities]
+
+    @property
+    def positions(self) -> Dict[ID, int]:
+        """
+        Positions of activities in the list of activities, keyed by their ID.
+
+        As the activities are sorted by ID, the positions are a topological order of
+        activities. Heuristic methods store their schedules by these positions.
+        """
+
+        if self._positions is None:
+            self._positions = {act.id: pos for pos, act in enumerate(self.activities)}
+
+        return self._positions
+
+    @positions.setter
+    def positions(self, positions: Dict[ID, int]):
+        self._positions = positions
+
+    def copy(self) -> 'Project':
+        """
+        Returns a copy of the project with copies of its activities wired to each other.
+
+        The activities are copied with their current properties, so the copy can be modified
+        (e.g. solved by CPM with different arguments) independently of the original.
+        The graph is not shared with the copy as the CPM engines modify its arrays.
+        """
+
+        # The copied activities are already initialized and sorted
+        project = Project.__new__(Project)
+        project.__dict__.update(self.__dict__)
+        project.activities = self._copy_activities(self.activities)
+        project.graph = None
+
+        return project
+
     ## Private methods
+    @staticmethod
+    def _get_csr_lists(ptr, idx) -> List[List[int]]:
+        """Returns the rows of adjacency in the CSR format as lists."""
+
+        ptr, idx = ptr.tolist(), idx.tolist()
+
+        return [idx[ptr[row]:ptr[row + 1]] for row in range(len(ptr) - 1)]
+
+    @staticmethod
+    def _copy_activities(activities: List[Activity]) -> List[Activity]:
+        """
+        Returns shallow copies of the activities whose predecessors and successors refer to
+        the copies, in the same order.
+        """
+
+        positions = {id(act): position for position, act in enumerate(activities)}
+        copies = []
+        for act in activities:
+            act_copy = Activity.__new__(Activity)
+            act_copy.__dict__.update(act.__dict__)
+            copies.append(act_copy)
+
+        for act, act_copy in zip(activities, copies):
+            act_copy.predecessors = [copies[positions[id(pred)]] for pred in act.predecessors]
+            act_copy.successors = [copies[positions[id(succ)]] for succ in act.successors]
+
+        return copies
+
     @staticmethod
     def _get_total_resources_required(activities: List[Activity]) -> int:
         """Returns the total resources required to complete the project."""
@@ -87,4 +290,4 @@ class Project():
     def _sort_activities_by_id(activities: List[Activity]):
         """Sorts the activities in a list in ascending order according to their ID."""
 
-        activities.sort(key=lambda act_id: act_id.id)
+        activities.sort(key=lambda act: act.id.as_tuple())
@@ -0,0 +1,130 @@
+from contextlib import contextmanager, nullcontext
+import json
+import sys
+from time import perf_counter
+import tracemalloc
+from typing import ContextManager, Dict, Iterator
+
+
+class SolveStats():
+    """
+    Timings and counters collected while solving a project.
+
+    An instance is filled only if it is given to `solve` of CriticalPathMethod or of
+    a heuristic method, so solving without it costs nothing but a few checks per solve and
+    per event. One instance can collect the stats of CPM and of the methods scheduling
+    the project, the values of the phases and counters with the same names are added up.
+
+    For every phase, the wall time and the net number of memory blocks allocated by Python
+    are recorded. If `trace_memory` is True, then the peak memory of every phase is traced
+    by tracemalloc too, which slows the phases down considerably.
+    """
+
+    trace_memory: bool
+    """True if the peak memory of the phases is traced by tracemalloc."""
+
+    phases: Dict[str, float]
+    """Wall time of each phase in seconds, in the order the phases were first run."""
+
+    allocated_blocks: Dict[str, int]
+    """Net number of memory blocks allocated by Python in each phase."""
+
+    peak_memory: Dict[str, int]
+    """Peak memory traced in each phase in bytes, empty unless `trace_memory` is True."""
+
+    counters: Dict[str, int]
+    """
+    Counts of the events of the solve, e.g.:
+    - events - the time points (PHM) or activities (SHM) processed,
+    - resource_checks - the checks of the resources available: one per ready activity (PHM)
+      or one per node or step of the resource profile probed by its searches (SHM),
+    - ready_queue_total - the sum of the sizes of the ready queue over the events.
+    """
+
+    maxima: Dict[str, int]
+    """Max. values observed during the solve, e.g. ready_queue_max."""
+
+    ## Public methods
+    def __init__(self, trace_memory: bool = False):
+        self.trace_memory = trace_memory
+        self.phases = {}
+        self.allocated_blocks = {}
+        self.peak_memory = {}
+        self.counters = {}
+        self.maxima = {}
+
+    @staticmethod
+    def measure(stats: 'SolveStats', phase_name: str) -> ContextManager:
+        """
+        Returns the context measuring the phase in the stats, or an empty context if
+        the stats are None.
+        """
+
+        return nullcontext() if stats is None else stats.phase(phase_name)
+
+    @contextmanager
+    def phase(self, phase_name: str) -> Iterator[None]:
+        """Measures the code run in the context as the phase of the given name."""
+
+        stop_tracing = False
+        if self.trace_memory:
+            if tracemalloc.is_tracing():
+                tracemalloc.reset_peak()
+            else:
+                tracemalloc.start()
+                stop_tracing = True
+
+        num_blocks = sys.getallocatedblocks()
+        time_start = perf_counter()
+        try:
+            yield
+        finally:
+            seconds = perf_counter() - time_start
+            self.phases[phase_name] = self.phases.get(phase_name, 0.0) + seconds
+            self.allocated_blocks[phase_name] = self.allocated_blocks.get(phase_name, 0) + \
+                sys.getallocatedblocks() - num_blocks
+
+            if self.trace_memory:
+                peak_memory = tracemalloc.get_traced_memory()[1]
+                self.peak_memory[phase_name] = max(self.peak_memory.get(phase_name, 0),
+                                                   peak_memory)
+                if stop_tracing:
+                    tracemalloc.stop()
+
+    def count(self, counter_name: str, amount: int = 1):
+        """Adds the amount to the counter."""
+        self.counters[counter_name] = self.counters.get(counter_name, 0) + amount
+
+    def observe(self, maximum_name: str, value: int):
+        """Records the value if it is the highest one of the given name."""
+
+        if value > self.maxima.get(maximum_name, value - 1):
+            self.maxima[maximum_name] = value
+
+    @property
+    def total_seconds(self) -> float:
+        """Total wall time of all phases in seconds."""
+        return sum(self.phases.values())
+
+    def to_dict(self) -> Dict[str, object]:
+        """Returns the stats as a dict of plain values."""
+
+        return {'total_seconds': self.total_seconds, 'phases': dict(self.phases),
+                'allocated_blocks': dict(self.allocated_blocks),
+                'peak_memory': dict(self.peak_memory), 'counters': dict(self.counters),
+                'maxima': dict(self.maxima)}
+
+    def to_json(self) -> str:
+        """Returns the stats as compact JSON."""
+        return json.dumps(self.to_dict(), separators=(",", ":"))
+
+    def to_json_file(self, json_file_path: str):
+        """Writes the stats to a JSON file."""
+
+        with open(json_file_path, "w", encoding="utf-8") as file:
+            json.dump(self.to_dict(), file, indent=2)
+
+    ## Magic methods
+    def __repr__(self) -> str:
+        phases = ", ".join(f"{name}={seconds:.6f}s" for name, seconds in self.phases.items())
+        return f"SolveStats({phases}, counters={self.counters}, maxima={self.maxima})"
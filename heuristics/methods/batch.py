@@ -0,0 +1,296 @@
+from argparse import ArgumentParser, Namespace
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+import csv
+import os
+import sys
+from pathlib import Path
+from typing import Iterable, List, Sequence, TextIO, Tuple, Union
+from heuristics.core.cpm import CriticalPathMethod as CPM
+from heuristics.core.graph_file import ProjectGraphFile
+from heuristics.core.project import Project
+from heuristics.methods.method import HeuristicMethod
+from heuristics.methods import validation
+
+
+class BatchResult():
+    """
+    Compact result of scheduling a single project by a heuristic method.
+
+    Only plain numbers are kept, so results are cheap to send back from worker processes.
+    """
+
+    __slots__ = ("path", "method", "r_max", "makespan", "total_resources", "starts", "error")
+
+    path: str
+    """Path to the data file of the project."""
+
+    method: str
+    """Name of the heuristic method (see BatchSolver.methods)."""
+
+    r_max: int
+    """Max. resources available in a single time unit."""
+
+    makespan: int
+    """The actual end of the project, None if the project failed."""
+
+    total_resources: int
+    """Sum of the resources of all activities over their durations, None if failed."""
+
+    starts: 'array[int]'
+    """
+    The times that activities are scheduled to begin, in ascending order of their IDs.
+    It is empty if the project failed.
+    """
+
+    error: str
+    """Message of the error that made the project fail, None if it succeeded."""
+
+    ## Public methods
+    def __init__(self, path: str, method: str, r_max: int, makespan: int = None,
+                 total_resources: int = None, starts: 'array[int]' = None, error: str = None):
+        self.path = path
+        self.method = method
+        self.r_max = r_max
+        self.makespan = makespan
+        self.total_resources = total_resources
+        self.starts = array("q") if starts is None else starts
+        self.error = error
+
+    @classmethod
+    def from_method(cls, path: str, method_name: str,
+                    method: HeuristicMethod) -> 'BatchResult':
+        """Overloaded constructor for the result of a solved heuristic method."""
+
+        schedule = method.schedule
+
+        return cls(path, method_name, method.r_max, schedule.actual_end,
+                   schedule.project.total_resources_required, array("q", schedule.starts))
+
+    @property
+    def failed(self) -> bool:
+        """True if the project could not be scheduled."""
+        return self.error is not None
+
+    ## Magic methods
+    def __repr__(self) -> str:
+        return (f"BatchResult(path={self.path!r}, method={self.method!r}," +
+                f" r_max={self.r_max}, makespan={self.makespan}, error={self.error!r})")
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, BatchResult):
+            raise NotImplementedError("Determining equality of BatchResult instances failed!" +
+                                      f"\n Cannot compare instances of '{type(self)}' and" +
+                                      f" '{type(other)}'")
+
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+
+class BatchSolver():
+    """
+    Schedules many projects by heuristic methods in parallel.
+
+    Each project is loaded and solved by CPM once, then it is scheduled by all of the methods
+    (see HeuristicMethod.from_cpm). The projects are distributed in chunks among the worker
+    processes of a ProcessPoolExecutor and only compact results (see BatchResult) are sent
+    back, so the throughput scales with the number of processes.
+
+    A project that cannot be loaded or scheduled does not stop the batch, its error is
+    recorded in its results instead.
+    """
+
+    methods = validation.methods
+    """Heuristic methods that can schedule the projects, by their names."""
+
+    method_names: Tuple[str, ...]
+    """Names of the heuristic methods scheduling every project."""
+
+    max_workers: int
+    """
+    Max. number of worker processes, the number of CPUs if None.
+
+    If it is 1, then the projects are scheduled in the calling process.
+    """
+
+    chunksize: int
+    """
+    Number of projects sent to a worker process at once.
+
+    If None, then the projects are split into about four chunks per worker process.
+    """
+
+    profile: str
+    """The name of the resource profile used by the methods (see HeuristicMethod.profiles)."""
+
+    ## Public methods
+    def __init__(self, method_names: Sequence[str] = ("phm",), max_workers: int = None,
+                 chunksize: int = None, profile: str = "tree"):
+        validation.validate_method_names(method_names)
+        HeuristicMethod.validate_profile(profile)
+        validation.validate_positive("BatchSolver", max_workers=max_workers,
+                                     chunksize=chunksize)
+
+        self.method_names = tuple(method_names)
+        self.max_workers = max_workers
+        self.chunksize = chunksize
+        self.profile = profile
+
+    def solve(self, inputs: Union[str, Iterable[str]], r_max: int,
+              pattern: str = "*.csv") -> List[BatchResult]:
+        """
+        Schedules the projects and returns their results, grouped by projects in the order of
+        the inputs and by methods in the order of `method_names`.
+
+        The inputs are either paths to data files, a path to a single data file or
+        a directory, in which case its files matching the pattern are scheduled in the order
+        of their names.
+        """
+
+        paths = self.get_paths(inputs, pattern)
+        tasks = [(path, r_max, self.method_names, self.profile) for path in paths]
+
+        if self.max_workers == 1:
+            results = map(_solve_file, tasks)
+            return [result for file_results in results for result in file_results]
+
+        max_workers = self.max_workers or os.cpu_count() or 1
+        chunksize = self.chunksize or max(1, -(-len(tasks) // (4 * max_workers)))
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(_solve_file, tasks, chunksize=chunksize)
+            return [result for file_results in results for result in file_results]
+
+    @staticmethod
+    def get_paths(inputs: Union[str, Iterable[str]], pattern: str = "*.csv") -> List[str]:
+        """
+        Returns the paths to the data files given by a directory or by the paths themselves.
+
+        A single path to an existing file is a batch of that file.
+        """
+
+        if isinstance(inputs, (str, os.PathLike)):
+            if os.path.isfile(inputs):
+                return [str(inputs)]
+            if not os.path.isdir(inputs):
+                raise NotADirectoryError(f"Directory '{inputs}' does not exist!" +
+                                         "\n Data files must be given as a directory, a path" +
+                                         " to a file or a list of paths.")
+            return sorted(str(path) for path in Path(inputs).glob(pattern) if path.is_file())
+
+        return [str(path) for path in inputs]
+
+    @staticmethod
+    def to_csv_file(results: Iterable[BatchResult], csv_file_path: str = None):
+        """
+        Writes the results to a CSV file, or to the standard output if no path is given.
+
+        The starts of activities are joined by spaces into a single column.
+        """
+
+        if csv_file_path is None:
+            BatchSolver._write_csv(results, sys.stdout)
+            return
+
+        with open(csv_file_path, "w", encoding="utf-8", newline="") as file:
+            BatchSolver._write_csv(results, file)
+
+    ## Private methods
+    @staticmethod
+    def _write_csv(results: Iterable[BatchResult], file: TextIO):
+        """Writes the results to an opened file as CSV."""
+
+        writer = csv.writer(file)
+        writer.writerow(("path", "method", "r_max", "makespan", "total_resources", "starts",
+                         "error"))
+        for result in results:
+            writer.writerow((result.path, result.method, result.r_max, result.makespan,
+                             result.total_resources, " ".join(map(str, result.starts)),
+                             result.error))
+
+    ## Magic methods
+    def __repr__(self) -> str:
+        return (f"BatchSolver(method_names={self.method_names}," +
+                f" max_workers={self.max_workers}, chunksize={self.chunksize}," +
+                f" profile={self.profile!r})")
+
+
+def _solve_file(task: Tuple[str, int, Tuple[str, ...], str]) -> List[BatchResult]:
+    """
+    Loads and schedules a single project by all of the methods in a worker process.
+
+    The task contains the path to the data file, r_max, the names of the methods and
+    the name of the resource profile.
+    """
+
+    path, r_max, method_names, profile = task
+    try:
+        if ProjectGraphFile.is_graph_file(path):
+            project = Project.from_binary(path, r_max)
+        else:
+            project = Project.from_file_and_args(path, r_max)
+
+        cpm = CPM.from_project(project)
+        cpm.solve()
+    except Exception as error:  # pylint: disable=broad-except
+        return [BatchResult(path, method_name, r_max, error=f"{type(error).__name__}: {error}")
+                for method_name in method_names]
+
+    results = []
+    for method_name in method_names:
+        method = BatchSolver.methods[method_name].from_cpm(cpm, r_max, profile)
+        try:
+            method.solve()
+        except Exception as error:  # pylint: disable=broad-except
+            results.append(BatchResult(path, method_name, r_max,
+                                       error=f"{type(error).__name__}: {error}"))
+        else:
+            results.append(BatchResult.from_method(path, method_name, method))
+
+    return results
+
+
+def _parse_arguments(argv: Sequence[str] = None) -> Namespace:
+    """Parses the command-line arguments of the entry point."""
+
+    parser = ArgumentParser(prog="python -m heuristics.methods.batch",
+                            description="Schedules many projects by heuristic methods in" +
+                                        " parallel and writes their results as CSV.")
+    parser.add_argument("inputs", nargs="+",
+                        help="a directory with data files or paths to data files")
+    parser.add_argument("-r", "--r-max", type=int, required=True,
+                        help="max. resources available in a single time unit")
+    parser.add_argument("-m", "--methods", nargs="+", default=["phm"],
+                        choices=list(BatchSolver.methods), help="heuristic methods to use")
+    parser.add_argument("-w", "--workers", type=int, default=None,
+                        help="number of worker processes (default: number of CPUs)")
+    parser.add_argument("-c", "--chunksize", type=int, default=None,
+                        help="number of projects sent to a worker at once")
+    parser.add_argument("-p", "--profile", default="tree",
+                        choices=list(HeuristicMethod.profiles), help="resource profile")
+    parser.add_argument("--pattern", default="*.csv",
+                        help="pattern of data files in a directory (default: *.csv)")
+    parser.add_argument("-o", "--output", default=None,
+                        help="path to the CSV file with results (default: standard output)")
+
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str] = None) -> int:
+    """
+    Entry point scheduling the projects given on the command line.
+
+    Returns 1 if any project failed, 0 otherwise.
+    """
+
+    args = _parse_arguments(argv)
+    inputs = args.inputs[0] if len(args.inputs) == 1 and os.path.isdir(args.inputs[0]) \
+             else args.inputs
+
+    solver = BatchSolver(args.methods, args.workers, args.chunksize, args.profile)
+    results = solver.solve(inputs, args.r_max, args.pattern)
+    BatchSolver.to_csv_file(results, args.output)
+
+    return int(any(result.failed for result in results))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,171 @@
+import json
+from pathlib import Path
+from typing import Iterator, List, Sequence, TextIO, TYPE_CHECKING
+from heuristics.core.activities.activity import Activity
+
+if TYPE_CHECKING:
+    from heuristics.methods.method import HeuristicMethod
+
+
+class ScheduleExporter():
+    """
+    Exporter of the time frames of scheduled activities to files.
+
+    The following formats are supported:
+    - "gantt" - pretty-printed JSON read by Gantt (default).
+    - "json" - the same JSON in a compact form, which Gantt reads too.
+    - "ndjson" - newline-delimited JSON with one time frame per line.
+    - "npz" - columnar NumPy arrays of the start and end nodes of activities, their starts,
+      ends and resources, see `columns`.
+
+    Except for "gantt", the time frames are streamed to a buffered file in blocks, so no
+    list of dicts is built and the memory does not grow with the number of activities.
+    """
+
+    formats = ("gantt", "json", "ndjson", "npz")
+    """Formats the schedule can be exported to."""
+
+    columns = ("start_nodes", "end_nodes", "starts", "ends", "resources")
+    """Names of the arrays of the "npz" format."""
+
+    block_size: int = 65536
+    """Number of time frames formatted before they are written to the file at once."""
+
+    buffer_size: int = 1024 * 1024
+    """Size of the buffer of the written file in bytes."""
+
+    title: str
+    """Title of the Gantt chart."""
+
+    activities: List[Activity]
+    """The scheduled activities sorted by their IDs."""
+
+    starts: Sequence[int]
+    """The times that activities are scheduled to begin."""
+
+    ends: Sequence[int]
+    """The times that activities are scheduled to end."""
+
+    ## Public methods
+    def __init__(self, title: str, activities: List[Activity], starts: Sequence[int],
+                 ends: Sequence[int]):
+        self.title = title
+        self.activities = activities
+        self.starts = starts
+        self.ends = ends
+
+    @classmethod
+    def from_method(cls, method: 'HeuristicMethod', method_name: str,
+                    act_timeframe_type: str = "cpm") -> 'ScheduleExporter':
+        """
+        Overloaded constructor for exporting the schedule produced by a heuristic method, or
+        the one determined by CPM if the time frame type is "cpm".
+        """
+
+        activities = method.cpm.project.activities
+        if act_timeframe_type == "cpm":
+            starts = [act.earliest_start for act in activities]
+            ends = [act.earliest_end for act in activities]
+        else:
+            starts, ends = method.schedule.starts, method.schedule.ends
+
+        return cls(f"{method_name} - Gantt chart", activities, starts, ends)
+
+    def to_file(self, file_path: str, export_format: str = "gantt") -> str:
+        """
+        Writes the schedule to a file in the given format and returns the path to the file.
+        """
+
+        if export_format not in self.formats:
+            raise ValueError(f"Unsupported export format '{export_format}'!" +
+                             f"\n Currently, only '{', '.join(self.formats)}' are supported.")
+
+        if export_format == "npz":
+            self._write_npz(file_path)
+            return file_path
+
+        with open(file_path, "w", encoding="utf-8", buffering=self.buffer_size) as file:
+            if export_format == "gantt":
+                self._write_gantt(file)
+            elif export_format == "json":
+                self._write_json(file)
+            else:
+                self._write_ndjson(file)
+
+        return file_path
+
+    def iter_time_frames(self) -> Iterator[str]:
+        """Yields the time frames of activities as compact JSON objects."""
+
+        for act, start, end in zip(self.activities, self.starts, self.ends):
+            yield (f'{{"label":"{act.id}","start":{"null" if start is None else start},' +
+                   f'"end":{"null" if end is None else end},"resource":{act.resources}}}')
+
+    ## Private methods
+    def _write_gantt(self, file: TextIO):
+        """Writes the schedule as pretty-printed JSON."""
+
+        packages = [{'label': str(act.id), 'start': start, 'end': end,
+                     'resource': act.resources}
+                    for act, start, end in zip(self.activities, self.starts, self.ends)]
+        data = {'packages': packages, "title" : self.title, "xlabel" : "Time",
+                "ylabel" : "Activity"}
+
+        json.dump(data, file, indent=2)
+
+    def _write_json(self, file: TextIO):
+        """Writes the schedule as compact JSON with the same keys as the "gantt" format."""
+
+        file.write('{"packages":[')
+        self._write_blocks(file, (time_frame if idx == 0 else "," + time_frame
+                                  for idx, time_frame in enumerate(self.iter_time_frames())))
+        file.write(f'],"title":{json.dumps(self.title)},"xlabel":"Time","ylabel":"Activity"}}')
+
+    def _write_ndjson(self, file: TextIO):
+        """Writes the time frames as newline-delimited JSON."""
+
+        self._write_blocks(file, (time_frame + "\n" for time_frame in self.iter_time_frames()))
+
+    def _write_blocks(self, file: TextIO, pieces: Iterator[str]):
+        """Writes the pieces of text to the file in blocks of `block_size` pieces."""
+
+        block: List[str] = []
+        for piece in pieces:
+            block.append(piece)
+            if len(block) == self.block_size:
+                file.write("".join(block))
+                block.clear()
+
+        file.write("".join(block))
+
+    def _write_npz(self, file_path: str):
+        """
+        Writes the columns of the schedule as uncompressed NumPy arrays.
+
+        Unscheduled activities have the start and end -1.
+        """
+
+        # NumPy is imported only when the schedule is exported to arrays
+        # pylint: disable=import-outside-toplevel
+        import numpy as np
+
+        num_acts = len(self.activities)
+        arrays = {
+            'start_nodes': np.fromiter((act.id.start_node for act in self.activities),
+                                       np.int64, num_acts),
+            'end_nodes': np.fromiter((act.id.end_node for act in self.activities),
+                                     np.int64, num_acts),
+            'starts': np.fromiter((-1 if start is None else start for start in self.starts),
+                                  np.int64, num_acts),
+            'ends': np.fromiter((-1 if end is None else end for end in self.ends),
+                                np.int64, num_acts),
+            'resources': np.fromiter((act.resources for act in self.activities),
+                                     np.int64, num_acts)}
+
+        # The file object keeps the path as it is, while NumPy appends the suffix to a path
+        with open(Path(file_path), "wb") as file:
+            np.savez(file, **arrays)
+
+    ## Magic methods
+    def __repr__(self) -> str:
+        return f"ScheduleExporter(title={self.title!r}, activities={len(self.activities)})"
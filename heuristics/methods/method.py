@@ -1,20 +1,61 @@
-import json
-from typing import  List
-from heuristics.core.activities.activity import Activity
+from typing import  List, Union
+from heuristics.core.cache import ProjectCache
 from heuristics.core.cpm import CriticalPathMethod as CPM
+from heuristics.core.project import Project
+from heuristics.core.stats import SolveStats
+from heuristics.methods.export import ScheduleExporter
+from heuristics.methods.resource_profile import ResourceProfile
+from heuristics.methods.schedule import Schedule
+from heuristics.methods.skyline_profile import SkylineProfile
 
 
 class HeuristicMethod():
     """
     Base class for heuristic methods that provides common functionalities.
+
+    Methods that share a ProjectCache parse the same data file only once, each of them
+    schedules its own copy of the project.
+
+    The project is not modified by scheduling, the results are stored in a Schedule instead.
+    Therefore, many methods can schedule a single project (see `from_cpm`), each with its
+    own r_max.
+
+    The resources available in each time unit are stored in one of the following profiles:
+    - "tree" - a segment tree with one leaf per time unit, see ResourceProfile (default).
+    - "skyline" - the breakpoints where the resources available change, see SkylineProfile.
+      It suits projects with long time horizons, as its memory and cost depend on the number
+      of activities rather than on the number of time units.
+    Both profiles produce the same schedules.
     """
 
+    profiles = {"tree": ResourceProfile, "skyline": SkylineProfile}
+    """Profiles that can store the resources available, by their names."""
+
+    _method_name: str = "Heuristic Method"
+    """Name of the heuristic method."""
+
     cpm: CPM
     """
     CriticalPathMethod instance used in the initialization of the method.
     """
 
-    available_resources: List[int]
+    r_max: int
+    """
+    Max. resources available for all activities in a single time unit.
+
+    It is the r_max of the project unless specified otherwise.
+    """
+
+    schedule: Schedule
+    """The schedule produced by the method. It is None until the method is solved."""
+
+    stats: SolveStats
+    """The stats collected by the last solve, None if they were not collected."""
+
+    profile: str
+    """The name of the profile storing the resources available."""
+
+    resource_profile: Union[ResourceProfile, SkylineProfile]
     """
     Resources available in each point in time.
 
@@ -23,52 +64,125 @@ class HeuristicMethod():
     completed.
     """
 
+    ## Private properties
+    _durations: List[int]
+    """Durations of activities by their positions, read when the solution is initialized."""
+
+    _resources: List[int]
+    """Resources of activities by their positions, read when the solution is initialized."""
+
     ## Public methods
-    def __init__(self, acts_file_path, r_max: int):
-        self.cpm = CPM(acts_file_path, r_max)
+    def __init__(self, acts_file_path, r_max: int, project_cache: ProjectCache = None,
+                 profile: str = "tree"):
+        self.cpm = CPM(acts_file_path, r_max, project_cache=project_cache)
+        self.r_max = r_max
+
+        self._init_resource_profile(profile)
+        self.schedule = None
+        self.stats = None
 
-        self.available_resources = []
+    @classmethod
+    def from_cpm(cls, cpm: CPM, r_max: int = None, profile: str = "tree") -> 'HeuristicMethod':
+        """
+        Overloaded constructor for scheduling the project of an existing CriticalPathMethod
+        instance.
+
+        The project is only read by the method, so many methods can share the instance.
+        If the instance is not solved, then it is solved by the first method.
+        """
+
+        method = cls.__new__(cls)
+        method.cpm = cpm
+        method.r_max = cpm.project.r_max if r_max is None else r_max
+
+        method._init_resource_profile(profile)
+        method.schedule = None
+        method.stats = None
+
+        return method
+
+    @classmethod
+    def from_project(cls, project: Project, r_max: int = None,
+                     profile: str = "tree") -> 'HeuristicMethod':
+        """
+        Overloaded constructor for scheduling an already loaded Project.
+
+        To schedule one project by many methods, solve its CriticalPathMethod once and use
+        `from_cpm` instead.
+        """
+
+        return cls.from_cpm(CPM.from_project(project), r_max, profile)
+
+    @classmethod
+    def validate_profile(cls, profile: str):
+        """Validates that the resource profile of the given name is supported."""
+
+        if profile not in cls.profiles:
+            raise ValueError(f"Unsupported resource profile '{profile}'!" +
+                             f"\n Currently, only '{', '.join(cls.profiles)}' are supported.")
+
+    @property
+    def available_resources(self) -> List[int]:
+        """Resources available in each point in time as a list."""
+        return self.resource_profile.to_list()
 
     ## Private methods
+    def _init_solution(self, stats: SolveStats = None):
+        """
+        Solves the project using CPM if it has not been solved yet and prepares an empty
+        schedule.
+
+        The durations and resources of activities are read as columns of the project, so
+        the activities of a project backed by a graph are not created.
+
+        If stats are given, then they are kept for the solve and the phases are measured in
+        them.
+        """
+
+        self.stats = stats
+        if not self.cpm.solved:
+            self.cpm.solve(stats)
+
+        with SolveStats.measure(stats, "init"):
+            self._init_resource_profile(self.profile)
+            self.schedule = Schedule(self.cpm.project, self._method_name)
+            self._durations = self.cpm.project.get_column("duration")
+            self._resources = self.cpm.project.get_column("resources")
+
+    def _init_resource_profile(self, profile: str):
+        """Initializes an empty profile of the given name with all resources available."""
+
+        self.validate_profile(profile)
+
+        self.profile = profile
+        self.resource_profile = self.profiles[profile](self.r_max)
+
     def _init_missing_available_resources_until(self, time_end: int):
         """Initialize missing available resources until a given time point."""
 
-        desired_num_time_points = time_end + 1
-        actual_num_time_points = len(self.available_resources)
-        missing_time_points = desired_num_time_points - actual_num_time_points
-        if missing_time_points > 0:
-            self.available_resources.extend([self.cpm.project.r_max] * missing_time_points)
+        self.resource_profile.extend_until(time_end)
 
-    def _schedule_activity_from(self, act: Activity, start_time: int):
+    def _schedule_activity_from(self, position: int, start_time: int):
         """
-        Schedules an activity from a given time point.
+        Schedules the activity at the given position from a given time point.
 
         If an activity is scheduled from 0 to 4, then it is finished at 4.
         """
 
-        act.actual_start = start_time
-        act.actual_end = act.actual_start + act.duration
-
-        for time in range(act.actual_start, act.actual_end):
-            self.available_resources[time] -= act.resources
-
-    def _get_project_actual_end(self) -> int:
-        """Returns the actual project end according to the heuristic method."""
-
-        return max(act.actual_end for act in self.cpm.project.activities)
+        self.schedule.schedule_activity(position, start_time, self._durations[position])
+        self.resource_profile.add(start_time, self.schedule.ends[position],
+                                  -self._resources[position])
 
     def _activities_schedule_to_json_file(self, method_name: str,
                                           act_timeframe_type: str = "cpm",
                                           json_file_path: str = \
-                                            "cpm_activities_schedule.json") -> str:
-        """Save the activities schedule produced by the heuristic method to a JSON file."""
-
-        data = {'packages': [], "title" : f"{method_name} - Gantt chart", "xlabel" : "Time",
-                "ylabel" : "Activity"}
-        for activity in self.cpm.project.activities:
-            data['packages'].append(activity.get_time_frame(act_timeframe_type))
+                                            "cpm_activities_schedule.json",
+                                          export_format: str = "gantt") -> str:
+        """
+        Save the activities schedule produced by the heuristic method to a file in the given
+        format (see ScheduleExporter.formats).
+        """
 
-        with open(json_file_path, 'w', encoding='utf-8') as file:
-            json.dump(data, file, indent=2)
+        exporter = ScheduleExporter.from_method(self, method_name, act_timeframe_type)
 
-        return json_file_path
+        return exporter.to_file(json_file_path, export_format)
@@ -1,6 +1,12 @@
-from typing import List
-from heuristics.core.activities.activity import Activity
+from heapq import heapify, heappop, heappush
+from typing import Iterator, List, Tuple, TYPE_CHECKING
+from heuristics.core.activities.activity_id import ActivityID as ID
+from heuristics.core.stats import SolveStats
 from heuristics.methods.method import HeuristicMethod
+from heuristics.methods.schedule import Schedule
+
+if TYPE_CHECKING:
+    from heuristics.methods.priority_rules import PriorityRule
 
 class ParallelHeuristicMethod(HeuristicMethod):
     """
@@ -16,58 +22,155 @@ class ParallelHeuristicMethod(HeuristicMethod):
     according to their IDs
     Starting with the lowest TR value, the method schedules as many activities in the time
     unit as possible before moving to the next time unit.
+
+    The method is event-driven: it moves only between the time units when an activity
+    finishes. The number of unfinished predecessors of each activity is tracked, so
+    an activity enters the ready queue (ordered by priority and ID) when its last predecessor
+    finishes. The running activities are kept in a min-heap of their finish times.
+
+    Other priorities can be used by setting a priority rule (see `priority_rule`), and
+    a project can be scheduled by many rules at once by PriorityRulePortfolio.
+    """
+
+    _method_name: str = "Parallel Heuristic Method (PHM)"
+
+    priority_rule: 'PriorityRule' = None
+    """
+    Rule determining the priorities of activities, the time reserves are used if None.
+
+    PHMDP ignores the rule as its priorities are dynamic.
+    """
+
+    ## Private properties
+    _ready: List[Tuple[Tuple, int]]
     """
+    Min-heap of activities whose predecessors have finished, but that are not scheduled yet.
 
-    __method_name: str = "Parallel Heuristic Method (PHM)"
+    The items are the ordering keys (see `_get_ordering_key`) and positions of activities.
+    """
+
+    _running: List[Tuple[int, int]]
+    """Min-heap of the finish times and positions of scheduled unfinished activities."""
+
+    _num_unfinished_preds: List[int]
+    """Number of unfinished predecessors of each activity by its position."""
+
+    _succ_positions: List[List[int]]
+    """Positions of successors of each activity by its position."""
 
     ## Public methods
-    def solve(self):
-        """
-        Solves the activity dependency problem with resources and time reserves as priorities.
+    def solve(self, stats: SolveStats = None) -> Schedule:
         """
+        Solves the activity dependency problem with resources and time reserves as priorities
+        and returns the schedule.
 
-        self.cpm.solve()
-
-        self._init_activity_priorities()
+        If stats are given, then the phases of the method are measured in them
+        (see SolveStats). Every activity popped from the ready queue is checked against
+        the resource profile once, so the resource checks of an event are the size of
+        the queue.
+        """
 
-        time = 0
-        while self._unfinished_activities_exist(time):
-            self._update_priorities(time)
+        for _ in self._iter_events(stats):
+            pass
 
-            viable_activities = self._get_viable_activities(time)
+        return self.schedule
 
-            if len(viable_activities) > 0:
-                self._sort_by_priority_and_id(viable_activities)
+    def solve_iter(self, stats: SolveStats = None) -> Iterator[Tuple[ID, int, int]]:
+        """
+        Solves the activity dependency problem like `solve`, but yields the ID, start and end
+        of each activity as soon as it is scheduled.
 
-                for act in viable_activities:
-                    if not self._resources_exceeded(act, time, time + act.duration):
-                        self._schedule_activity_from(act, time)
+        The activities are yielded in ascending order of their starts, as the method never
+        schedules an activity before the time it has reached. Once all activities are
+        yielded, the schedule is complete (see `schedule`). Closing the generator early
+        cancels the solve and leaves the schedule incomplete.
 
-            time = self._get_time_next_act_finish(time)
+        If stats are given, then the scheduling phase includes the time spent by the consumer
+        of the generator.
+        """
 
-        self.cpm.project.actual_end = self._get_project_actual_end()
+        activities = self.cpm.project.activities
+        for positions in self._iter_events(stats):
+            starts, ends = self.schedule.starts, self.schedule.ends
+            for position in positions:
+                yield activities[position].id, starts[position], ends[position]
 
     def activities_schedule_to_json_file(self,
-                                         method_name: str = __method_name,
+                                         method_name: str = _method_name,
                                          act_timeframe_type: str = "phm",
                                          json_file_path: str = \
-                                            "phm_activities_schedule.json") -> str:
-        """Save the activities schedule produced by PHM to a JSON file."""
+                                            "phm_activities_schedule.json",
+                                         export_format: str = "gantt") -> str:
+        """
+        Save the activities schedule produced by PHM to a file, by default as JSON read by
+        Gantt (see ScheduleExporter.formats).
+        """
 
         return super()._activities_schedule_to_json_file(method_name,
                                                          act_timeframe_type,
-                                                         json_file_path=json_file_path)
+                                                         json_file_path=json_file_path,
+                                                         export_format=export_format)
 
     ## Private methods
+    def _iter_events(self, stats: SolveStats = None) -> Iterator[List[int]]:
+        """
+        Solves the problem event by event and yields the positions of the activities
+        scheduled at each event.
+        """
+
+        self._init_solution(stats)
+
+        with SolveStats.measure(stats, "priorities"):
+            self._init_activity_priorities()
+            self._init_events()
+
+        with SolveStats.measure(stats, "scheduling"):
+            num_unfinished_acts = len(self.schedule)
+            time = 0
+            while num_unfinished_acts > 0:
+                self._update_priorities(time)
+
+                if stats is not None:
+                    self._record_event(stats)
+                scheduled_positions = self._schedule_ready_activities(time)
+                if scheduled_positions:
+                    yield scheduled_positions
+
+                # Activities with zero duration scheduled at `time` also finish at `time`
+                num_finished_acts = self._finish_activities_until(time)
+                if self._running:
+                    next_time = self._running[0][0]
+                    num_finished_acts += self._finish_activities_until(next_time)
+                elif num_finished_acts > 0:
+                    # The successors of the finished activities can start at `time`
+                    next_time = time
+                else:
+                    raise RuntimeError(f"Solving {self._method_name} failed!" +
+                                       f"\n Activities cannot be scheduled at time '{time}'" +
+                                       " as they require more resources than available or" +
+                                       " their predecessors never finish.")
+
+                num_unfinished_acts -= num_finished_acts
+                time = next_time
+
+        with SolveStats.measure(stats, "finalize"):
+            self._materialize_priorities()
+            self.schedule.actual_end = self.schedule.get_actual_end()
+
     def _init_activity_priorities(self):
         """
         Initializes the priority of each activity.
 
-        In the context of the PHM, the priority of an activity is equal to its time reserve.
+        In the context of the PHM, the priority of an activity is equal to its time reserve,
+        unless a priority rule is set.
         """
 
-        for act in self.cpm.project.activities:
-            act.priority = act.time_reserve
+        if self.priority_rule is not None:
+            self.schedule.priorities[:] = self.priority_rule.get_project_priorities(
+                self.cpm.project)
+            return
+
+        self.schedule.priorities[:] = self.cpm.project.get_column("time_reserve")
 
     def _update_priorities(self, time: int):
         """
@@ -77,76 +180,103 @@ class ParallelHeuristicMethod(HeuristicMethod):
         this method with its dynamic updating of priorities.
         """
 
-    def _unfinished_activities_exist(self, time: int) -> bool:
-        """Returns True if there are unfinished activities at a given time."""
+    def _materialize_priorities(self):
+        """
+        Does nothing for PHM as its priorities are set during initialization.
 
-        return any(not act.is_finished(time) for act in self.cpm.project.activities)
+        It serves as a placeholder for the implementation of PHMDP, which computes its dynamic
+        priorities only once they are read.
+        """
 
-    def _get_viable_activities(self, start_time: int) -> List[Activity]:
+    def _init_events(self):
         """
-        Returns activities that can be scheduled from a given `start_time` while adhering
-        to dependencies and resources available.
+        Initializes the counters of unfinished predecessors, the ready queue with activities
+        without predecessors and an empty heap of running activities.
         """
 
-        unscheduled_activities = [act for act in self.cpm.project.activities \
-                                  if not act.is_scheduled()]
-        viable_activities = []
-        for act in unscheduled_activities:
-            if self._activity_is_viable(act, start_time):
-                viable_activities.append(act)
+        project = self.cpm.project
 
-        return viable_activities
+        self._num_unfinished_preds = project.get_num_predecessors()
+        self._succ_positions = project.get_successors_positions()
+        self._ready = [(self._get_ordering_key(position), position)
+                       for position, num_preds in enumerate(self._num_unfinished_preds)
+                       if num_preds == 0]
+        heapify(self._ready)
+        self._running = []
 
-    def _activity_is_viable(self, act: Activity, start_time: int) -> bool:
+    def _get_ordering_key(self, position: int) -> Tuple:
         """
-        Returns True if the given activity is viable for scheduling.
+        Returns the key ordering the activity at the given position in the ready queue.
 
-        An activity is considered viable for scheduling if all its predecessors have
-        completed, and scheduling it from the specified `start_time` would not exceed
-        the available resources during its executing time.
+        Activities with lower keys are scheduled first. In the context of the PHM, the key is
+        the priority of the activity. If two activities have the same priority, then they
+        are ordered according to their ids, which is the order of their positions.
         """
 
-        if not self._predecessors_finished(act, start_time):
-            return False
+        return (self.schedule.priorities[position],)
 
-        tentative_act_end = start_time + act.duration
-        self._init_missing_available_resources_until(tentative_act_end)
+    def _schedule_ready_activities(self, time: int) -> List[int]:
+        """
+        Schedules as many activities from the ready queue as possible from the given time in
+        the order of their keys and returns their positions.
 
-        if self._resources_exceeded(act, start_time, tentative_act_end):
-            return False
+        Activities that cannot be scheduled due to resources are returned to the queue.
+        """
 
-        return True
+        unscheduled_items, scheduled_positions = [], []
+        while self._ready:
+            item = heappop(self._ready)
+            position = item[1]
 
-    def _predecessors_finished(self, act:Activity, time: int):
-        """Returns True if all predecessors of the given activity have finished."""
+            tentative_act_end = time + self._durations[position]
+            self._init_missing_available_resources_until(tentative_act_end)
 
-        return all(pred.is_finished(time) for pred in act.predecessors)
+            if self._resources_exceeded(position, time, tentative_act_end):
+                unscheduled_items.append(item)
+            else:
+                self._schedule_activity_from(position, time)
+                heappush(self._running, (tentative_act_end, position))
+                scheduled_positions.append(position)
 
-    @staticmethod
-    def _sort_by_priority_and_id(activities: List[Activity]):
-        """
-        Sorts the given list of activities in ascending order by their priority and id.
+        # The items were popped in order, so the list is a valid heap
+        self._ready = unscheduled_items
 
-        Lower priority is better.
+        return scheduled_positions
 
-        Specifically, if two activities have the same priority, then they are sorted
-        according to their ids.
+    def _finish_activities_until(self, time: int) -> int:
         """
+        Finishes the running activities that end at the given time or earlier and adds
+        their successors whose predecessors have all finished to the ready queue.
 
-        activities.sort(key=lambda act: (act.priority, act.id))
-
-    def _resources_exceeded(self, act: Activity, start_time: int, end_time: int) -> bool:
-        """
-        Returns True if the available resources would be exceeded between `start_time`
-        and `end_time` (excluding the `end_time`).
+        Returns the number of finished activities.
         """
 
-        return any(act.resources > self.available_resources[time] \
-                   for time in range(start_time, end_time))
+        num_finished_acts = 0
+        while self._running and self._running[0][0] <= time:
+            _, position = heappop(self._running)
+            num_finished_acts += 1
+
+            for succ_position in self._succ_positions[position]:
+                self._num_unfinished_preds[succ_position] -= 1
+                if self._num_unfinished_preds[succ_position] == 0:
+                    heappush(self._ready, (self._get_ordering_key(succ_position),
+                                           succ_position))
+
+        return num_finished_acts
 
-    def _get_time_next_act_finish(self, time: int) -> int:
-        """Returns the time when the next activity finishes."""
+    def _record_event(self, stats: SolveStats):
+        """Records an event and the size of the ready queue in the stats."""
+
+        num_ready = len(self._ready)
+        stats.count("events")
+        stats.count("resource_checks", num_ready)
+        stats.count("ready_queue_total", num_ready)
+        stats.observe("ready_queue_max", num_ready)
+
+    def _resources_exceeded(self, position: int, start_time: int, end_time: int) -> bool:
+        """
+        Returns True if the available resources would be exceeded by the activity at the given
+        position between `start_time` and `end_time` (excluding the `end_time`).
+        """
 
-        return min((act.actual_end for act in self.cpm.project.activities \
-                   if act.is_scheduled() and not act.is_finished(time)),
-                   default=self.cpm.project.start)
+        return not self.resource_profile.fits(start_time, end_time, self._resources[position])
@@ -1,3 +1,4 @@
+from typing import List, Tuple
 from heuristics.methods.phm import ParallelHeuristicMethod as PHM
 
 class ParallelHeuristicMethodDynamicPriorities(PHM):
@@ -14,30 +15,77 @@ class ParallelHeuristicMethodDynamicPriorities(PHM):
     according to their IDs.
     Starting with the lowest priority value, the method schedules as many activities in the time
     unit as possible before moving to the next time unit.
+
+    As the same time is subtracted from the LS of every activity, the ready queue of PHM is
+    ordered by the LS and the priorities are computed only once the project is solved.
+    Therefore, moving to the next time unit does not cost time proportional to the number of
+    activities.
     """
 
     _method_name: str = "Parallel Heuristic Method with Dynamic Priorities (PHMDP)"
 
+    ## Private properties
+    _priorities_time: int
+    """
+    The time of the last update of the priorities.
+
+    Subtracting the same time from the latest start of every activity does not change their
+    order, so the ready queue is ordered by the latest start and the priorities are computed
+    from this time only once they are read (see `_materialize_priorities`).
+    """
+
+    _latest_starts: List[int]
+    """Latest starts of activities by their positions."""
+
     ## Public methods
     def activities_schedule_to_json_file(self,
                                          method_name: str = _method_name,
                                          act_timeframe_type: str = "phmdp",
                                          json_file_path: str = \
-                                            "phmdp_activities_schedule.json") -> str:
-        """Save the activities schedule produced by PHMDP to a JSON file."""
+                                            "phmdp_activities_schedule.json",
+                                         export_format: str = "gantt") -> str:
+        """
+        Save the activities schedule produced by PHMDP to a file, by default as JSON read by
+        Gantt (see ScheduleExporter.formats).
+        """
 
         return super()._activities_schedule_to_json_file(method_name,
                                                          act_timeframe_type,
-                                                         json_file_path=json_file_path)
+                                                         json_file_path=json_file_path,
+                                                         export_format=export_format)
 
     ## Private methods
     def _init_activity_priorities(self):
         """
         Override the method in PHM to avoid initializing activities without
         time.
+
+        Only the latest starts of activities are read, as the priorities are computed from
+        them.
         """
 
+        self._latest_starts = self.cpm.project.get_column("latest_start")
+        self._priorities_time = 0
+
+    def _get_ordering_key(self, position: int) -> Tuple:
+        """
+        Override the method in PHM to order the ready queue by the latest start.
+
+        The priority `latest_start - time` of every activity is shifted by the same `time`, so
+        the latest start orders the activities the same way at any time.
+        """
+
+        return (self._latest_starts[position],)
+
     def _update_priorities(self, time: int):
-        """Override the method in PHM to update the priorities dynamically."""
-        for act in self.cpm.project.activities:
-            act.priority = act.latest_start - time
+        """
+        Override the method in PHM to update the priorities dynamically.
+
+        Only the time is recorded, so an update takes constant time.
+        """
+        self._priorities_time = time
+
+    def _materialize_priorities(self):
+        """Override the method in PHM to compute the priorities at the last update."""
+        self.schedule.priorities[:] = [latest_start - self._priorities_time
+                                       for latest_start in self._latest_starts]
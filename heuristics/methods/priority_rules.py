@@ -0,0 +1,481 @@
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Sequence, Tuple, TYPE_CHECKING, Union
+from heuristics.core.cpm import CriticalPathMethod as CPM
+from heuristics.core.project import Project
+from heuristics.methods.method import HeuristicMethod
+from heuristics.methods.phm import ParallelHeuristicMethod as PHM
+from heuristics.methods.schedule import Schedule
+from heuristics.methods.validation import validate_positive
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# NumPy is imported by the functions that use it, so importing this module stays cheap
+# pylint: disable=import-outside-toplevel
+
+
+class PriorityKeys():
+    """
+    Columns of the activities of a project solved by CPM that priority rules are computed
+    from.
+
+    The columns are gathered in a single pass over the activities, so any number of rules
+    can be computed from them by vectorized operations. The i-th element of each column
+    belongs to the activity at the i-th position of the project (see Project.positions).
+    """
+
+    durations: 'np.ndarray'
+    """Durations of the activities."""
+    resources: 'np.ndarray'
+    """Resources required for the activities in a single time unit."""
+    latest_start: 'np.ndarray'
+    """Latest starts of the activities."""
+    latest_end: 'np.ndarray'
+    """Latest ends of the activities."""
+    time_reserve: 'np.ndarray'
+    """Time reserves of the activities."""
+
+    succ_ptr: 'np.ndarray'
+    """Offsets of the successors of each activity in `succ_idx`."""
+    succ_idx: 'np.ndarray'
+    """Positions of the successors of all activities."""
+
+    columns = ("durations", "resources", "latest_start", "latest_end", "time_reserve")
+    """Names of the columns gathered from the activities."""
+
+    ## Public methods
+    def __init__(self, durations: 'np.ndarray', resources: 'np.ndarray',
+                 latest_start: 'np.ndarray', latest_end: 'np.ndarray',
+                 time_reserve: 'np.ndarray', succ_ptr: 'np.ndarray', succ_idx: 'np.ndarray'):
+        self.durations = durations
+        self.resources = resources
+        self.latest_start = latest_start
+        self.latest_end = latest_end
+        self.time_reserve = time_reserve
+        self.succ_ptr = succ_ptr
+        self.succ_idx = succ_idx
+
+    @classmethod
+    def from_project(cls, project: Project) -> 'PriorityKeys':
+        """
+        Overloaded constructor for gathering the columns from the activities of a project
+        solved by CPM.
+
+        The columns of a project backed by a graph without activities are taken from
+        the arrays of the graph, so no activities are created.
+        """
+
+        import numpy as np
+
+        if not project.has_activities:
+            graph = project.graph
+            return cls(*(getattr(graph, name).astype(np.int64)
+                         for name in ("durations", "resources", "latest_start", "latest_end",
+                                      "time_reserve", "succ_ptr", "succ_idx")))
+
+        activities = project.activities
+        positions = project.positions
+        num_acts = len(activities)
+
+        values = np.fromiter((value for act in activities
+                              for value in (act.duration, act.resources, act.latest_start,
+                                            act.latest_end, act.time_reserve)),
+                             dtype=np.int64, count=len(cls.columns) * num_acts)
+        columns = values.reshape(num_acts, len(cls.columns)).T
+
+        succ_ptr = np.zeros(num_acts + 1, dtype=np.int64)
+        succ_ptr[1:] = np.cumsum(np.fromiter((len(act.successors) for act in activities),
+                                             dtype=np.int64, count=num_acts))
+        succ_idx = np.fromiter((positions[succ.id] for act in activities
+                                for succ in act.successors),
+                               dtype=np.int64, count=succ_ptr[-1])
+
+        return cls(*columns, succ_ptr, succ_idx)
+
+    def get_successors_durations(self) -> 'np.ndarray':
+        """Returns the sum of the durations of the immediate successors of each activity."""
+
+        import numpy as np
+
+        sums = np.zeros(len(self.succ_idx) + 1, dtype=np.int64)
+        np.cumsum(self.durations[self.succ_idx], out=sums[1:])
+
+        return sums[self.succ_ptr[1:]] - sums[self.succ_ptr[:-1]]
+
+    def get_num_total_successors(self) -> List[int]:
+        """
+        Returns the number of all direct and indirect successors of each activity.
+
+        The activities of a project are in a topological order, so the successors of each
+        activity are collected as a bit set from those of its immediate successors in
+        the reverse order. The bit set of an activity is dropped once all of its
+        predecessors are visited.
+
+        Unlike the columns, the bit sets cannot be combined by vectorized operations, so
+        they are computed over plain lists and a list is returned. The bit sets grow with
+        the number of activities, so the work is quadratic in it and on large projects it
+        takes longer than scheduling the project by PHM.
+        """
+
+        succ_ptr, succ_idx = self.succ_ptr.tolist(), self.succ_idx.tolist()
+        num_acts = len(succ_ptr) - 1
+        num_unvisited_preds = [0] * num_acts
+        for succ_position in succ_idx:
+            num_unvisited_preds[succ_position] += 1
+
+        successors: Dict[int, int] = {}
+        num_successors = [0] * num_acts
+        for position in range(num_acts - 1, -1, -1):
+            mask = 0
+            for succ_position in succ_idx[succ_ptr[position]:succ_ptr[position + 1]]:
+                mask |= successors[succ_position] | (1 << succ_position)
+                num_unvisited_preds[succ_position] -= 1
+                if num_unvisited_preds[succ_position] == 0:
+                    del successors[succ_position]
+
+            if num_unvisited_preds[position] > 0:
+                successors[position] = mask
+            num_successors[position] = _count_bits(mask)
+
+        return num_successors
+
+    ## Magic methods
+    def __len__(self) -> int:
+        return len(self.durations)
+
+    def __repr__(self) -> str:
+        return f"PriorityKeys(activities={len(self)})"
+
+
+class PriorityRule():
+    """
+    Rule determining the priorities of activities in the ready queue of PHM
+    (see ParallelHeuristicMethod.priority_rule).
+
+    The lower the priority value, the higher the priority of the activity. Activities with
+    the same priority value are ordered according to their IDs.
+
+    A custom rule is a subclass that implements `get_priorities`.
+    """
+
+    name: str = None
+    """Name of the rule."""
+
+    ## Public methods
+    def get_priorities(self, keys: PriorityKeys) -> 'np.ndarray':
+        """Returns the priority values of the activities computed from their columns."""
+
+        raise NotImplementedError(f"Computing priorities of '{type(self).__name__}' failed!" +
+                                  "\n Subclasses of PriorityRule must implement" +
+                                  " 'get_priorities'.")
+
+    def get_project_priorities(self, project: Project) -> List[int]:
+        """Returns the priority values of the activities of a project solved by CPM."""
+        return self.get_priorities(PriorityKeys.from_project(project)).tolist()
+
+    ## Magic methods
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}()"
+
+
+class TimeReserveRule(PriorityRule):
+    """Minimum slack: the lower the time reserve, the higher the priority (default of PHM)."""
+
+    name = "tr"
+
+    def get_priorities(self, keys: PriorityKeys) -> 'np.ndarray':
+        return keys.time_reserve
+
+
+class LatestFinishTimeRule(PriorityRule):
+    """Latest Finish Time (LFT): the sooner the latest end, the higher the priority."""
+
+    name = "lft"
+
+    def get_priorities(self, keys: PriorityKeys) -> 'np.ndarray':
+        return keys.latest_end
+
+
+class LatestStartTimeRule(PriorityRule):
+    """Latest Start Time (LST): the sooner the latest start, the higher the priority."""
+
+    name = "lst"
+
+    def get_priorities(self, keys: PriorityKeys) -> 'np.ndarray':
+        return keys.latest_start
+
+
+class MostTotalSuccessorsRule(PriorityRule):
+    """
+    Most Total Successors (MTS): the more direct and indirect successors, the higher
+    the priority.
+
+    Counting the successors is expensive on large projects (see
+    PriorityKeys.get_num_total_successors), so the rule is not part of the default
+    portfolio and must be given explicitly.
+    """
+
+    name = "mts"
+
+    def get_priorities(self, keys: PriorityKeys) -> 'np.ndarray':
+        import numpy as np
+        return -np.array(keys.get_num_total_successors(), dtype=np.int64)
+
+
+class GreatestRankPositionalWeightRule(PriorityRule):
+    """
+    Greatest Rank Positional Weight (GRPW): the longer the duration of the activity and
+    its immediate successors, the higher the priority.
+    """
+
+    name = "grpw"
+
+    def get_priorities(self, keys: PriorityKeys) -> 'np.ndarray':
+        return -(keys.durations + keys.get_successors_durations())
+
+
+class MostResourcesRule(PriorityRule):
+    """Most resources: the more resources in a single time unit, the higher the priority."""
+
+    name = "mr"
+
+    def get_priorities(self, keys: PriorityKeys) -> 'np.ndarray':
+        return -keys.resources
+
+
+class ShortestDurationRule(PriorityRule):
+    """Shortest Processing Time (SPT): the shorter the duration, the higher the priority."""
+
+    name = "spt"
+
+    def get_priorities(self, keys: PriorityKeys) -> 'np.ndarray':
+        return keys.durations
+
+
+class RandomRule(PriorityRule):
+    """Random priorities, which are the same for the same seed."""
+
+    name = "random"
+
+    seed: int
+    """Seed of the random number generator."""
+
+    def __init__(self, seed: int = 0):
+        self.seed = seed
+
+    def get_priorities(self, keys: PriorityKeys) -> 'np.ndarray':
+        import numpy as np
+        return np.random.default_rng(self.seed).permutation(len(keys))
+
+    def __repr__(self) -> str:
+        return f"RandomRule(seed={self.seed})"
+
+
+class GivenPrioritiesRule(PriorityRule):
+    """Priorities computed beforehand, e.g. by PriorityRulePortfolio."""
+
+    priorities: List[int]
+    """The priority values of the activities by their positions."""
+
+    def __init__(self, priorities: List[int], name: str = "given"):
+        self.priorities = priorities
+        self.name = name
+
+    def get_priorities(self, keys: PriorityKeys) -> 'np.ndarray':
+        import numpy as np
+        return np.asarray(self.priorities)
+
+    def get_project_priorities(self, project: Project) -> List[int]:
+        """Returns the given priority values without gathering the columns of the project."""
+        return list(self.priorities)
+
+    def __repr__(self) -> str:
+        return f"GivenPrioritiesRule(name={self.name!r})"
+
+
+class PriorityRulePortfolio():
+    """
+    Schedules a project by PHM with each of many priority rules and keeps the schedule with
+    the lowest makespan.
+
+    The columns of the activities are gathered once (see PriorityKeys), then the priorities
+    of every rule are computed from them by vectorized operations. The parallel schedules are
+    generated in worker processes. Each worker receives the project once as a ProjectGraph
+    with the results of CPM, so it neither parses nor solves the project again, and then only
+    the priorities and starts of activities are sent between the processes.
+
+    If more rules reach the lowest makespan, then the first of them wins. The default
+    portfolio starts with the time reserves, so it is never worse than PHM.
+
+    By default, the rules are scheduled one by one in the calling process, as the worker
+    processes pay off only on large projects (see `max_workers`).
+    """
+
+    rules = {"tr": TimeReserveRule, "lft": LatestFinishTimeRule, "lst": LatestStartTimeRule,
+             "mts": MostTotalSuccessorsRule, "grpw": GreatestRankPositionalWeightRule,
+             "mr": MostResourcesRule, "spt": ShortestDurationRule, "random": RandomRule}
+    """Built-in priority rules, by their names."""
+
+    default_rules = ("tr", "lft", "lst", "grpw", "mr", "spt", "random")
+    """
+    Names of the rules of the default portfolio, i.e. the built-in rules except the
+    expensive MTS (see MostTotalSuccessorsRule).
+    """
+
+    priority_rules: Tuple[PriorityRule, ...]
+    """The priority rules of the portfolio."""
+
+    max_workers: int
+    """
+    Max. number of worker processes, the number of CPUs if None.
+
+    If it is 1 (default), then the rules are scheduled in the calling process. The workers
+    pay off with more CPUs once scheduling a rule takes longer than sending the graph of
+    the project to them, i.e. on large projects.
+    """
+
+    profile: str
+    """The name of the resource profile used by PHM (see HeuristicMethod.profiles)."""
+
+    makespans: Dict[str, int]
+    """Makespans of the last solved project by the names of the rules."""
+
+    best_rule: str
+    """Name of the rule of the best schedule of the last solved project."""
+
+    ## Public methods
+    def __init__(self, priority_rules: Sequence[Union[str, PriorityRule]] = default_rules,
+                 max_workers: int = 1, profile: str = "tree"):
+        self.priority_rules = tuple(self.get_rule(rule) if isinstance(rule, str) else rule
+                                    for rule in priority_rules)
+
+        rule_names = [rule.name for rule in self.priority_rules]
+        if not rule_names or len(set(rule_names)) != len(rule_names):
+            raise ValueError("Creating PriorityRulePortfolio failed!" +
+                             "\n The portfolio must have at least one rule and the names of" +
+                             " its rules must be unique.")
+
+        HeuristicMethod.validate_profile(profile)
+        validate_positive("PriorityRulePortfolio", max_workers=max_workers)
+
+        self.max_workers = max_workers
+        self.profile = profile
+        self.makespans = {}
+        self.best_rule = None
+
+    @classmethod
+    def get_rule(cls, rule_name: str) -> PriorityRule:
+        """Returns a new instance of the built-in rule of the given name."""
+
+        if rule_name not in cls.rules:
+            raise ValueError(f"Unsupported priority rule '{rule_name}'!" +
+                             f"\n Currently, only '{', '.join(cls.rules)}' are supported.")
+
+        return cls.rules[rule_name]()
+
+    def get_priorities(self, project: Project) -> Dict[str, List[int]]:
+        """
+        Returns the priority values of the activities of a project solved by CPM for each of
+        the rules by their names.
+        """
+
+        keys = PriorityKeys.from_project(project)
+
+        return {rule.name: rule.get_priorities(keys).tolist() for rule in self.priority_rules}
+
+    def solve(self, cpm: CPM, r_max: int = None) -> Schedule:
+        """
+        Schedules the project of a CriticalPathMethod instance by PHM with each of the rules
+        and returns the schedule with the lowest makespan.
+
+        r_max is the one of the project unless specified otherwise. If the instance is not
+        solved, then it is solved first.
+        """
+
+        if not cpm.solved:
+            cpm.solve()
+
+        project = cpm.project
+        r_max = project.r_max if r_max is None else r_max
+        priorities = self.get_priorities(project)
+
+        if self.max_workers == 1:
+            schedules = {name: _schedule(cpm, r_max, self.profile, rule_priorities)
+                         for name, rule_priorities in priorities.items()}
+            self._set_makespans({name: schedule.actual_end
+                                 for name, schedule in schedules.items()})
+            return schedules[self.best_rule]
+
+        with ProcessPoolExecutor(self.max_workers, initializer=_init_worker,
+                                 initargs=(cpm.get_solved_graph(), r_max,
+                                           self.profile)) as executor:
+            results = dict(zip(priorities, executor.map(_get_worker_starts,
+                                                        priorities.values())))
+
+        self._set_makespans({name: actual_end for name, (actual_end, _) in results.items()})
+
+        starts = results[self.best_rule][1].tolist()
+        ends = [start + duration for start, duration in zip(starts,
+                                                             project.get_column("duration"))]
+        return Schedule(project, PHM._method_name, starts, ends,  # pylint: disable=protected-access
+                        priorities[self.best_rule], results[self.best_rule][0])
+
+    ## Private methods
+    def _set_makespans(self, makespans: Dict[str, int]):
+        """Keeps the makespans of the rules and the name of the first rule of the lowest."""
+
+        self.makespans = makespans
+        self.best_rule = min(makespans, key=makespans.get)
+
+    ## Magic methods
+    def __repr__(self) -> str:
+        return (f"PriorityRulePortfolio(rules={[rule.name for rule in self.priority_rules]}," +
+                f" max_workers={self.max_workers}, profile={self.profile!r})")
+
+
+def _count_bits(mask: int) -> int:
+    """Returns the number of set bits of the integer."""
+
+    # int.bit_count is available since Python 3.10
+    return mask.bit_count() if hasattr(mask, "bit_count") else bin(mask).count("1")
+
+
+def _schedule(cpm: CPM, r_max: int, profile: str, priorities: List[int]) -> Schedule:
+    """Schedules the project of the solved CPM by PHM with the given priorities."""
+
+    phm = PHM.from_cpm(cpm, r_max, profile)
+    phm.priority_rule = GivenPrioritiesRule(priorities)
+
+    return phm.solve()
+
+
+_worker_cpm: CPM = None
+"""The solved project of a worker process."""
+
+_worker_args: Tuple[int, str] = None
+"""r_max and the name of the resource profile of a worker process."""
+
+
+def _init_worker(solved_graph: Tuple, r_max: int, profile: str):
+    """
+    Keeps the project solved by CPM in the calling process (see
+    CriticalPathMethod.get_solved_graph) in a worker process, along with the r_max and
+    the name of the resource profile of its schedules.
+    """
+
+    global _worker_cpm, _worker_args  # pylint: disable=global-statement
+
+    _worker_cpm = CPM.from_solved_graph(*solved_graph)
+    _worker_args = (r_max, profile)
+
+
+def _get_worker_starts(priorities: List[int]) -> Tuple[int, 'array[int]']:
+    """
+    Returns the makespan and starts of the project of the worker process (see `_init_worker`)
+    scheduled by PHM with the given priorities.
+    """
+
+    schedule = _schedule(_worker_cpm, *_worker_args, priorities)
+
+    return schedule.actual_end, array("q", schedule.starts)
@@ -0,0 +1,349 @@
+from typing import List, Optional
+
+
+class ResourceProfile():
+    """
+    Resources available in each time unit of a project.
+
+    The profile is a segment tree over the time units: each node stores the min. and max.
+    available resources in its interval and the amount added to its whole interval. Adding
+    resources to a range of time units and finding the min. or the latest time unit without
+    enough resources in a range take O(log T) time, where T is the number of time units.
+    Therefore, the cost of checking and scheduling an activity does not depend on its duration.
+
+    Time units are added dynamically (see `extend_until`) with all resources available, as the
+    final end time of the project is not known until the heuristic method has completed.
+    """
+
+    capacity: int
+    """Resources available in a single time unit before any are used."""
+
+    num_probes: int
+    """
+    Number of nodes whose resources were compared with the resources required by
+    `find_earliest_start` since the profile was created.
+    """
+
+    ## Private properties
+    _num_time_points: int
+    """Number of time units added to the profile."""
+
+    _size: int
+    """Number of leaves of the tree, a power of two >= the number of time units."""
+
+    _height: int
+    """Height of the tree, i.e. log2 of `_size`."""
+
+    _mins: List[int]
+    """
+    Min. available resources in the interval of each node, including the amounts added to
+    the node and its descendants, but not to its ancestors.
+
+    The root is at index 1, the children of node `i` are at `2i` and `2i+1` and the leaves
+    (time units) start at index `_size`.
+    """
+
+    _maxs: List[int]
+    """Max. available resources in the interval of each node, see `_mins`."""
+
+    _adds: List[int]
+    """Amounts added to the whole interval of each inner node."""
+
+    ## Public methods
+    def __init__(self, capacity: int, num_time_points: int = 0):
+        self.capacity = capacity
+        self.num_probes = 0
+        self._num_time_points = 0
+        self._size, self._height = 1, 0
+        self._mins, self._maxs, self._adds = [0, capacity], [0, capacity], [0]
+        self.extend_until(num_time_points - 1)
+
+    def extend_until(self, time_end: int):
+        """Adds time units with all resources available up to and including `time_end`."""
+
+        num_time_points = time_end + 1
+        if num_time_points <= self._num_time_points:
+            return
+
+        while num_time_points > self._size:
+            self._grow()
+
+        self._num_time_points = num_time_points
+
+    def add(self, start_time: int, end_time: int, amount: int):
+        """Adds the amount to the resources available between `start_time` and `end_time`."""
+
+        if start_time >= end_time:
+            return
+
+        self._validate_range(start_time, end_time)
+
+        mins, maxs, adds, size = self._mins, self._maxs, self._adds, self._size
+        left, right = start_time + size, end_time + size
+        while left < right:
+            if left & 1:
+                mins[left] += amount
+                maxs[left] += amount
+                if left < size:
+                    adds[left] += amount
+                left += 1
+            if right & 1:
+                right -= 1
+                mins[right] += amount
+                maxs[right] += amount
+                if right < size:
+                    adds[right] += amount
+            left >>= 1
+            right >>= 1
+
+        self._update_ancestors(start_time + size)
+        self._update_ancestors(end_time - 1 + size)
+
+    def min(self, start_time: int, end_time: int) -> Optional[int]:
+        """
+        Returns the min. resources available between `start_time` and `end_time`, or None if
+        the range is empty.
+        """
+
+        if start_time >= end_time:
+            return None
+
+        self._validate_range(start_time, end_time)
+
+        # The nodes collected on the left side of the range up to a level are descendants of
+        # the ancestor of the first leaf above that level, so the amounts added to the
+        # ancestors are summed while going up, and similarly for the right side
+        mins, adds, size = self._mins, self._adds, self._size
+        first_leaf, last_leaf = start_time + size, end_time - 1 + size
+        left_min = right_min = float("inf")
+        left, right, shift = first_leaf, last_leaf + 1, 1
+        while left < right:
+            if left & 1:
+                left_min = min(left_min, mins[left])
+                left += 1
+            if right & 1:
+                right -= 1
+                right_min = min(right_min, mins[right])
+            left_min += adds[first_leaf >> shift]
+            right_min += adds[last_leaf >> shift]
+            left >>= 1
+            right >>= 1
+            shift += 1
+
+        while shift <= self._height:
+            left_min += adds[first_leaf >> shift]
+            right_min += adds[last_leaf >> shift]
+            shift += 1
+
+        return min(left_min, right_min)
+
+    def get(self, time: int) -> int:
+        """Returns the resources available in the time unit."""
+
+        self._validate_range(time, time + 1)
+
+        leaf = time + self._size
+        return self._mins[leaf] + self._get_ancestors_added(leaf)
+
+    def fits(self, start_time: int, end_time: int, resources: int) -> bool:
+        """
+        Returns True if the resources are available in every time unit between `start_time`
+        and `end_time`.
+        """
+
+        # The root holds the min. of the whole profile
+        if start_time >= end_time or self._mins[1] >= resources:
+            return True
+
+        # Resources are most often lacking right at the start, which is cheaper to check
+        if self.get(start_time) < resources:
+            return False
+
+        return self.min(start_time, end_time) >= resources
+
+    def find_last_below(self, start_time: int, end_time: int,
+                        resources: int) -> Optional[int]:
+        """
+        Returns the latest time unit between `start_time` and `end_time` in which fewer than
+        `resources` are available, or None if there is no such time unit.
+        """
+
+        if start_time >= end_time or self._mins[1] >= resources:
+            return None
+
+        self._validate_range(start_time, end_time)
+
+        # The nodes on the right side of the range are visited first, in descending order of
+        # time, while the amounts added to the ancestors of the two leaves are subtracted
+        # level by level (see `min`)
+        mins, adds, size = self._mins, self._adds, self._size
+        first_leaf, last_leaf = start_time + size, end_time - 1 + size
+        first_added = self._get_ancestors_added(first_leaf)
+        last_added = self._get_ancestors_added(last_leaf)
+        left_nodes = []
+        left, right, shift = first_leaf, last_leaf + 1, 1
+        while left < right:
+            if left & 1:
+                left_nodes.append((left, first_added))
+                left += 1
+            if right & 1:
+                right -= 1
+                if mins[right] + last_added < resources:
+                    return self._find_last_leaf_below(right, last_added, resources)
+            first_added -= adds[first_leaf >> shift]
+            last_added -= adds[last_leaf >> shift]
+            left >>= 1
+            right >>= 1
+            shift += 1
+
+        for node, added in reversed(left_nodes):
+            if mins[node] + added < resources:
+                return self._find_last_leaf_below(node, added, resources)
+
+        return None
+
+    def find_earliest_start(self, start_time: int, resources: int,
+                            duration: int) -> Optional[int]:
+        """
+        Returns the earliest time unit from `start_time` on, from which the resources are
+        available in `duration` consecutive time units, or None if there is no such time unit.
+
+        The time units after the end of the profile have all resources available, so they
+        do not need to be added beforehand.
+        """
+
+        if duration <= 0:
+            return start_time
+
+        if start_time < 0:
+            self._validate_range(start_time, start_time + 1)
+
+        # The time units are visited in ascending order as whole nodes: a node with enough
+        # resources in all of its time units extends the run of available time units, a node
+        # with enough resources in none of them restarts the run after its interval and
+        # other nodes are split into their children
+        mins, maxs, adds, size = self._mins, self._maxs, self._adds, self._size
+        run_start = start_time
+        if start_time < size:
+            first_leaf = start_time + size
+            first_added = self._get_ancestors_added(first_leaf)
+            nodes = []
+            left, right, shift = first_leaf, 2 * size, 1
+            while left < right:
+                if left & 1:
+                    nodes.append((left, first_added))
+                    left += 1
+                first_added -= adds[first_leaf >> shift]
+                left >>= 1
+                right >>= 1
+                shift += 1
+
+            nodes.reverse()
+            num_probes = self.num_probes
+            while nodes:
+                node, added = nodes.pop()
+                num_probes += 1
+                node_size = size >> (node.bit_length() - 1)
+                node_end = (node + 1) * node_size - size
+                if mins[node] + added >= resources:
+                    if node_end - run_start >= duration:
+                        self.num_probes = num_probes
+                        return run_start
+                elif maxs[node] + added < resources:
+                    run_start = node_end
+                else:
+                    added += adds[node]
+                    nodes.append((2 * node + 1, added))
+                    nodes.append((2 * node, added))
+            self.num_probes = num_probes
+
+        return run_start if self.capacity >= resources else None
+
+    def to_list(self) -> List[int]:
+        """Returns the resources available in each time unit."""
+
+        mins, adds, size = self._mins, self._adds, self._size
+        added = [0] * (2 * size)
+        for node in range(1, size):
+            added[2 * node] = added[2 * node + 1] = added[node] + adds[node]
+
+        return [mins[leaf] + added[leaf] for leaf in range(size, size + self._num_time_points)]
+
+    ## Private methods
+    def _grow(self):
+        """
+        Doubles the number of leaves of the tree, so that adding time units takes amortized
+        constant time.
+
+        The current tree becomes the left subtree of the new root and the right subtree has
+        all resources available in its time units.
+        """
+
+        size, capacity = self._size, self.capacity
+        mins = [0, min(self._mins[1], capacity)]
+        maxs = [0, max(self._maxs[1], capacity)]
+        adds = [0, 0]
+        level_start = 1
+        while level_start <= size:
+            level_end = 2 * level_start
+            mins += self._mins[level_start:level_end]
+            mins += [capacity] * level_start
+            maxs += self._maxs[level_start:level_end]
+            maxs += [capacity] * level_start
+            if level_start < size:
+                adds += self._adds[level_start:level_end]
+                adds += [0] * level_start
+            level_start = level_end
+
+        self._size, self._height = 2 * size, self._height + 1
+        self._mins, self._maxs, self._adds = mins, maxs, adds
+
+    def _validate_range(self, start_time: int, end_time: int):
+        """Validates that the time units between `start_time` and `end_time` exist."""
+
+        if start_time < 0 or end_time > self._num_time_points:
+            raise IndexError(f"Accessing resources between '{start_time}' and '{end_time}'" +
+                             " failed!\n The profile contains only time units between '0' and" +
+                             f" '{self._num_time_points}'.")
+
+    def _get_ancestors_added(self, node: int) -> int:
+        """Returns the sum of the amounts added to the ancestors of the node."""
+
+        adds = self._adds
+        added = 0
+        node >>= 1
+        while node > 0:
+            added += adds[node]
+            node >>= 1
+
+        return added
+
+    def _find_last_leaf_below(self, node: int, added: int, resources: int) -> int:
+        """
+        Returns the latest time unit in the interval of the node in which fewer than
+        `resources` are available, given the amounts added to the ancestors of the node.
+        """
+
+        mins, adds, size = self._mins, self._adds, self._size
+        while node < size:
+            added += adds[node]
+            node = 2 * node + 1 if mins[2 * node + 1] + added < resources else 2 * node
+
+        return node - size
+
+    def _update_ancestors(self, leaf: int):
+        """Recomputes the min. and max. of the ancestors of the leaf."""
+
+        mins, maxs, adds = self._mins, self._maxs, self._adds
+        node = leaf >> 1
+        while node > 0:
+            mins[node] = min(mins[2 * node], mins[2 * node + 1]) + adds[node]
+            maxs[node] = max(maxs[2 * node], maxs[2 * node + 1]) + adds[node]
+            node >>= 1
+
+    ## Magic methods
+    def __len__(self) -> int:
+        return self._num_time_points
+
+    def __repr__(self) -> str:
+        return f"ResourceProfile(capacity={self.capacity}, time_points={len(self)})"
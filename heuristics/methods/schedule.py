@@ -0,0 +1,141 @@
+from typing import Dict, List
+from heuristics.core.activities.activity_id import ActivityID as ID
+from heuristics.core.project import Project
+
+
+class Schedule():
+    """
+    Schedule of the activities of a project produced by a heuristic method.
+
+    The project is only read while it is being scheduled. The start, end and priority of
+    each activity are stored in lists at the position of the activity in the project's list
+    of activities (see Project.positions). Therefore, a single project can be scheduled by
+    many heuristic methods, each producing its own Schedule.
+    """
+
+    project: Project
+    """The scheduled project."""
+
+    method_name: str
+    """Name of the heuristic method that produced the schedule."""
+
+    starts: List[int]
+    """The times that activities are actually scheduled to begin, None if unscheduled."""
+
+    ends: List[int]
+    """The times that activities are actually scheduled to end, None if unscheduled."""
+
+    priorities: List[int]
+    """The priorities of activities according to the heuristic method, None if unused."""
+
+    actual_end: int
+    """
+    The time that the project can actually end according to the heuristic method which takes
+    into account the max. resources available at one point in time.
+    """
+
+    ## Public methods
+    def __init__(self, project: Project, method_name: str = None, starts: List[int] = None,
+                 ends: List[int] = None, priorities: List[int] = None,
+                 actual_end: int = None):
+        num_acts = project.num_activities
+        for name, values in (("starts", starts), ("ends", ends), ("priorities", priorities)):
+            if values is not None and len(values) != num_acts:
+                raise ValueError("Creating Schedule failed!" +
+                                 f"\n The length of '{name}' must be equal to the number of" +
+                                 f" activities '{num_acts}'.")
+
+        self.project = project
+        self.method_name = method_name
+
+        self.starts = [None] * num_acts if starts is None else starts
+        self.ends = [None] * num_acts if ends is None else ends
+        self.priorities = [None] * num_acts if priorities is None else priorities
+
+        self.actual_end = actual_end
+
+    def schedule_activity(self, position: int, start_time: int, duration: int = None):
+        """
+        Schedules the activity at the given position from a given time point.
+
+        If an activity is scheduled from 0 to 4, then it is finished at 4. The duration is
+        the one of the activity unless it is given, e.g. read from a column of the project.
+        """
+
+        if duration is None:
+            duration = self.project.activities[position].duration
+
+        self.starts[position] = start_time
+        self.ends[position] = start_time + duration
+
+    def is_scheduled(self, position: int) -> bool:
+        """Returns True if the activity at the given position is scheduled."""
+        return self.starts[position] is not None
+
+    def is_finished(self, position: int, time: int) -> bool:
+        """Returns True if the activity at the given position is finished at the given time."""
+        return self.ends[position] is not None and self.ends[position] <= time
+
+    def get_actual_end(self) -> int:
+        """Returns the time when the last scheduled activity ends."""
+
+        return max((end for end in self.ends if end is not None), default=self.project.start)
+
+    def get_time_frame(self, position: int) -> Dict:
+        """
+        Returns the time frame of the activity at the given position, along with its id (label)
+        and resources.
+
+        The time frame of an activity is the interval when the activity is scheduled.
+        """
+
+        act = self.project.activities[position]
+
+        return {'label': str(act.id),
+                'start': self.starts[position],
+                'end': self.ends[position],
+                'resource': act.resources}
+
+    def get_time_frames(self) -> List[Dict]:
+        """Returns the time frames of all activities sorted by their IDs."""
+
+        return [self.get_time_frame(position) for position in range(len(self))]
+
+    def start_of(self, activity_id) -> int:
+        """Returns the time that the activity with the given ID is scheduled to begin."""
+        return self.starts[self._get_position(activity_id)]
+
+    def end_of(self, activity_id) -> int:
+        """Returns the time that the activity with the given ID is scheduled to end."""
+        return self.ends[self._get_position(activity_id)]
+
+    def priority_of(self, activity_id) -> int:
+        """Returns the priority of the activity with the given ID."""
+        return self.priorities[self._get_position(activity_id)]
+
+    ## Private methods
+    def _get_position(self, activity_id) -> int:
+        """Returns the position of the activity with the given ID in the project."""
+
+        activity_id = activity_id if isinstance(activity_id, ID) else ID.from_str(activity_id)
+        if activity_id not in self.project.positions:
+            raise ValueError(f"Activity with ID '{activity_id}' is not part of the project!")
+
+        return self.project.positions[activity_id]
+
+    ## Magic methods
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def __repr__(self) -> str:
+        return (f"Schedule(method_name={self.method_name!r}, activities={len(self)}," +
+                f" actual_end={self.actual_end})")
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Schedule):
+            raise NotImplementedError("Determining equality of Schedule instances failed!" +
+                                      f"\n Cannot compare instances of '{type(self)}' and" +
+                                      f" '{type(other)}'")
+
+        return (self.starts, self.ends, self.priorities, self.actual_end) == \
+               (other.starts, other.ends, other.priorities, other.actual_end)
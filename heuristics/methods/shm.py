@@ -1,5 +1,7 @@
-from heuristics.core.activities.activity import Activity
+from typing import List
+from heuristics.core.stats import SolveStats
 from heuristics.methods.method import HeuristicMethod
+from heuristics.methods.schedule import Schedule
 
 
 class SerialHeuristicMethod(HeuristicMethod):
@@ -11,70 +13,88 @@ class SerialHeuristicMethod(HeuristicMethod):
     possible.
     """
 
-    __method_name: str = "Serial Heuristic Method (SHM)"
+    _method_name: str = "Serial Heuristic Method (SHM)"
+
+    ## Private properties
+    _pred_positions: List[List[int]]
+    """Positions of predecessors of each activity by its position."""
 
     ## Public methods
-    def solve(self):
-        """Solves the activity dependency problem with resources."""
+    def solve(self, stats: SolveStats = None) -> Schedule:
+        """
+        Solves the activity dependency problem with resources and returns the schedule.
+
+        If stats are given, then the phases of the method are measured in them
+        (see SolveStats).
+        """
 
-        self.cpm.solve()
+        self._init_solution(stats)
+        self._pred_positions = self.cpm.project.get_predecessors_positions()
 
         # Schedule activities
-        for act in self.cpm.project.activities:
-            self._schedule_activity(act)
+        num_acts = len(self.schedule)
+        with SolveStats.measure(stats, "scheduling"):
+            for position in range(num_acts):
+                self._schedule_activity(position)
 
-        self.cpm.project.actual_end = self._get_project_actual_end()
+        # Every activity is scheduled by a single search of the resource profile, which
+        # probes as many slots of the profile as it needs
+        if stats is not None:
+            stats.count("events", num_acts)
+            stats.count("resource_checks", self.resource_profile.num_probes)
+
+        self.schedule.actual_end = self.schedule.get_actual_end()
+
+        return self.schedule
 
     def activities_schedule_to_json_file(self,
-                                         method_name: str = __method_name,
+                                         method_name: str = _method_name,
                                          act_timeframe_type: str = "shm",
                                          json_file_path: str = \
-                                            "shm_activities_schedule.json") -> str:
-        """Save the activities schedule produced by the Serial Heuristic Method to a JSON file."""
+                                            "shm_activities_schedule.json",
+                                         export_format: str = "gantt") -> str:
+        """
+        Save the activities schedule produced by the Serial Heuristic Method to a file, by
+        default as JSON read by Gantt (see ScheduleExporter.formats).
+        """
 
         return super()._activities_schedule_to_json_file(method_name,
                                                          act_timeframe_type,
-                                                         json_file_path=json_file_path)
+                                                         json_file_path=json_file_path,
+                                                         export_format=export_format)
 
     ## Private methods
-    def _schedule_activity(self, act: Activity):
+    def _schedule_activity(self, position: int):
         """
-        Schedules an activity as soon as possible considering dependencies and available resources.
-        """
-        time = self._get_predecessors_finished_time(act)
+        Schedules the activity at the given position as soon as possible considering
+        dependencies and available resources.
 
-        while not act.is_scheduled():
-            tentative_act_end = time + act.duration
-            self._init_missing_available_resources_until(tentative_act_end)
+        The earliest time from which the resources are available during the whole duration of
+        the activity is found by a single search of the resource profile.
+        """
+        time = self._get_predecessors_finished_time(position)
+        duration = self._durations[position]
 
-            time_resources_exceed = self._get_time_available_resources_exceeded(
-                act, time, tentative_act_end)
+        start_time = self.resource_profile.find_earliest_start(time, self._resources[position],
+                                                               duration)
+        if start_time is None:
+            act_id = self.cpm.project.activities[position].id
+            raise RuntimeError(f"Solving {self._method_name} failed!" +
+                               f"\n Activity '{act_id}' cannot be scheduled as it requires more" +
+                               " resources than available.")
 
-            if time_resources_exceed is None:
-                self._schedule_activity_from(act, time)
-            else:
-                time = time_resources_exceed + 1
+        self._init_missing_available_resources_until(start_time + duration)
+        self._schedule_activity_from(position, start_time)
 
-    def _get_predecessors_finished_time(self, act: Activity) -> int:
+    def _get_predecessors_finished_time(self, position: int) -> int:
         """
-        Returns the time when all predecessors of an activity are finished.
+        Returns the time when all predecessors of the activity at the given position are
+        finished.
 
         If the activity has no predecessors, then the project start time is returned.
         """
 
-        return max((pred.actual_end for pred in act.predecessors),
-                   default=self.cpm.project.start)
-
-    def _get_time_available_resources_exceeded(self, act: Activity, start_time: int,
-                                               end_time: int) -> int:
-        """
-        Returns the latest time point in which the activity would exceed available resources had
-        it been scheduled in a given time frame.
-
-        The time frame does not include the `end_time`.
-        None is returned if the activity does not exceed the resources available in the time frame.
-        """
+        ends = self.schedule.ends
 
-        return max((time for time in range(start_time, end_time) if \
-                    act.resources > self.available_resources[time]),
-                    default = None)
+        return max((ends[pred_position] for pred_position in self._pred_positions[position]),
+                   default=self.cpm.project.start)
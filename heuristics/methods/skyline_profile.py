@@ -0,0 +1,207 @@
+from bisect import bisect_left, bisect_right
+from typing import List, Optional
+
+
+class SkylineProfile():
+    """
+    Resources available in each time unit of a project stored as a step function.
+
+    Only the breakpoints, i.e. the time units where the resources available change, are
+    stored. Therefore, memory and the cost of queries and updates depend on the number of
+    scheduled activities rather than on the number of time units, which suits projects with
+    long time horizons (e.g. minutes over years).
+
+    The profile has the same interface and integer time semantics as ResourceProfile:
+    the range between `start_time` and `end_time` contains the time units from `start_time`
+    up to, but excluding, `end_time`.
+    """
+
+    capacity: int
+    """Resources available in a single time unit before any are used."""
+
+    num_probes: int
+    """
+    Number of steps whose resources were compared with the resources required by
+    `find_earliest_start` since the profile was created.
+    """
+
+    ## Private properties
+    _num_time_points: int
+    """Number of time units added to the profile."""
+
+    _times: List[int]
+    """Sorted breakpoints of the profile, the first one is always 0."""
+
+    _resources: List[int]
+    """
+    Resources available from the breakpoint at the same index until the next breakpoint,
+    or until the end of the profile for the last breakpoint.
+    """
+
+    ## Public methods
+    def __init__(self, capacity: int, num_time_points: int = 0):
+        self.capacity = capacity
+        self.num_probes = 0
+        self._num_time_points = 0
+        self._times = [0]
+        self._resources = [capacity]
+        self.extend_until(num_time_points - 1)
+
+    def extend_until(self, time_end: int):
+        """Adds time units with all resources available up to and including `time_end`."""
+
+        # Resources are never used after the end of the profile, so the last step already
+        # covers the new time units
+        self._num_time_points = max(self._num_time_points, time_end + 1)
+
+    def add(self, start_time: int, end_time: int, amount: int):
+        """Adds the amount to the resources available between `start_time` and `end_time`."""
+
+        if start_time >= end_time:
+            return
+
+        self._validate_range(start_time, end_time)
+
+        first_step = self._split(start_time)
+        end_step = self._split(end_time)
+        resources = self._resources
+        for step in range(first_step, end_step):
+            resources[step] += amount
+
+        # Steps that no longer differ from their predecessors are merged
+        self._merge(end_step)
+        self._merge(first_step)
+
+    def min(self, start_time: int, end_time: int) -> Optional[int]:
+        """
+        Returns the min. resources available between `start_time` and `end_time`, or None if
+        the range is empty.
+        """
+
+        if start_time >= end_time:
+            return None
+
+        self._validate_range(start_time, end_time)
+
+        return min(self._resources[self._get_step(start_time):
+                                   bisect_left(self._times, end_time)])
+
+    def get(self, time: int) -> int:
+        """Returns the resources available in the time unit."""
+
+        self._validate_range(time, time + 1)
+
+        return self._resources[self._get_step(time)]
+
+    def fits(self, start_time: int, end_time: int, resources: int) -> bool:
+        """
+        Returns True if the resources are available in every time unit between `start_time`
+        and `end_time`.
+        """
+
+        return start_time >= end_time or self.min(start_time, end_time) >= resources
+
+    def find_last_below(self, start_time: int, end_time: int,
+                        resources: int) -> Optional[int]:
+        """
+        Returns the latest time unit between `start_time` and `end_time` in which fewer than
+        `resources` are available, or None if there is no such time unit.
+        """
+
+        if start_time >= end_time:
+            return None
+
+        self._validate_range(start_time, end_time)
+
+        times = self._times
+        first_step = self._get_step(start_time)
+        for step in range(bisect_left(times, end_time) - 1, first_step - 1, -1):
+            if self._resources[step] < resources:
+                step_end = times[step + 1] if step + 1 < len(times) else end_time
+                return min(step_end, end_time) - 1
+
+        return None
+
+    def find_earliest_start(self, start_time: int, resources: int,
+                            duration: int) -> Optional[int]:
+        """
+        Returns the earliest time unit from `start_time` on, from which the resources are
+        available in `duration` consecutive time units, or None if there is no such time unit.
+
+        The time units after the end of the profile have all resources available, so they
+        do not need to be added beforehand.
+        """
+
+        if duration <= 0:
+            return start_time
+
+        if start_time < 0:
+            self._validate_range(start_time, start_time + 1)
+
+        # The last step lasts until the end of the profile and has all resources available,
+        # as resources are never used after the end of the profile
+        times, step_resources = self._times, self._resources
+        run_start = start_time
+        first_step = self._get_step(start_time)
+        for step in range(first_step, len(times) - 1):
+            if step_resources[step] < resources:
+                run_start = times[step + 1]
+            elif times[step + 1] - run_start >= duration:
+                self.num_probes += step - first_step + 1
+                return run_start
+
+        self.num_probes += len(times) - first_step
+        return run_start if step_resources[-1] >= resources else None
+
+    def to_list(self) -> List[int]:
+        """Returns the resources available in each time unit."""
+
+        resources = []
+        step_ends = self._times[1:] + [self._num_time_points]
+        for step_start, step_end, step_resources in zip(self._times, step_ends,
+                                                       self._resources):
+            resources.extend([step_resources] * (min(step_end, self._num_time_points) -
+                                                 step_start))
+
+        return resources
+
+    ## Private methods
+    def _validate_range(self, start_time: int, end_time: int):
+        """Validates that the time units between `start_time` and `end_time` exist."""
+
+        if start_time < 0 or end_time > self._num_time_points:
+            raise IndexError(f"Accessing resources between '{start_time}' and '{end_time}'" +
+                             " failed!\n The profile contains only time units between '0' and" +
+                             f" '{self._num_time_points}'.")
+
+    def _get_step(self, time: int) -> int:
+        """Returns the index of the step containing the time unit."""
+        return bisect_right(self._times, time) - 1
+
+    def _split(self, time: int) -> int:
+        """Adds a breakpoint at the time unit if missing and returns the index of its step."""
+
+        step = self._get_step(time)
+        if self._times[step] == time:
+            return step
+
+        self._times.insert(step + 1, time)
+        self._resources.insert(step + 1, self._resources[step])
+
+        return step + 1
+
+    def _merge(self, step: int):
+        """Removes the breakpoint of the step if it has the same resources as the previous."""
+
+        if 0 < step < len(self._times) and \
+           self._resources[step] == self._resources[step - 1]:
+            del self._times[step]
+            del self._resources[step]
+
+    ## Magic methods
+    def __len__(self) -> int:
+        return self._num_time_points
+
+    def __repr__(self) -> str:
+        return (f"SkylineProfile(capacity={self.capacity}, time_points={len(self)}," +
+                f" breakpoints={len(self._times)})")
@@ -0,0 +1,217 @@
+from concurrent.futures import ProcessPoolExecutor
+import os
+from typing import Dict, Iterable, List, Sequence, Tuple
+from heuristics.core.cache import ProjectCache
+from heuristics.core.cpm import CriticalPathMethod as CPM
+from heuristics.methods.method import HeuristicMethod
+from heuristics.methods.validation import methods, validate_method_names, validate_positive
+
+
+class CapacityCurve():
+    """Makespans of a project scheduled by a heuristic method for a range of r_max values."""
+
+    method: str
+    """Name of the heuristic method (see validation.methods)."""
+
+    earliest_end: int
+    """The earliest end of the project determined by CPM, i.e. the lowest makespan."""
+
+    r_max_values: List[int]
+    """The r_max values in ascending order."""
+
+    makespans: List[int]
+    """The makespans for each of the r_max values."""
+
+    ## Public methods
+    def __init__(self, method: str, earliest_end: int, r_max_values: List[int] = None,
+                 makespans: List[int] = None):
+        self.method = method
+        self.earliest_end = earliest_end
+        self.r_max_values = [] if r_max_values is None else r_max_values
+        self.makespans = [] if makespans is None else makespans
+
+    def add_point(self, r_max: int, makespan: int):
+        """Adds the makespan for the r_max to the curve."""
+
+        self.r_max_values.append(r_max)
+        self.makespans.append(makespan)
+
+    def get_points(self) -> List[Tuple[int, int]]:
+        """Returns the pairs of r_max and makespan."""
+        return list(zip(self.r_max_values, self.makespans))
+
+    @property
+    def reaches_earliest_end(self) -> bool:
+        """True if the makespan of the last point is the earliest end of the project."""
+        return bool(self.makespans) and self.makespans[-1] <= self.earliest_end
+
+    ## Magic methods
+    def __len__(self) -> int:
+        return len(self.r_max_values)
+
+    def __repr__(self) -> str:
+        return (f"CapacityCurve(method={self.method!r}, points={self.get_points()}," +
+                f" earliest_end={self.earliest_end})")
+
+
+class RMaxSweep():
+    """
+    Schedules a project by heuristic methods for a range of r_max values.
+
+    The project does not depend on r_max until it is scheduled, so it is solved by CPM only
+    once and every heuristic method schedules it from the same CriticalPathMethod instance
+    (see HeuristicMethod.from_cpm).
+
+    By default, the range starts at the highest resources of a single activity, below which
+    no schedule exists, and ends at the peak resources of the earliest starts schedule, at
+    which the resources do not delay any activity. As the makespan can never be lower than
+    the earliest end of the project, the sweep of a method stops early once it is reached.
+
+    If `max_workers` is not 1, then the r_max values are scheduled in waves of as many values
+    as there are worker processes. Each worker receives the project once as a ProjectGraph
+    with the results of CPM, so the project is solved by CPM only once in the calling process
+    as well.
+    """
+
+    cpm: CPM
+    """Solved CriticalPathMethod instance of the project."""
+
+    method_names: Tuple[str, ...]
+    """Names of the heuristic methods scheduling the project (see validation.methods)."""
+
+    max_workers: int
+    """
+    Max. number of worker processes, the number of CPUs if None.
+
+    If it is 1, then the project is scheduled in the calling process.
+    """
+
+    profile: str
+    """The name of the resource profile used by the methods (see HeuristicMethod.profiles)."""
+
+    ## Public methods
+    def __init__(self, cpm: CPM, method_names: Sequence[str] = ("shm", "phm", "phmdp"),
+                 max_workers: int = 1, profile: str = "tree"):
+        validate_method_names(method_names)
+        HeuristicMethod.validate_profile(profile)
+        validate_positive("RMaxSweep", max_workers=max_workers)
+
+        if not cpm.solved:
+            cpm.solve()
+
+        self.cpm = cpm
+        self.method_names = tuple(method_names)
+        self.max_workers = max_workers
+        self.profile = profile
+
+    @classmethod
+    def from_file(cls, acts_file_path, method_names: Sequence[str] = ("shm", "phm", "phmdp"),
+                  max_workers: int = 1, profile: str = "tree",
+                  project_cache: ProjectCache = None) -> 'RMaxSweep':
+        """
+        Overloaded constructor for sweeping a project loaded from a data file.
+
+        r_max of the project is irrelevant as it is given to each of the methods.
+        """
+
+        return cls(CPM(acts_file_path, 0, project_cache=project_cache), method_names,
+                   max_workers, profile)
+
+    def get_r_max_range(self) -> range:
+        """
+        Returns the r_max values from the highest resources of a single activity up to
+        the peak resources of the earliest starts schedule.
+        """
+
+        activities = self.cpm.project.activities
+        min_r_max = max((act.resources for act in activities), default=0)
+
+        # Resources change only when activities start or end
+        changes: Dict[int, int] = {}
+        for act in activities:
+            if act.duration > 0:
+                changes[act.earliest_start] = changes.get(act.earliest_start, 0) + act.resources
+                changes[act.earliest_end] = changes.get(act.earliest_end, 0) - act.resources
+
+        max_r_max, resources = min_r_max, 0
+        for time in sorted(changes):
+            resources += changes[time]
+            max_r_max = max(max_r_max, resources)
+
+        return range(min_r_max, max_r_max + 1)
+
+    def solve(self, r_max_values: Iterable[int] = None,
+              stop_early: bool = True) -> Dict[str, CapacityCurve]:
+        """
+        Schedules the project for each of the r_max values (see `get_r_max_range`) by each of
+        the methods and returns their makespan-vs-capacity curves by method names.
+
+        If `stop_early` is True, then the sweep of a method stops at the first r_max for
+        which the makespan is the earliest end of the project.
+        """
+
+        r_max_values = sorted(self.get_r_max_range() if r_max_values is None else r_max_values)
+        earliest_end = self.cpm.project.earliest_end
+        curves = {method_name: CapacityCurve(method_name, earliest_end)
+                  for method_name in self.method_names}
+
+        if self.max_workers == 1:
+            for method_name, curve in curves.items():
+                for r_max in r_max_values:
+                    curve.add_point(r_max, self._get_makespan(method_name, r_max))
+                    if stop_early and curve.reaches_earliest_end:
+                        break
+            return curves
+
+        max_workers = self.max_workers or os.cpu_count() or 1
+        with ProcessPoolExecutor(max_workers, initializer=_init_worker,
+                                 initargs=(self.cpm.get_solved_graph(),
+                                           self.profile)) as executor:
+            for method_name, curve in curves.items():
+                for wave_start in range(0, len(r_max_values), max_workers):
+                    wave = r_max_values[wave_start:wave_start + max_workers]
+                    makespans = executor.map(_get_worker_makespan, [method_name] * len(wave),
+                                             wave)
+                    for r_max, makespan in zip(wave, makespans):
+                        curve.add_point(r_max, makespan)
+                        if stop_early and curve.reaches_earliest_end:
+                            break
+                    if stop_early and curve.reaches_earliest_end:
+                        break
+
+        return curves
+
+    ## Private methods
+    def _get_makespan(self, method_name: str, r_max: int) -> int:
+        """Returns the makespan of the project scheduled by the method with the r_max."""
+
+        method = methods[method_name].from_cpm(self.cpm, r_max, self.profile)
+
+        return method.solve().actual_end
+
+    ## Magic methods
+    def __repr__(self) -> str:
+        return (f"RMaxSweep(method_names={self.method_names}," +
+                f" max_workers={self.max_workers}, profile={self.profile!r})")
+
+
+_worker_sweep: RMaxSweep = None
+"""Sweep of the solved project of a worker process."""
+
+
+def _init_worker(solved_graph: Tuple, profile: str):
+    """
+    Keeps the project solved by CPM in the calling process (see
+    CriticalPathMethod.get_solved_graph) in a worker process.
+    """
+
+    global _worker_sweep  # pylint: disable=global-statement
+
+    _worker_sweep = RMaxSweep(CPM.from_solved_graph(*solved_graph), max_workers=1,
+                              profile=profile)
+
+
+def _get_worker_makespan(method_name: str, r_max: int) -> int:
+    """Returns the makespan of the project of the worker process (see `_init_worker`)."""
+
+    return _worker_sweep._get_makespan(method_name, r_max)  # pylint: disable=protected-access
@@ -0,0 +1,31 @@
+from typing import Dict, Optional, Sequence, Type
+from heuristics.methods.method import HeuristicMethod
+from heuristics.methods.phm import ParallelHeuristicMethod as PHM
+from heuristics.methods.phmdp import ParallelHeuristicMethodDynamicPriorities as PHMDP
+from heuristics.methods.shm import SerialHeuristicMethod as SHM
+
+
+methods: Dict[str, Type[HeuristicMethod]] = {"shm": SHM, "phm": PHM, "phmdp": PHMDP}
+"""Heuristic methods that can be given by their names, e.g. to BatchSolver."""
+
+
+def validate_method_names(method_names: Sequence[str]):
+    """Validates that the heuristic methods of the given names are supported."""
+
+    for method_name in method_names:
+        if method_name not in methods:
+            raise ValueError(f"Unsupported heuristic method '{method_name}'!" +
+                             f"\n Currently, only '{', '.join(methods)}' are supported.")
+
+
+def validate_positive(class_name: str, **params: Optional[int]):
+    """
+    Validates that the parameters of an instance of the class being created, e.g. its
+    max. number of worker processes, are positive or None.
+    """
+
+    if any(value is not None and value < 1 for value in params.values()):
+        names = "' and '".join(params)
+        raise ValueError(f"Creating {class_name} failed!" +
+                         f"\n Parameter{'s' if len(params) > 1 else ''} '{names}'" +
+                         " must be positive!")
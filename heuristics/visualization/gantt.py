@@ -11,11 +11,12 @@ The original author is unknown.
 import os
 import json
 import platform
+from concurrent.futures import ProcessPoolExecutor
 from operator import sub
+from typing import TYPE_CHECKING
 
-import numpy as np
-import matplotlib.pyplot as plt
-from matplotlib import rc
+if TYPE_CHECKING:
+    from heuristics.methods.schedule import Schedule
 
 # TeX support: on Linux assume TeX in /usr/bin, on OSX check for texlive
 if (platform.system() == 'Darwin') and 'tex' in os.getenv("PATH"):
@@ -25,9 +26,47 @@ elif (platform.system() == 'Linux') and os.path.isfile('/usr/bin/latex'):
 else:
     LATEX = False
 
-# setup pyplot w/ tex support
-if LATEX:
-    rc('text', usetex=True)
+# numpy and matplotlib are imported when the first chart is requested (see
+# loadPlotting), so importing this module does not slow down runs that never
+# render a chart
+np = None
+plt = None
+PolyCollection = None
+Patch = None
+MaxNLocator = None
+
+
+def loadPlotting(backend=None):
+    """Import numpy and matplotlib and setup pyplot once
+
+    :arg str backend: matplotlib backend to use, e.g. "Agg" to render
+        without a display, the default backend if None
+    """
+    # pylint: disable=global-statement, import-outside-toplevel
+    global np, plt, PolyCollection, Patch, MaxNLocator
+
+    if plt is not None:
+        if backend is not None and plt.get_backend().lower() != backend.lower():
+            plt.switch_backend(backend)
+        return
+
+    import numpy
+    import matplotlib
+    if backend is not None:
+        matplotlib.use(backend)
+    import matplotlib.pyplot
+    from matplotlib import rc
+    from matplotlib import collections, patches, ticker
+
+    # setup pyplot w/ tex support
+    if LATEX:
+        rc('text', usetex=True)
+
+    np = numpy
+    PolyCollection = collections.PolyCollection
+    Patch = patches.Patch
+    MaxNLocator = ticker.MaxNLocator
+    plt = matplotlib.pyplot
 
 
 class Package():
@@ -72,35 +111,90 @@ class Package():
 class Gantt():
     """Gantt
     Class to render a simple Gantt chart, with optional milestones
+
+    Large charts are rendered as a single collection of bars (see
+    renderCollection), which takes seconds even for 10^5 packages.
     """
-    def __init__(self, dataFile):
+
+    # render modes, "auto" picks "collection" for more than maxBars packages
+    # or more than maxBarLabels resource labels, one per time unit of a package
+    modes = ("auto", "bars", "collection")
+    maxBars = 500
+    maxBarLabels = 2000
+    # one xtick per time unit up to maxXticks time units
+    maxXticks = 50
+    # limits of the collection mode, beyond them packages are merged into rows,
+    # rows are not labeled and resources are drawn as an aggregated profile
+    maxRows = 1000
+    maxRowLabels = 100
+    maxResourceLabels = 200
+    def __init__(self, dataFile=None, data=None, backend=None):
         """ Instantiation
 
         Create a new Gantt using the data in the file provided
-        or the sample data that came along with the script
+        or the data given directly
 
         :arg str dataFile: file holding Gantt data
+        :arg dict data: Gantt data with the same keys as the file, used
+            instead of the file
+        :arg str backend: matplotlib backend, e.g. "Agg" for rendering
+            without a display
         """
+        loadPlotting(backend)
+
         self.dataFile = dataFile
 
         # some lists needed
         self.packages = []
         self.labels = []
 
-        self._loadData()
+        if data is None:
+            # load data
+            with open(self.dataFile) as fh:
+                data = json.load(fh)
+
+        self._loadData(data)
         self._procData()
 
-    def _loadData(self):
-        """ Load data from a JSON file that has to have the keys:
+    @classmethod
+    def from_arrays(cls, labels, starts, ends, resources, title="",
+                    xlabel="Time", ylabel="Activity", backend=None):
+        """ Create a new Gantt from the columns of a schedule, without
+        writing them to a file
+
+        :arg labels: labels of the packages, e.g. IDs of activities
+        :arg starts: starts of the packages
+        :arg ends: ends of the packages
+        :arg resources: resources of the packages
+        """
+        # Unscheduled packages have no start and are left out
+        packages = [{'label': str(label), 'start': int(start), 'end': int(end),
+                     'resource': int(resource)}
+                    for label, start, end, resource in zip(labels, starts, ends, resources)
+                    if start is not None]
+
+        return cls(data={'packages': packages, 'title': title, 'xlabel': xlabel,
+                         'ylabel': ylabel}, backend=backend)
+
+    @classmethod
+    def from_schedule(cls, schedule: 'Schedule', title=None, backend=None):
+        """ Create a new Gantt from a schedule produced by a heuristic
+        method, without writing it to a file
+
+        :arg Schedule schedule: the schedule to render
+        :arg str title: title of the chart, by default the method name
+        """
+        return cls.from_arrays(*_getScheduleColumns(schedule),
+                               title=_getScheduleTitle(schedule, title),
+                               backend=backend)
+
+    def _loadData(self, data):
+        """ Load data from a dict that has to have the keys:
             packages & title. Packages is an array of objects with
             a label, start and end property and optional milesstones
             and color specs.
         """
 
-        # load data
-        with open(self.dataFile) as fh:
-            data = json.load(fh)
-
         # must-haves
         self.title = data['title']
 
@@ -129,11 +223,9 @@ class Gantt():
             self.ylabel = data['ylabel']
         except KeyError:
             self.ylabel = ""
-        try:
-            #self.xticks = data['xticks']
-            self.xticks = list(range(1, max(pkg.end for pkg in self.packages) + 1))
-        except KeyError:
-            self.xticks = ""
+        # one tick per time unit only if they fit, matplotlib picks the ticks otherwise
+        projectEnd = max((pkg.end for pkg in self.packages), default=0)
+        self.xticks = list(range(1, projectEnd + 1)) if projectEnd <= self.maxXticks else []
 
     def _procData(self):
         """ Process data to have all values needed for plotting
@@ -143,8 +235,13 @@ class Gantt():
         self.start = [None] * self.nPackages
         self.end = [None] * self.nPackages
 
+        # index of the first package with each label
+        self.labelIndex = {}
+        for idx, label in enumerate(self.labels):
+            self.labelIndex.setdefault(label, idx)
+
         for pkg in self.packages:
-            idx = self.labels.index(pkg.label)
+            idx = self.labelIndex[pkg.label]
             self.start[idx] = pkg.start
             self.end[idx] = pkg.end
 
@@ -164,9 +261,10 @@ class Gantt():
             left='off',
             right='off')
 
-        # tighten axis but give a little room from bar height
-        plt.xlim(0, max(self.end))
-        plt.ylim(1, self.nPackages + 1)
+        # tighten axis but give a little room from bar height, a chart
+        # without packages spans a single time unit and row
+        plt.xlim(0, max(max(self.end, default=0), 1))
+        plt.ylim(1, max(self.nPackages, 1) + 1)
 
         # add title
         self.yticks = self.yPos
@@ -180,6 +278,8 @@ class Gantt():
 
         if self.xticks:
             plt.xticks(self.xticks, map(str, self.xticks))
+        else:
+            self.ax.xaxis.set_major_locator(MaxNLocator(integer=True))
 
         # Rotate x tick labels so that largest numbers fit
         plt.xticks(rotation=45, ha='right')
@@ -210,7 +310,7 @@ class Gantt():
         y = []
         for key in self.milestones.keys():
             for value in self.milestones[key]:
-                y += [self.yPos[self.labels.index(key)]]
+                y += [self.yPos[self.labelIndex[key]]]
                 x += [value]
 
         plt.scatter(x, y, s=120, marker="D",
@@ -225,7 +325,7 @@ class Gantt():
         for pkg in self.packages:
             if pkg.legend:
                 cnt += 1
-                idx = self.labels.index(pkg.label)
+                idx = self.labelIndex[pkg.label]
                 self.barlist[idx].set_label(pkg.legend)
 
         if cnt > 0:
@@ -244,10 +344,31 @@ class Gantt():
                 for i in range(pkg.start, pkg.end):
                     self.ax.text(i + 0.3, cnt + 0.35, pkg.resource, color='black', fontweight='bold')
 
-    def render(self):
+    def countBarLabels(self):
+        """ Count the resource labels drawn in the "bars" mode, one per
+        time unit of each package requiring resources
+        """
+        return sum(pkg.end - pkg.start for pkg in self.packages if pkg.resource)
+
+    def render(self, mode="auto"):
         """ Prepare data for plotting
+
+        :arg str mode: "bars" draws a bar and a resource label per time unit
+            for each package, "collection" uses renderCollection and "auto"
+            picks "bars" for at most maxBars packages with at most
+            maxBarLabels resource labels
         """
 
+        if mode not in self.modes:
+            raise ValueError(f"Unsupported render mode '{mode}'!" +
+                             f"\n Currently, only '{', '.join(self.modes)}' are supported.")
+
+        if mode == "collection" or (mode == "auto" and
+                                    (self.nPackages > self.maxBars or
+                                     self.countBarLabels() > self.maxBarLabels)):
+            self.renderCollection()
+            return
+
         # init figure
         self.fig, self.ax = plt.subplots(figsize=(10,5))
         self.ax.yaxis.grid(True)
@@ -272,10 +393,113 @@ class Gantt():
         self.add_legend()
         self.add_resource_requirements()
 
+    def renderCollection(self):
+        """ Prepare data for plotting all packages as a single collection
+
+        The packages are drawn as filled rectangles of one PolyCollection
+        instead of one artist per bar. If there are more than maxRows
+        packages, then consecutive packages share a row. Resources are
+        labeled once per bar, or drawn as the aggregated profile of all
+        packages if there are more than maxResourceLabels packages.
+        """
+
+        # init figure
+        self.fig, self.ax = plt.subplots(figsize=(10,5))
+        self.ax.xaxis.grid(True)
+
+        start = np.asarray(self.start, dtype=float)
+        end = np.asarray(self.end, dtype=float)
+
+        # merge consecutive packages into rows, the first package is at the top
+        nRows = min(self.nPackages, self.maxRows)
+        rows = np.arange(self.nPackages) * nRows // max(self.nPackages, 1)
+        self.yPos = nRows - rows
+
+        # corners of the bars: bottom left, top left, top right, bottom right
+        verts = np.empty((self.nPackages, 4, 2))
+        verts[:, :2, 0] = start[:, None]
+        verts[:, 2:, 0] = end[:, None]
+        verts[:, 0::3, 1] = self.yPos[:, None]
+        verts[:, 1:3, 1] = self.yPos[:, None] + 1
+
+        merged = nRows < self.nPackages
+        self.collection = PolyCollection(
+            verts, facecolors=[pkg.color for pkg in self.packages],
+            edgecolors="black", linewidths=0 if merged else 0.5)
+        self.ax.add_collection(self.collection)
+
+        # format plot, a chart without packages spans a single time unit and row
+        self.ax.set_xlim(0, max(end.max(initial=0), 1))
+        self.ax.set_ylim(1, max(nRows, 1) + 1)
+        self.ax.set_title(self.title)
+        if self.xlabel:
+            self.ax.set_xlabel(self.xlabel)
+        if self.ylabel:
+            self.ax.set_ylabel(self.ylabel)
+
+        if self.xticks:
+            self.ax.set_xticks(self.xticks)
+        else:
+            self.ax.xaxis.set_major_locator(MaxNLocator(integer=True))
+        plt.setp(self.ax.get_xticklabels(), rotation=45, ha='right')
+
+        if not merged and nRows <= self.maxRowLabels:
+            self.ax.set_yticks(self.yPos + 0.5)
+            self.ax.set_yticklabels(self.labels)
+        else:
+            self.ax.set_yticks([])
+
+        self.add_milestones()
+
+        # legend entries are shared by packages of the same legend
+        handles = {}
+        for pkg in self.packages:
+            if pkg.legend and pkg.legend not in handles:
+                handles[pkg.legend] = Patch(facecolor=pkg.color, label=pkg.legend)
+        if handles:
+            self.legend = self.ax.legend(handles=list(handles.values()),
+                                         shadow=False, ncol=3, fontsize="medium")
+
+        if self.nPackages <= self.maxResourceLabels:
+            for pkg, y in zip(self.packages, self.yPos):
+                if pkg.resource:
+                    self.ax.text((pkg.start + pkg.end) / 2, y + 0.35, pkg.resource,
+                                 color='black', fontweight='bold', ha='center')
+        else:
+            self.add_resource_profile()
+
+    def add_resource_profile(self):
+        """Add the resources required by all packages in each point in time
+        as a step line on a secondary y-axis
+        """
+
+        resources = np.asarray(self.resources, dtype=float)
+        times = np.concatenate((self.start, self.end))
+        changes = np.concatenate((resources, -resources))
+
+        order = np.argsort(times, kind="stable")
+        times = times[order]
+        levels = np.cumsum(changes[order])
+
+        # keep the level after the last change at each point in time
+        last = np.append(times[1:] != times[:-1], True)
+
+        self.resourceAx = self.ax.twinx()
+        self.resourceAx.step(times[last], levels[last], where="post",
+                             color="red", linewidth=1)
+        self.resourceAx.set_ylim(bottom=0)
+        self.resourceAx.set_ylabel("Resources")
+
+    def close(self):
+        """ Close the figure of the chart to free its memory
+        """
+        plt.close(self.fig)
+
     @staticmethod
     def show():
         """ Show the plot
         """
+        loadPlotting()
         plt.show()
 
     @staticmethod
@@ -284,9 +508,75 @@ class Gantt():
 
         :arg str saveFile: file to save to
         """
+        loadPlotting()
         plt.savefig(saveFile, bbox_inches='tight')
 
 
+def render_schedules(schedules, imageFiles, mode="auto", maxWorkers=None,
+                     backend="Agg"):
+    """ Render the Gantt charts of many schedules to image files
+
+    Only the columns of the schedules are sent to the worker processes of
+    a ProcessPoolExecutor, which render the charts using a non-interactive
+    backend, so nothing is written between solving and rendering.
+
+    :arg schedules: schedules (see Schedule) or tuples of labels, starts,
+        ends, resources and title
+    :arg imageFiles: files to save the charts to, one per schedule
+    :arg str mode: render mode, see Gantt.render
+    :arg int maxWorkers: number of processes, the number of CPUs if None,
+        1 renders in the calling process
+    :arg str backend: matplotlib backend of the processes
+    :returns: the image files
+    """
+
+    tasks = []
+    for schedule, imageFile in zip(schedules, imageFiles):
+        if isinstance(schedule, tuple):
+            columns = schedule
+        else:
+            columns = (*_getScheduleColumns(schedule), _getScheduleTitle(schedule))
+        tasks.append((columns, str(imageFile), mode))
+
+    if maxWorkers == 1:
+        loadPlotting(backend)
+        return [_renderChart(task) for task in tasks]
+
+    with ProcessPoolExecutor(maxWorkers, initializer=loadPlotting,
+                             initargs=(backend,)) as executor:
+        return list(executor.map(_renderChart, tasks))
+
+
+def _getScheduleColumns(schedule):
+    """ Return the labels, starts, ends and resources of the activities of
+    a schedule
+    """
+    activities = schedule.project.activities
+    return ([str(act.id) for act in activities], list(schedule.starts),
+            list(schedule.ends), [act.resources for act in activities])
+
+
+def _getScheduleTitle(schedule, title=None):
+    """ Return the title of the chart of a schedule
+    """
+    if title is not None:
+        return title
+    return f"{schedule.method_name} - Gantt chart" if schedule.method_name else ""
+
+
+def _renderChart(task):
+    """ Render a chart in a worker process and save it to a file
+    """
+    (labels, starts, ends, resources, title), imageFile, mode = task
+
+    gantt = Gantt.from_arrays(labels, starts, ends, resources, title)
+    gantt.render(mode)
+    gantt.fig.savefig(imageFile, bbox_inches='tight')
+    gantt.close()
+
+    return imageFile
+
+
 if __name__ == '__main__':
     g = Gantt('sample.json')
     g.render()
@@ -0,0 +1,102 @@
+from contextlib import redirect_stderr
+from csv import DictReader
+from io import StringIO
+from pathlib import Path
+from tempfile import TemporaryDirectory
+import unittest
+from nose2.tools import params
+from heuristics.benchmarks.runner import BenchmarkResult, BenchmarkRunner, main
+
+
+class BenchmarkRunnerTestSuite(unittest.TestCase):
+    """Tests that assure BenchmarkRunner works correctly."""
+
+    ## Test correct behavior
+    def test_run(self):
+        """Tests that every stage is measured for every size in order."""
+
+        results = BenchmarkRunner((20, 50), ("phm", "loader", "cpm"), repeats=2).run()
+
+        self.assertListEqual([result.key for result in results],
+                             [("loader", 20), ("cpm", 20), ("phm", 20),
+                              ("loader", 50), ("cpm", 50), ("phm", 50)])
+        self.assertTrue(all(result.seconds > 0 and result.peak_memory > 0
+                            for result in results))
+
+    @params(((1.0, 100), 0.25, 0.25, []),
+            ((1.2, 120), 0.25, 0.25, []),
+            ((1.3, 100), 0.25, 0.25, ["time"]),
+            ((1.0, 130), 0.25, 0.25, ["peak memory"]),
+            ((1.3, 130), 0.5, 0.5, []),
+            ((2.0, 200), 0.25, 0.5, ["time", "peak memory"]))
+    def test_compare(self, measured: tuple, time_threshold: float, memory_threshold: float,
+                     regressed: list):
+        """Tests that only the results exceeding the thresholds regress."""
+
+        baseline = [BenchmarkResult("phm", 100, 1.0, 100), BenchmarkResult("cpm", 100, 1.0, 100)]
+        results = [BenchmarkResult("phm", 100, *measured), BenchmarkResult("phm", 1000, 9.0, 900)]
+
+        regressions = BenchmarkRunner.compare(results, baseline, time_threshold,
+                                              memory_threshold)
+
+        self.assertEqual(len(regressions), len(regressed))
+        for regression, name in zip(regressions, regressed):
+            self.assertTrue(regression.startswith(f"phm (100 activities): {name} "))
+
+    def test_json_file(self):
+        """Tests that the results written to a JSON file are loaded back."""
+
+        results = [BenchmarkResult("loader", 10, 0.5, 1024), BenchmarkResult("shm", 10, 1.5, 64)]
+
+        with TemporaryDirectory() as temp_dir:
+            json_file_path = Path(temp_dir, "results.json")
+            BenchmarkRunner.to_json_file(results, json_file_path)
+            loaded_results = BenchmarkRunner.from_json_file(json_file_path)
+
+        self.assertListEqual([result.to_dict() for result in loaded_results],
+                             [result.to_dict() for result in results])
+
+    def test_main(self):
+        """
+        Tests that the entry point writes the results and fails only if they regress compared
+        to the baseline.
+        """
+
+        with TemporaryDirectory() as temp_dir:
+            json_file_path, csv_file_path = Path(temp_dir, "base.json"), Path(temp_dir, "r.csv")
+            exit_code = main(["-s", "30", "--stages", "loader", "shm", "-n", "1",
+                              "-o", str(json_file_path), "--csv", str(csv_file_path)])
+            with open(csv_file_path, encoding="utf-8") as file:
+                rows = list(DictReader(file))
+
+            with redirect_stderr(StringIO()) as stderr_loose:
+                exit_code_loose = main(["-s", "30", "--stages", "shm", "-n", "1",
+                                        "--csv", str(csv_file_path), "-b", str(json_file_path),
+                                        "--time-threshold", "1000",
+                                        "--memory-threshold", "1000"])
+
+            BenchmarkRunner.to_json_file([BenchmarkResult("shm", 30, 0.0, 0)], json_file_path)
+            with redirect_stderr(StringIO()) as stderr_strict:
+                exit_code_strict = main(["-s", "30", "--stages", "shm", "-n", "1",
+                                         "--csv", str(csv_file_path), "-b", str(json_file_path)])
+
+        self.assertEqual(exit_code, 0)
+        self.assertListEqual([(row['stage'], int(row['size'])) for row in rows],
+                             [("loader", 30), ("shm", 30)])
+        self.assertEqual(exit_code_loose, 0)
+        self.assertEqual(stderr_loose.getvalue(), "")
+        self.assertEqual(exit_code_strict, 1)
+        self.assertListEqual([line.split(": ")[:2] for line in
+                              stderr_strict.getvalue().splitlines()],
+                             [["Regression", "shm (30 activities)"]] * 2)
+        self.assertIn("time", stderr_strict.getvalue().splitlines()[0])
+        self.assertIn("peak memory", stderr_strict.getvalue().splitlines()[1])
+
+    ## Test failures
+    @params(({'stage_names': ("cpm", "ga")}), ({'repeats': 0}), ({'sizes': (10, 0)}))
+    def test_creating_runner_with_invalid_arguments_should_fail(self, kwargs: dict):
+        """Tests that the runner is not created with invalid arguments."""
+
+        with self.assertRaises(ValueError, msg="Creating the runner should have failed as" +
+                               f" the arguments '{kwargs}' are invalid!"):
+            BenchmarkRunner(**kwargs)
@@ -0,0 +1,134 @@
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
+from nose2.tools import params
+from heuristics.core.activities.generator import ActivitiesGenerator
+from heuristics.core.activities.loader import ActivitiesLoader
+from heuristics.core.cpm import CriticalPathMethod as CPM
+from heuristics.methods.phm import ParallelHeuristicMethod as PHM
+
+
+class ActivitiesGeneratorTestSuite(unittest.TestCase):
+    """Tests that assure ActivitiesGenerator works correctly."""
+
+    ## Test correct behavior
+    @params(({'num_activities': 10}, "input.csv"),
+            ({'num_activities': 300, 'complexity': 2.5}, "input.csv.gz"),
+            ({'num_activities': 200, 'depth': 4}, "input.csv.xz"),
+            ({'num_activities': 100, 'width': 3}, "input.csv"),
+            ({'num_activities': 64, 'depth': 3, 'width': 4}, "input.csv"),
+            ({'num_activities': 16, 'depth': 3, 'width': 4}, "input.csv"))
+    def test_write(self, kwargs: dict, file_name: str):
+        """
+        Tests that the written network is loaded back and has a single start and end node.
+        """
+
+        generator = ActivitiesGenerator(**kwargs, seed=7)
+
+        with TemporaryDirectory() as temp_dir:
+            acts_file_path = Path(temp_dir, file_name)
+            network = generator.write(acts_file_path)
+            rows = [row for chunk in ActivitiesLoader.iter_activity_rows(acts_file_path)
+                    for row in chunk]
+            cpm = CPM(acts_file_path, network.r_max)
+            cpm.solve()
+
+        self.assertEqual(len(rows), kwargs['num_activities'])
+        self.assertEqual(network.num_activities, kwargs['num_activities'])
+        self.assertListEqual(rows, list(generator.iter_rows()))
+        self.assertTrue(all(0 < start_node < end_node for start_node, end_node, _, _ in rows))
+
+        start_nodes = {row[0] for row in rows}
+        end_nodes = {row[1] for row in rows}
+        self.assertSetEqual(start_nodes - end_nodes, {1})
+        self.assertSetEqual(end_nodes - start_nodes, {network.num_nodes})
+        self.assertEqual(len(start_nodes | end_nodes), network.num_nodes)
+
+        self.assertEqual(cpm.project.earliest_end, network.earliest_end)
+        self.assertEqual(network.r_min, max(row[3] for row in rows))
+        self.assertTrue(network.r_min <= network.r_max <= network.r_peak)
+
+    @params(0.5, 1.5, 3, 10)
+    def test_complexity_is_capped_for_small_networks(self, complexity: float):
+        """Tests that small networks are generated with the requested number of activities."""
+
+        for num_activities in range(4, 40):
+            generator = ActivitiesGenerator(num_activities, complexity=complexity)
+
+            self.assertEqual(len(list(generator.iter_rows())), num_activities)
+
+    @params(1, 3, 10)
+    def test_narrower_layers_for_small_networks_of_given_width(self, width: int):
+        """
+        Tests that small networks of a given width are generated with the requested number
+        of activities and that their layers are not wider than the width.
+        """
+
+        for num_activities in range(2, 40):
+            generator = ActivitiesGenerator(num_activities, width=width)
+
+            self.assertEqual(len(list(generator.iter_rows())), num_activities)
+            self.assertLessEqual(generator.width, width)
+
+    def test_seed(self):
+        """Tests that the same seed produces the same network and another seed does not."""
+
+        rows = list(ActivitiesGenerator(500, seed=1).iter_rows())
+
+        self.assertListEqual(list(ActivitiesGenerator(500, seed=1).iter_rows()), rows)
+        self.assertNotEqual(list(ActivitiesGenerator(500, seed=2).iter_rows()), rows)
+
+    @params((0, "r_min"), (1, "r_peak"))
+    def test_resource_strength(self, resource_strength: float, r_max_name: str):
+        """Tests that the resource strength spans the r_max values from r_min to r_peak."""
+
+        with TemporaryDirectory() as temp_dir:
+            network = ActivitiesGenerator(200, resource_strength=resource_strength,
+                                          seed=3).write(Path(temp_dir, "input.csv"))
+
+        self.assertEqual(network.r_max, getattr(network, r_max_name))
+
+    def test_resources_do_not_delay_at_peak(self):
+        """Tests that the earliest starts schedule fits into the peak resources."""
+
+        with TemporaryDirectory() as temp_dir:
+            acts_file_path = Path(temp_dir, "input.csv")
+            network = ActivitiesGenerator(300, resource_strength=1, seed=5).write(acts_file_path)
+            schedule = PHM(acts_file_path, network.r_peak).solve()
+
+        self.assertEqual(schedule.actual_end, network.earliest_end)
+
+    def test_resource_changes_stay_within_horizon(self):
+        """
+        Tests that the changes of the resources are kept for at most twice the times of
+        the earliest starts schedule.
+        """
+
+        generator = ActivitiesGenerator(200, durations=(1000, 1000), seed=9)
+        # The changes are read from the call computing the peak resources from them
+        # pylint: disable=protected-access
+        with TemporaryDirectory() as temp_dir, \
+                patch.object(ActivitiesGenerator, "_get_peak_resources",
+                             wraps=ActivitiesGenerator._get_peak_resources) as peak_resources_mock:
+            network = generator.write(Path(temp_dir, "input.csv"))
+
+        num_times = len(peak_resources_mock.call_args.args[0])
+        self.assertGreater(num_times, network.earliest_end)
+        self.assertLessEqual(num_times, 2 * (network.earliest_end + 1))
+
+    ## Test failures
+    @params(({'num_activities': 0}), ({'num_activities': 10, 'depth': 0}),
+            ({'num_activities': 10, 'width': -1}), ({'num_activities': 10, 'complexity': 0}),
+            ({'num_activities': 10, 'resource_strength': 1.5}),
+            ({'num_activities': 10, 'durations': (5, 2)}),
+            ({'num_activities': 10, 'resources': (-1, 2)}),
+            ({'num_activities': 5, 'depth': 1}),
+            ({'num_activities': 15, 'depth': 3, 'width': 4}),
+            ({'num_activities': 65, 'depth': 3, 'width': 4}))
+    def test_creating_generator_with_invalid_arguments_should_fail(self, kwargs: dict):
+        """Tests that the generator is not created with invalid arguments."""
+
+        with self.assertRaises(ValueError, msg="Creating the generator should have failed as" +
+                               f" the arguments '{kwargs}' are invalid!"):
+            ActivitiesGenerator(**kwargs)
@@ -1,4 +1,5 @@
 import unittest
+from random import Random
 from nose2.tools import params
 from heuristics.core.activities.activity import Activity
 from heuristics.core.activities.activity_id import ActivityID as ID
@@ -71,6 +72,29 @@ class ActivitiesInitializerTestSuite(unittest.TestCase):
             succs_ids = [succ.id for succ in act.successors]
             self.assertListEqual(succs_ids, correct_succs_ids[act.id])
 
+    @params(activities, activities_2)
+    def test_init_activities_keeps_order_of_activities(self, activities):
+        """
+        Tests that 'init_activities' orders the predecessors and successors of activities
+        the same way as Activity determines them.
+        """
+
+        shuffled_activities = [Activity(act.id, act.duration, act.resources)
+                               for act in activities]
+        Random(42).shuffle(shuffled_activities)
+
+        ActivitiesInitializer.init_activities(shuffled_activities)
+
+        for act in shuffled_activities:
+            correct_act = Activity(act.id, act.duration, act.resources)
+            correct_act.determine_predecessors(shuffled_activities)
+            correct_act.determine_successors(shuffled_activities)
+
+            self.assertListEqual([pred.id for pred in act.predecessors],
+                                 [pred.id for pred in correct_act.predecessors])
+            self.assertListEqual([succ.id for succ in act.successors],
+                                 [succ.id for succ in correct_act.successors])
+
     ## Test failures
     def test_init_activities_provided_in_nonlist_should_fail(self):
         """
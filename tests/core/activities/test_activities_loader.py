@@ -1,4 +1,8 @@
+import gzip
+from hashlib import blake2b
+import lzma
 import unittest
+from tempfile import TemporaryDirectory
 from typing import List
 from pathlib import Path
 from nose2.tools import params
@@ -38,7 +42,67 @@ class ActivitiesLoaderTestSuite(unittest.TestCase):
 
         self.assertListEqual(activities, acts_correct)
 
+    @params((ProblemsPaths.problem_1_dir, gzip.open, activities_correct),
+            (ProblemsPaths.problem_2_dir, lzma.open, activities_2_correct))
+    def test_get_data_from_compressed_file(self, prob_dir: str, compressed_open,
+                                           acts_correct: List[Activity]):
+        """Tests that getting activities from a gzip/xz-compressed file works correctly."""
+
+        with open(f"{prob_dir}/input.csv", "rb") as file:
+            contents = file.read()
+
+        with TemporaryDirectory() as tmp_dir:
+            acts_file_path = Path(tmp_dir) / "input.csv.compressed"
+            with compressed_open(acts_file_path, "wb") as file:
+                file.write(contents)
+
+            activities = ActivitiesLoader.get_activities(acts_file_path)
+
+        self.assertListEqual(activities, acts_correct)
+
+    @params(open, gzip.open, lzma.open)
+    def test_digest_of_read_bytes(self, file_open):
+        """Tests that the digest updated while parsing is the hash of the whole file."""
+
+        with open(f"{ProblemsPaths.problem_1_dir}/input.csv", "rb") as file:
+            contents = file.read()
+
+        with TemporaryDirectory() as tmp_dir:
+            acts_file_path = Path(tmp_dir) / "input.csv"
+            with file_open(acts_file_path, "wb") as file:
+                file.write(contents)
+            with open(acts_file_path, "rb") as file:
+                file_digest = blake2b(file.read()).digest()
+
+            digest = blake2b()
+            activities = ActivitiesLoader.get_activities(acts_file_path, digest)
+
+        self.assertListEqual(activities, self.activities_correct)
+        self.assertEqual(digest.digest(), file_digest)
+
+    @params((1, 7), (3, 3), (7, 1), (100, 1))
+    def test_iter_activities_in_chunks(self, chunk_size: int, num_chunks: int):
+        """Tests that streaming activities yields them in chunks of the given size."""
+
+        chunks = list(ActivitiesLoader.iter_activities(
+            f"{ProblemsPaths.problem_1_dir}/input.csv", chunk_size))
+
+        self.assertEqual(len(chunks), num_chunks)
+        self.assertTrue(all(len(chunk) <= chunk_size for chunk in chunks))
+        self.assertListEqual([act for chunk in chunks for act in chunk],
+                             self.activities_correct)
+
     ## Test failures
+    @params((f"{invalid_problems_dir}/problem_duplicate_activity_id.csv", ValueError, 4),
+            (f"{invalid_problems_dir}/problem_invalid_duration.csv", ValueError, 3),
+            (f"{invalid_problems_dir}/problem_missing_resources.csv", DataNotFoundError, 7))
+    def test_get_data_failure_reports_line_number(self, acts_file_path: str,
+                                                  error_type: type, line_num: int):
+        """Tests that failing to get activities reports the line of the file that failed."""
+
+        with self.assertRaisesRegex(error_type, f"line {line_num}"):
+            ActivitiesLoader.get_activities(acts_file_path)
+
     @params(f"{invalid_problems_dir}/problem_duplicate_activity_id.csv")
     def test_get_data_with_duplicate_activity_should_fail(self, acts_file_path: str):
         """
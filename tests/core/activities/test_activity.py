@@ -62,8 +62,7 @@ class ActivityTest(unittest.TestCase):
                               'resources': resources, 'total_resources': duration * resources,
                               'earliest_start': earliest_start, 'earliest_end': earliest_end,
                               'latest_start': latest_start, 'latest_end': latest_end,
-                              'time_reserve': time_reserve, 'actual_start': None,
-                              'actual_end': None, 'priority': None })
+                              'time_reserve': time_reserve})
 
     @params((Activity("2-3", 0, 0), activities, [ID.from_str("1-2")]),
             (Activity("3-5", 0, 0), activities, [ID.from_str("1-3"), ID.from_str("2-3")]),
@@ -139,7 +138,7 @@ class ActivityTest(unittest.TestCase):
 
         # If this fails, then edit this test to validate the comparison of the equality
         # of Activity instances using all variables
-        self.assertEqual(len(vars(act_left).items()), 14)
+        self.assertEqual(len(vars(act_left).items()), 11)
 
         self.assertEqual(act_left == act_right, acts_equal,
                          msg="Comparison of equality failed!" +
@@ -1,4 +1,6 @@
+import pickle
 import unittest
+from copy import deepcopy
 from nose2.tools import params
 
 from heuristics.core.activities.activity_id import ActivityID as ID
@@ -61,6 +63,32 @@ class ActivityIDTest(unittest.TestCase):
 
         act_id = ID(start_node, end_node)
         self.assertIsInstance(hash(act_id), int)
+        self.assertEqual(hash(act_id), hash(ID.from_str(f"{start_node}-{end_node}")))
+
+    def test_hash_distinguishes_ids(self):
+        """Tests that different instances of ActivityID do not share a single hash."""
+
+        act_ids = [ID(start_node, end_node) for start_node in range(1, 30)
+                   for end_node in range(start_node, 30)]
+
+        self.assertEqual(len({hash(act_id) for act_id in act_ids}), len(act_ids))
+        self.assertEqual(len(set(act_ids)), len(act_ids))
+
+    @params((1, 2), (4, 12), (11, 13))
+    def test_ids_are_interned(self, start_node, end_node):
+        """Tests that ActivityID instances with the same nodes are the same instance."""
+
+        act_id = ID(start_node, end_node)
+
+        self.assertIs(ID.from_str(f"{start_node}-{end_node}"), act_id)
+        self.assertIs(pickle.loads(pickle.dumps(act_id)), act_id)
+        self.assertIs(deepcopy(act_id), act_id)
+
+    @params((1, 2), (4, 12), (11, 13))
+    def test_as_tuple(self, start_node, end_node):
+        """Tests that the 'as_tuple' function of ActivityID returns a tuple of its nodes."""
+
+        self.assertTupleEqual(ID(start_node, end_node).as_tuple(), (start_node, end_node))
 
     ## Test failures
     @params((1, None), (None, 2))
@@ -91,6 +119,19 @@ class ActivityIDTest(unittest.TestCase):
                                " should have failed as the activity is in the opposite direction!"):
             ID(start_node, end_node)
 
+    def test_modifying_id_should_fail(self):
+        """Tests that ActivityID cannot be modified as it is immutable."""
+
+        act_id = ID(1, 2)
+
+        with self.assertRaises(AttributeError, msg="Modifying the ActivityID should have" +
+                               " failed as ActivityID instances are immutable!"):
+            act_id.start_node = 2
+
+        with self.assertRaises(AttributeError, msg="Modifying the ActivityID should have" +
+                               " failed as ActivityID instances are immutable!"):
+            act_id.priority = 2
+
     def test_comparing_equality_with_different_type_should_fail(self):
         """Tests that equality comparison fails when a different type is supplied."""
 
@@ -0,0 +1,145 @@
+import os
+from pathlib import Path
+from shutil import copyfile
+from tempfile import TemporaryDirectory
+import unittest
+from nose2.tools import params
+from heuristics.core.cache import ProjectCache
+from heuristics.core.cpm import CriticalPathMethod as CPM
+from heuristics.core.project import Project
+from heuristics.methods.phm import ParallelHeuristicMethod as PHM
+from heuristics.methods.phmdp import ParallelHeuristicMethodDynamicPriorities as PHMDP
+from heuristics.methods.shm import SerialHeuristicMethod as SHM
+from tests.resources.problems.problems import ProblemsPaths
+
+
+class ProjectCacheTestSuite(unittest.TestCase):
+    """Tests that assure ProjectCache works correctly."""
+
+    ## Test correct behavior
+    @params((ProblemsPaths.problem_1_dir, 7), (ProblemsPaths.problem_2_dir, 6),
+            (ProblemsPaths.problem_3_dir, 8), (ProblemsPaths.problem_4_dir, 6))
+    def test_methods_sharing_cache(self, problem_dir: str, r_max: int):
+        """
+        Tests that methods sharing a cache parse the file once and produce the same results
+        as methods without a cache.
+        """
+
+        acts_file_path = f"{problem_dir}/input.csv"
+        project_cache = ProjectCache()
+
+        cpm = CPM(acts_file_path, r_max, project_cache=project_cache)
+        cpm.solve()
+        correct_cpm = CPM(acts_file_path, r_max)
+        correct_cpm.solve()
+        self.assertListEqual(cpm.project.activities, correct_cpm.project.activities)
+
+        for method_class in (SHM, PHM, PHMDP):
+            method = method_class(acts_file_path, r_max, project_cache)
+            method.solve()
+            correct_method = method_class(acts_file_path, r_max)
+            correct_method.solve()
+
+            self.assertListEqual(method.cpm.project.activities,
+                                 correct_method.cpm.project.activities)
+            self.assertEqual(method.schedule, correct_method.schedule)
+
+        self.assertEqual(project_cache.misses, 1)
+        self.assertEqual(project_cache.hits, 3)
+        self.assertEqual(len(project_cache), 1)
+        self.assertIn(acts_file_path, project_cache)
+
+    def test_copies_are_independent(self):
+        """Tests that the projects handed out by the cache do not share activities."""
+
+        project_cache = ProjectCache()
+        acts_file_path = f"{ProblemsPaths.problem_1_dir}/input.csv"
+
+        project = project_cache.get_project(acts_file_path, 6, 2, None, 30)
+        project_2 = project_cache.get_project(acts_file_path, 7)
+
+        self.assertEqual((project.r_max, project.start, project.planned_end), (6, 2, 30))
+        self.assertEqual((project_2.r_max, project_2.start, project_2.planned_end),
+                         (7, 0, None))
+        self.assertListEqual(project.activities, project_2.activities)
+
+        for act, act_2 in zip(project.activities, project_2.activities):
+            self.assertIsNot(act, act_2)
+            for pred in act.predecessors:
+                self.assertTrue(any(pred is other_act for other_act in project.activities))
+            for pred in act_2.predecessors:
+                self.assertTrue(any(pred is other_act for other_act in project_2.activities))
+
+        project.activities[0].earliest_start = 0
+        self.assertIsNone(project_2.activities[0].earliest_start)
+        self.assertIsNone(project_cache.get_project(acts_file_path, 6).activities[0]
+                          .earliest_start)
+
+    def test_changed_file_is_parsed_again(self):
+        """
+        Tests that a file with a changed content is parsed again, but a file only touched is
+        not.
+        """
+
+        project_cache = ProjectCache()
+        with TemporaryDirectory() as temp_dir:
+            acts_file_path = Path(temp_dir, "input.csv")
+            copyfile(f"{ProblemsPaths.problem_1_dir}/input.csv", acts_file_path)
+            num_acts = len(project_cache.get_project(acts_file_path, 6).activities)
+
+            stat = os.stat(acts_file_path)
+            os.utime(acts_file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+            self.assertEqual(len(project_cache.get_project(acts_file_path, 6).activities),
+                             num_acts)
+            self.assertEqual((project_cache.hits, project_cache.misses), (1, 1))
+
+            with open(acts_file_path, "a", encoding="utf-8") as file:
+                file.write("\n100-101 1 1")
+            self.assertEqual(len(project_cache.get_project(acts_file_path, 6).activities),
+                             num_acts + 1)
+            self.assertEqual((project_cache.hits, project_cache.misses), (1, 2))
+
+    def test_lru_eviction(self):
+        """Tests that the least recently used projects are evicted over the limits."""
+
+        paths = [f"{problem_dir}/input.csv" for problem_dir in
+                 (ProblemsPaths.problem_1_dir, ProblemsPaths.problem_2_dir,
+                  ProblemsPaths.problem_3_dir)]
+
+        project_cache = ProjectCache(max_entries=2)
+        for path in (paths[0], paths[1], paths[0], paths[2]):
+            project_cache.get_project(path, 6)
+
+        self.assertEqual(len(project_cache), 2)
+        self.assertIn(paths[0], project_cache)
+        self.assertNotIn(paths[1], project_cache)
+        self.assertIn(paths[2], project_cache)
+
+        project_cache = ProjectCache(max_bytes=0)
+        project = project_cache.get_project(paths[0], 6)
+        self.assertEqual(len(project_cache), 0)
+        self.assertIsInstance(project, Project)
+
+        project_cache = ProjectCache()
+        project_cache.get_project(paths[0], 6)
+        project_cache.max_bytes = project_cache.nbytes
+        project_cache.get_project(paths[1], 6)
+        self.assertLessEqual(project_cache.nbytes, project_cache.max_bytes)
+        self.assertNotIn(paths[0], project_cache)
+
+    ## Test failures
+    @params((0, 1024), (1, -1))
+    def test_creating_cache_with_invalid_limits_should_fail(self, max_entries: int,
+                                                            max_bytes: int):
+        """Tests that the cache is not created with invalid limits."""
+
+        with self.assertRaises(ValueError, msg="Creating the cache should have failed as" +
+                               " the limits are invalid!"):
+            ProjectCache(max_entries, max_bytes)
+
+    def test_getting_missing_file_should_fail(self):
+        """Tests that getting a project from a missing file fails."""
+
+        with self.assertRaises(FileNotFoundError, msg="Getting the project should have" +
+                               " failed as the file does not exist!"):
+            ProjectCache().get_project("missing_file.csv", 6)
@@ -14,23 +14,33 @@ class CPMTestSuite(unittest.TestCase):
 
     ## Test correct behavior
     @params(# Problem 1
-            (ProblemsPaths.problem_1_dir, "cpm_solution.csv", 7, 0, 13, None, 112),
+            (ProblemsPaths.problem_1_dir, "cpm_solution.csv", 7, 0, 13, None, 112, "python"),
+            (ProblemsPaths.problem_1_dir, "cpm_solution.csv", 7, 0, 13, None, 112,
+             "vectorized"),
             # Problem 2
-            (ProblemsPaths.problem_2_dir, "cpm_solution.csv", 6, 0, 10, None, 71),
+            (ProblemsPaths.problem_2_dir, "cpm_solution.csv", 6, 0, 10, None, 71, "python"),
+            (ProblemsPaths.problem_2_dir, "cpm_solution.csv", 6, 0, 10, None, 71,
+             "vectorized"),
             # Problem 2 - with project start set to time unit 5
             (ProblemsPaths.problem_2_dir,
-             "cpm_solution_delayed_proj_start.csv", 6, 5, 20, 20, 71),
+             "cpm_solution_delayed_proj_start.csv", 6, 5, 20, 20, 71, "python"),
+            (ProblemsPaths.problem_2_dir,
+             "cpm_solution_delayed_proj_start.csv", 6, 5, 20, 20, 71, "vectorized"),
             # Problem 3
-            (ProblemsPaths.problem_3_dir, "cpm_solution.csv", 8, 0, 39, None, 255),
+            (ProblemsPaths.problem_3_dir, "cpm_solution.csv", 8, 0, 39, None, 255, "python"),
+            (ProblemsPaths.problem_3_dir, "cpm_solution.csv", 8, 0, 39, None, 255,
+             "vectorized"),
             # Problem 4
-            (ProblemsPaths.problem_4_dir, "cpm_solution.csv", 6, 0, 11, None, 83))
+            (ProblemsPaths.problem_4_dir, "cpm_solution.csv", 6, 0, 11, None, 83, "python"),
+            (ProblemsPaths.problem_4_dir, "cpm_solution.csv", 6, 0, 11, None, 83,
+             "vectorized"))
     def test_cpm(self, problem_dir: str, solution_file: str, r_max: int, proj_start: int,
-                 proj_end: int, proj_planned_end: int, proj_resources: int):
+                 proj_end: int, proj_planned_end: int, proj_resources: int, engine: str):
         """Tests CPM on a set of problems."""
         problem_file = f"{problem_dir}/input.csv"
         correct_acts_file = f"{problem_dir}/{solution_file}"
 
-        cpm = CPM(problem_file, r_max, proj_start, proj_planned_end)
+        cpm = CPM(problem_file, r_max, proj_start, proj_planned_end, engine)
 
         # Assert that the method has no output
         self.assertEqual(self._get_method_output(cpm.solve), '')
@@ -46,18 +56,21 @@ class CPMTestSuite(unittest.TestCase):
 
     @params(# Problem 1 - with unrealistic project end
             (f"{ProblemsPaths.problem_1_dir}/input.csv",
-             f"{ProblemsPaths.problem_1_dir}/cpm_solution.csv", 7, 0, 13, 10, 112))
+             f"{ProblemsPaths.problem_1_dir}/cpm_solution.csv", 7, 0, 13, 10, 112, "python"),
+            (f"{ProblemsPaths.problem_1_dir}/input.csv",
+             f"{ProblemsPaths.problem_1_dir}/cpm_solution.csv", 7, 0, 13, 10, 112,
+             "vectorized"))
     def test_cpm_solve_warning_for_unrealistic_project_end(self, problem_file: str,
                                                            correct_acts_file: str, r_max: int,
                                                            proj_start: int, proj_end: int,
                                                            proj_planned_end : int,
-                                                           proj_resources: int):
+                                                           proj_resources: int, engine: str):
         """
         Tests CPM on a problem with an unrealistic planned project end (planned to end earlier
         than possible).
         """
 
-        cpm = CPM(problem_file, r_max, proj_start, proj_planned_end)
+        cpm = CPM(problem_file, r_max, proj_start, proj_planned_end, engine)
 
         self.assertGreater(len(self._get_method_output(cpm.solve)), 0)
 
@@ -70,6 +83,118 @@ class CPMTestSuite(unittest.TestCase):
         self.assertEqual(cpm.project.earliest_end, proj_end)
         self.assertEqual(cpm.project.total_resources_required, proj_resources)
 
+    @params((ProblemsPaths.problem_1_dir, None, "1-3", 9, "python"),
+            (ProblemsPaths.problem_1_dir, None, "4-6", 1, "vectorized"),
+            (ProblemsPaths.problem_2_dir, 20, "1-2", 12, "python"),
+            (ProblemsPaths.problem_3_dir, None, "1-4", 18, "python"),
+            (ProblemsPaths.problem_3_dir, None, "6-7", 0, "vectorized"),
+            (ProblemsPaths.problem_4_dir, None, "1-2", 3, "python"))
+    def test_update_duration(self, problem_dir: str, proj_planned_end: int, act_id: str,
+                             new_duration: int, engine: str):
+        """
+        Tests that updating the duration of an activity produces the same results as solving
+        the problem with the new duration from scratch.
+        """
+
+        problem_file = f"{problem_dir}/input.csv"
+        cpm = CPM(problem_file, 6, 0, proj_planned_end, engine)
+        cpm.solve()
+
+        changed_acts = cpm.update_duration(act_id, new_duration)
+
+        cpm_correct = CPM(problem_file, 6, 0, proj_planned_end)
+        for act in cpm_correct.project.activities:
+            if str(act.id) == act_id:
+                act.duration = new_duration
+                act.total_resources = act.duration * act.resources
+        cpm_correct.project.total_resources_required = sum(
+            act.total_resources for act in cpm_correct.project.activities)
+        cpm_correct.solve()
+
+        self.assertListEqual(cpm.project.activities, cpm_correct.project.activities)
+        self.assertEqual(cpm.project.earliest_end, cpm_correct.project.earliest_end)
+        self.assertEqual(cpm.project.total_resources_required,
+                         cpm_correct.project.total_resources_required)
+        self.assertIn(act_id, [str(act.id) for act in changed_acts])
+
+        if engine == "vectorized":
+            self.assertListEqual(cpm.graph.durations.tolist(),
+                                 [act.duration for act in cpm.project.activities])
+            self.assertListEqual(cpm.graph.time_reserve.tolist(),
+                                 [act.time_reserve for act in cpm.project.activities])
+
+    @params("python", "vectorized")
+    def test_update_duration_does_not_repeat_warning(self, engine: str):
+        """
+        Tests that the warning about an unrealistic planned project end is printed only by
+        the full solve and that the earliest end is still used after updates.
+        """
+
+        cpm = CPM(f"{ProblemsPaths.problem_1_dir}/input.csv", 7, 0, 10, engine)
+
+        self.assertGreater(len(self._get_method_output(cpm.solve)), 0)
+        self.assertEqual(len(self._get_method_output(lambda: cpm.update_duration("1-3", 9))), 0)
+        self.assertEqual(cpm.project.earliest_end, 16)
+
+    def test_update_duration_only_changes_affected_activities(self):
+        """Tests that updating a duration changes only the activities affected by it."""
+
+        cpm = CPM(f"{ProblemsPaths.problem_1_dir}/input.csv", 7)
+        cpm.solve()
+
+        # Activity 1-2 has a time reserve of 3, so the change stops at its successor 2-5
+        # as 5-6 waits for 3-5 anyway
+        changed_acts = cpm.update_duration("1-2", 5)
+
+        self.assertListEqual([str(act.id) for act in changed_acts], ["1-2", "2-5"])
+        self.assertEqual(cpm.project.earliest_end, 13)
+
+    @params("python", "vectorized")
+    def test_solve_indexes_positions(self, engine: str):
+        """
+        Tests that solving indexes the positions of activities, which stay valid after
+        the activities are replaced.
+        """
+
+        cpm = CPM(f"{ProblemsPaths.problem_1_dir}/input.csv", 7, engine=engine)
+        cpm.solve()
+
+        self.assertDictEqual(cpm.project.positions,
+                             {act.id: pos for pos, act in enumerate(cpm.project.activities)})
+        cpm.project.activities = cpm.project.activities[:2]
+        self.assertEqual(len(cpm.project.positions), 2)
+
+    ## Test failures
+    def test_update_duration_before_solving_should_fail(self):
+        """Tests that the duration of an activity cannot be updated before CPM is solved."""
+
+        cpm = CPM(f"{ProblemsPaths.problem_1_dir}/input.csv", 7)
+
+        with self.assertRaises(RuntimeError, msg="Updating the duration should have failed" +
+                               " as the problem is not solved!"):
+            cpm.update_duration("1-2", 5)
+
+    @params(("1-7", 5, ValueError), ("1-2", -1, ValueError), ("1-2", None, ValueError))
+    def test_update_duration_with_invalid_values_should_fail(self, act_id: str,
+                                                             new_duration: int,
+                                                             error_type: type):
+        """Tests that updating the duration fails for a missing activity or invalid duration."""
+
+        cpm = CPM(f"{ProblemsPaths.problem_1_dir}/input.csv", 7)
+        cpm.solve()
+
+        with self.assertRaises(error_type, msg="Updating the duration should have failed" +
+                               " as the activity or the duration is invalid!"):
+            cpm.update_duration(act_id, new_duration)
+
+    def test_creating_cpm_with_unsupported_engine_should_fail(self):
+        """Tests that CPM is not created for an unsupported engine."""
+
+        with self.assertRaises(ValueError, msg="Creating CPM should have failed as the" +
+                               " 'fake_engine' engine is not supported!"):
+            CPM(f"{ProblemsPaths.problem_1_dir}/input.csv", 7, engine="fake_engine")
+
+    ## Helpful functions
     @staticmethod
     def get_correct_activities(correct_acts_file: str) -> Project:
         """Returns the activities with correct values of a particular problem from a given file."""
@@ -0,0 +1,172 @@
+import pickle
+import unittest
+from random import Random
+from tempfile import TemporaryDirectory
+from nose2.tools import params
+from heuristics.core.cpm import CriticalPathMethod as CPM
+from heuristics.core.cpm_vectorized import VectorizedCriticalPathMethod as VectorizedCPM
+from heuristics.core.graph import ProjectGraph
+from heuristics.core.graph_file import ProjectGraphFile
+from tests.resources.problems.problems import ProblemsPaths
+
+
+class NarrowLevelsCPM(VectorizedCPM):
+    """VectorizedCPM that processes every level one activity at a time."""
+    min_vectorized_level_width = 1000
+
+
+class WideLevelsCPM(VectorizedCPM):
+    """VectorizedCPM that processes every level using NumPy."""
+    min_vectorized_level_width = 1
+
+
+class VectorizedCPMTestSuite(unittest.TestCase):
+    """Tests for VectorizedCriticalPathMethod."""
+
+    ## Test correct behavior
+    def test_topological_levels(self):
+        """Tests that the activities are grouped into correct topological levels."""
+
+        graph = ProjectGraph.from_file(f"{ProblemsPaths.problem_3_dir}/input.csv")
+
+        for cpm_type in (NarrowLevelsCPM, WideLevelsCPM):
+            levels = cpm_type.get_topological_levels(graph)
+
+            self.assertEqual(sum(len(level) for level in levels), len(graph))
+            level_of = {int(act): num for num, level in enumerate(levels) for act in level}
+            for act, level_num in level_of.items():
+                preds_levels = [level_of[int(pred)] for pred in graph.predecessors_of(act)]
+                self.assertEqual(level_num, max(preds_levels, default=-1) + 1)
+
+    @params((ProblemsPaths.problem_1_dir, 0, None), (ProblemsPaths.problem_2_dir, 5, 20),
+            (ProblemsPaths.problem_3_dir, 0, None), (ProblemsPaths.problem_4_dir, 0, 15))
+    def test_solve_same_as_cpm(self, problem_dir: str, proj_start: int, planned_proj_end: int):
+        """Tests that the results are the same as those of CriticalPathMethod."""
+
+        cpm = CPM(f"{problem_dir}/input.csv", 6, proj_start, planned_proj_end)
+        cpm.solve()
+
+        for cpm_type in (NarrowLevelsCPM, WideLevelsCPM):
+            graph = ProjectGraph.from_file(f"{problem_dir}/input.csv")
+            proj_times = cpm_type(graph).solve(proj_start, planned_proj_end)
+
+            self.assertTupleEqual(proj_times, (cpm.project.start, cpm.project.earliest_end))
+            self.assertListEqual([act_view.to_activity() for act_view in graph.activity_views()],
+                                 cpm.project.activities)
+
+    def test_solve_random_network(self):
+        """
+        Tests that the results are the same as those of CriticalPathMethod on a random network
+        with both wide and narrow levels.
+        """
+
+        rand = Random(7)
+        acts = {(start, end) for start in range(1, 400)
+                for end in rand.sample(range(start + 1, 402), min(3, 401 - start))}
+        acts = sorted(acts)
+        durations = [rand.randint(0, 9) for _ in acts]
+        graph = ProjectGraph([start for start, _ in acts], [end for _, end in acts],
+                             durations, [1] * len(acts))
+
+        results = []
+        for cpm_type in (NarrowLevelsCPM, WideLevelsCPM, VectorizedCPM):
+            proj_times = cpm_type(graph).solve()
+            results.append((proj_times, [getattr(graph, name).tolist()
+                                         for name in graph.cpm_arrays]))
+
+        self.assertEqual(results[0], results[1])
+        self.assertEqual(results[0], results[2])
+
+    def test_solve_deep_network(self):
+        """Tests CPM on a chain of activities, where every level has a single activity."""
+
+        num_acts = 1500
+        graph = ProjectGraph(range(1, num_acts + 1), range(2, num_acts + 2),
+                             [2] * num_acts, [1] * num_acts)
+
+        self.assertTupleEqual(VectorizedCPM(graph).solve(), (0, 2 * num_acts))
+        self.assertListEqual(graph.earliest_start.tolist(), list(range(0, 2 * num_acts, 2)))
+        self.assertListEqual(graph.latest_end.tolist(), list(range(2, 2 * num_acts + 1, 2)))
+        self.assertFalse(graph.time_reserve.any())
+
+    def test_solve_reuses_project_graph(self):
+        """Tests that the graph created from the activities is kept as the project's graph."""
+
+        cpm = CPM(f"{ProblemsPaths.problem_3_dir}/input.csv", 8, engine="vectorized")
+        cpm.solve()
+        graph = cpm.project.graph
+        cpm.update_duration(cpm.project.activities[0].id, 9)
+        cpm.solve()
+
+        self.assertIs(cpm.project.graph, graph)
+        self.assertIs(cpm.graph, graph)
+        self.assertListEqual(graph.durations.tolist(),
+                             [act.duration for act in cpm.project.activities])
+        for name in graph.cpm_arrays:
+            self.assertListEqual(getattr(graph, name).tolist(),
+                                 [getattr(act, name) for act in cpm.project.activities])
+
+    @params((ProblemsPaths.problem_2_dir, 5, 20), (ProblemsPaths.problem_4_dir, 0, 15))
+    def test_from_graph(self, problem_dir: str, proj_start: int, planned_proj_end: int):
+        """Tests that a graph and a binary file are solved the same as the activities."""
+
+        cpm = CPM(f"{problem_dir}/input.csv", 6, proj_start, planned_proj_end)
+        cpm.solve()
+
+        with TemporaryDirectory() as temp_dir:
+            graph = ProjectGraph.from_file(f"{problem_dir}/input.csv")
+            graph_file = ProjectGraphFile.write(graph, f"{temp_dir}/input.bin")
+            for graph_source in (graph, graph_file):
+                graph_cpm = CPM.from_graph(graph_source, 6, proj_start, planned_proj_end)
+                graph_cpm.solve()
+
+                self.assertFalse(graph_cpm.project.has_activities)
+                self.assertTupleEqual((graph_cpm.project.start, graph_cpm.project.earliest_end),
+                                      (cpm.project.start, cpm.project.earliest_end))
+                self.assertListEqual(graph_cpm.project.get_column("time_reserve"),
+                                     [act.time_reserve for act in cpm.project.activities])
+
+    @params("python", "vectorized")
+    def test_from_solved_graph(self, engine: str):
+        """
+        Tests that the pickled solved graph of a project is restored as a solved project with
+        the same results and without activities.
+        """
+
+        cpm = CPM(f"{ProblemsPaths.problem_2_dir}/input.csv", 6, 5, 20, engine=engine)
+        cpm.solve()
+
+        solved_cpm = CPM.from_solved_graph(*pickle.loads(pickle.dumps(cpm.get_solved_graph())))
+
+        self.assertTrue(solved_cpm.solved)
+        self.assertFalse(solved_cpm.project.has_activities)
+        for name in ("r_max", "start", "earliest_end", "planned_end"):
+            self.assertEqual(getattr(solved_cpm.project, name), getattr(cpm.project, name))
+        for name in ("duration", "latest_start", "time_reserve"):
+            self.assertListEqual(solved_cpm.project.get_column(name),
+                                 cpm.project.get_column(name))
+
+    ## Test failures
+    def test_getting_solved_graph_of_unsolved_project_should_fail(self):
+        """Tests that the graph of a project is not sent without the results of CPM."""
+
+        cpm = CPM(f"{ProblemsPaths.problem_2_dir}/input.csv", 6)
+
+        with self.assertRaises(RuntimeError, msg="Getting the solved graph should have failed" +
+                               " as the project is not solved!"):
+            cpm.get_solved_graph()
+
+    def test_cyclic_activities_should_fail(self):
+        """Tests that the levels cannot be determined if an activity is its own predecessor."""
+
+        graph = ProjectGraph([1, 2, 2], [2, 2, 3], [1, 1, 1], [1, 1, 1])
+        num_acts = 200
+        deep_graph = ProjectGraph(list(range(1, num_acts + 1)) + [num_acts + 1],
+                                  list(range(2, num_acts + 2)) + [num_acts + 1],
+                                  [1] * (num_acts + 1), [1] * (num_acts + 1))
+
+        for cpm_type, cyclic_graph in ((NarrowLevelsCPM, graph), (WideLevelsCPM, graph),
+                                       (VectorizedCPM, deep_graph)):
+            with self.assertRaises(RuntimeError, msg="Determining levels should have failed" +
+                                   " as an activity is its own predecessor!"):
+                cpm_type.get_topological_levels(cyclic_graph)
@@ -0,0 +1,146 @@
+import unittest
+import numpy as np
+from nose2.tools import params
+from heuristics.core.activities.activity import Activity
+from heuristics.core.activities.activity_id import ActivityID as ID
+from heuristics.core.cpm import CriticalPathMethod as CPM
+from heuristics.core.graph import ProjectGraph, ActivityView
+from heuristics.core.project import Project
+from tests.resources.problems.problems import ProblemsPaths
+
+
+class ProjectGraphTestSuite(unittest.TestCase):
+    """Tests that assure ProjectGraph works correctly."""
+
+    activities = [Activity("4-6", 4, 5), Activity("1-2", 4, 3), Activity("2-3", 3, 3),
+                  Activity("1-3", 6, 5), Activity("2-5", 3, 3), Activity("2-6", 3, 3),
+                  Activity("3-5", 4, 3), Activity("4-5", 4, 5), Activity("5-6", 3, 3)]
+
+    ## Test correct behavior
+    @params(ProblemsPaths.problem_1_dir, ProblemsPaths.problem_2_dir,
+            ProblemsPaths.problem_3_dir, ProblemsPaths.problem_4_dir)
+    def test_from_project_and_from_file(self, problem_dir: str):
+        """
+        Tests that the graph created from a Project and from a file has the same activities,
+        predecessors and successors as the Project.
+        """
+
+        acts_file_path = f"{problem_dir}/input.csv"
+        project = Project.from_file_and_args(acts_file_path, 6)
+
+        for graph in (ProjectGraph.from_project(project), ProjectGraph.from_file(acts_file_path)):
+            self.assertEqual(len(graph), len(project.activities))
+            self.assertEqual(graph.total_resources_required, project.total_resources_required)
+            self.assertFalse(graph.has_cpm_results())
+
+            for act, act_view in zip(project.activities, graph.activity_views()):
+                self.assertEqual(act_view.id, act.id)
+                self.assertEqual(act_view.duration, act.duration)
+                self.assertEqual(act_view.resources, act.resources)
+                self.assertListEqual([pred.id for pred in act_view.predecessors],
+                                     sorted(pred.id for pred in act.predecessors))
+                self.assertListEqual([succ.id for succ in act_view.successors],
+                                     sorted(succ.id for succ in act.successors))
+
+    @params(ProblemsPaths.problem_1_dir, ProblemsPaths.problem_3_dir)
+    def test_from_project_with_cpm_results(self, problem_dir: str):
+        """Tests that the results of CPM are copied to the graph and back to activities."""
+
+        cpm = CPM(f"{problem_dir}/input.csv", 6)
+        cpm.solve()
+
+        graph = ProjectGraph.from_project(cpm.project)
+
+        self.assertTrue(graph.has_cpm_results())
+        for act, act_view in zip(cpm.project.activities, graph.activity_views()):
+            self.assertEqual(act_view.to_activity(), act)
+
+        activities = graph.to_activities()
+        self.assertListEqual(activities, cpm.project.activities)
+        for act, correct_act in zip(activities, cpm.project.activities):
+            self.assertListEqual(sorted(pred.id for pred in act.predecessors),
+                                 sorted(pred.id for pred in correct_act.predecessors))
+            self.assertListEqual(sorted(succ.id for succ in act.successors),
+                                 sorted(succ.id for succ in correct_act.successors))
+
+    def test_unsorted_activities(self):
+        """Tests that the activities of the graph are sorted by their ID."""
+
+        graph = ProjectGraph([act.id.start_node for act in self.activities],
+                             [act.id.end_node for act in self.activities],
+                             [act.duration for act in self.activities],
+                             [act.resources for act in self.activities])
+
+        self.assertListEqual([act_view.id for act_view in graph.activity_views()],
+                             sorted(act.id for act in self.activities))
+        self.assertEqual(graph.index_of(ID.from_str("3-5")), 5)
+        self.assertEqual(graph.activity(5), ActivityView(graph, 5))
+        self.assertEqual(graph.activity(-1).id, ID.from_str("5-6"))
+        self.assertListEqual([graph.activity(int(pred)).id for pred in graph.predecessors_of(8)],
+                             [ID.from_str("2-5"), ID.from_str("3-5"), ID.from_str("4-5")])
+        self.assertListEqual([graph.activity(int(succ)).id for succ in graph.successors_of(0)],
+                             [ID.from_str("2-3"), ID.from_str("2-5"), ID.from_str("2-6")])
+
+    def test_sparse_nodes(self):
+        """
+        Tests that the predecessors and successors are the same if the nodes are numbered
+        sparsely, so they are not looked up in a table of all nodes.
+        """
+
+        graphs = [ProjectGraph([act.id.start_node * scale for act in self.activities],
+                               [act.id.end_node * scale for act in self.activities],
+                               [act.duration for act in self.activities],
+                               [act.resources for act in self.activities])
+                  for scale in (1, 10 ** 6)]
+
+        for name in ("pred_ptr", "pred_idx", "succ_ptr", "succ_idx"):
+            self.assertListEqual(getattr(graphs[1], name).tolist(),
+                                 getattr(graphs[0], name).tolist())
+
+    ## Test failures
+    def test_creating_graph_with_duplicate_activity_should_fail(self):
+        """Tests that the graph is not created if two activities have the same ID."""
+
+        with self.assertRaises(ValueError, msg="Creating the graph should have failed as" +
+                               " activity '1-2' is present twice!"):
+            ProjectGraph([1, 1, 2], [2, 2, 3], [1, 2, 3], [1, 1, 1])
+
+    @params(([0], [2], [1], [1]), ([3], [2], [1], [1]), ([1], [2], [-1], [1]),
+            ([1], [2], [1], [-1]), ([1, 2], [2], [1], [1]))
+    def test_creating_graph_with_invalid_values_should_fail(self, start_nodes, end_nodes,
+                                                            durations, resources):
+        """Tests that the graph is not created from invalid values."""
+
+        with self.assertRaises(ValueError, msg="Creating the graph should have failed as" +
+                               " the values are invalid!"):
+            ProjectGraph(start_nodes, end_nodes, durations, resources)
+
+    @params(([1], [2], [2 ** 31], [1]), ([1], [2], [1], [2 ** 40]), ([1], [2 ** 70], [1], [1]))
+    def test_creating_graph_with_values_out_of_range_should_fail(self, start_nodes, end_nodes,
+                                                                 durations, resources):
+        """Tests that the graph is not created from values that do not fit its arrays."""
+
+        with self.assertRaises(ValueError, msg="Creating the graph should have failed as" +
+                               " the values do not fit its arrays!"):
+            ProjectGraph(start_nodes, end_nodes, durations, resources)
+
+    def test_creating_graph_with_int64_values_out_of_range_should_fail(self):
+        """Tests that 64-bit arrays, e.g. those of loaded files, are not wrapped around."""
+
+        with self.assertRaises(ValueError, msg="Creating the graph should have failed as" +
+                               " the duration does not fit its arrays!"):
+            ProjectGraph(np.array([1], dtype=np.int64), np.array([2], dtype=np.int64),
+                         np.array([2 ** 32 + 1], dtype=np.int64), np.array([1], dtype=np.int64))
+
+    def test_getting_missing_activity_should_fail(self):
+        """Tests that getting the index of an activity that is not in the graph fails."""
+
+        graph = ProjectGraph([1, 2], [2, 3], [1, 1], [1, 1])
+
+        with self.assertRaises(ValueError, msg="Getting the index of activity '1-3' should" +
+                               " have failed as it is not part of the graph!"):
+            graph.index_of(ID.from_str("1-3"))
+
+        with self.assertRaises(IndexError, msg="Getting activity at index 2 should have" +
+                               " failed as the graph has only 2 activities!"):
+            graph.activity(2)
@@ -0,0 +1,184 @@
+from pathlib import Path
+from tempfile import TemporaryDirectory
+import unittest
+import numpy as np
+from nose2.tools import params
+from heuristics.core.cpm import CriticalPathMethod as CPM
+from heuristics.core.graph import ProjectGraph
+from heuristics.core.graph_file import ProjectGraphFile
+from heuristics.core.project import Project
+from heuristics.methods.phm import ParallelHeuristicMethod as PHM
+from heuristics.methods.phmdp import ParallelHeuristicMethodDynamicPriorities as PHMDP
+from heuristics.methods.shm import SerialHeuristicMethod as SHM
+from tests.resources.problems.problems import ProblemsPaths
+
+
+class ProjectGraphFileTestSuite(unittest.TestCase):
+    """Tests that assure ProjectGraphFile works correctly."""
+
+    ## Test correct behavior
+    @params(ProblemsPaths.problem_1_dir, ProblemsPaths.problem_2_dir,
+            ProblemsPaths.problem_3_dir, ProblemsPaths.problem_4_dir)
+    def test_convert_and_load_graph(self, problem_dir: str):
+        """Tests that the graph loaded from the binary file equals the converted graph."""
+
+        acts_file_path = f"{problem_dir}/input.csv"
+        with TemporaryDirectory() as temp_dir:
+            graph_file = ProjectGraphFile.convert(acts_file_path, Path(temp_dir, "graph.bin"))
+            graph = graph_file.load_graph()
+
+            self.assertTrue(ProjectGraphFile.is_graph_file(graph_file.path))
+            self.assertFalse(ProjectGraphFile.is_graph_file(acts_file_path))
+            self.assertIsNone(graph_file.proj_start)
+            self.assertFalse(graph.has_cpm_results())
+            self._assert_graphs_equal(graph, ProjectGraph.from_file(acts_file_path))
+
+            for name in graph.base_arrays:
+                array = getattr(graph, name)
+                if len(array) > 0:
+                    self.assertIsInstance(array, np.memmap)
+                    self.assertFalse(array.flags.writeable)
+            del graph
+
+    @params((ProblemsPaths.problem_1_dir, None), (ProblemsPaths.problem_2_dir, None),
+            (ProblemsPaths.problem_3_dir, 45), (ProblemsPaths.problem_4_dir, None))
+    def test_convert_with_cpm_results(self, problem_dir: str, planned_proj_end: int):
+        """Tests that the results of CPM are stored in the binary file."""
+
+        acts_file_path = f"{problem_dir}/input.csv"
+        cpm = CPM(acts_file_path, 6, planned_proj_end=planned_proj_end)
+        cpm.solve()
+
+        with TemporaryDirectory() as temp_dir:
+            graph_file = ProjectGraphFile.convert(acts_file_path, Path(temp_dir, "graph.bin"),
+                                                  solve_cpm=True,
+                                                  planned_proj_end=planned_proj_end)
+            graph = graph_file.load_graph()
+
+            self.assertTrue(graph.has_cpm_results())
+            self.assertEqual(graph_file.proj_start, cpm.project.start)
+            self.assertEqual(graph_file.proj_earliest_end, cpm.project.earliest_end)
+            self.assertListEqual(graph.to_activities(), cpm.project.activities)
+            del graph
+
+    def test_load_copy_on_write(self):
+        """Tests that changes of a graph loaded in copy-on-write mode are not saved."""
+
+        with TemporaryDirectory() as temp_dir:
+            graph_file = ProjectGraphFile.convert(f"{ProblemsPaths.problem_1_dir}/input.csv",
+                                                  Path(temp_dir, "graph.bin"))
+            graph = graph_file.load_graph("c")
+            graph.durations[0] += 10
+            self.assertEqual(graph_file.load_graph().durations[0] + 10, graph.durations[0])
+            del graph
+
+    def test_empty_graph(self):
+        """Tests that a graph without activities is written and loaded."""
+
+        with TemporaryDirectory() as temp_dir:
+            graph_file = ProjectGraphFile.write(ProjectGraph([], [], [], []),
+                                                Path(temp_dir, "graph.bin"))
+            graph = graph_file.load_graph()
+
+            self.assertEqual(len(graph), 0)
+            self.assertListEqual(graph.pred_ptr.tolist(), [0])
+
+    @params(ProblemsPaths.problem_1_dir, ProblemsPaths.problem_3_dir)
+    def test_project_from_binary(self, problem_dir: str):
+        """Tests that the Project loaded from the binary file equals the one from the CSV."""
+
+        acts_file_path = f"{problem_dir}/input.csv"
+        cpm = CPM(acts_file_path, 6)
+        cpm.solve()
+
+        with TemporaryDirectory() as temp_dir:
+            for solve_cpm in (False, True):
+                binary_file_path = Path(temp_dir, f"graph_{solve_cpm}.bin")
+                ProjectGraphFile.convert(acts_file_path, binary_file_path, solve_cpm)
+                project = Project.from_binary(binary_file_path, 6)
+
+                self.assertIsNotNone(project.graph)
+                self.assertEqual(project.r_max, 6)
+                self.assertEqual(project.total_resources_required,
+                                 cpm.project.total_resources_required)
+                self.assertEqual(project.earliest_end,
+                                 cpm.project.earliest_end if solve_cpm else None)
+
+                binary_cpm = CPM.from_project(project, "vectorized")
+                binary_cpm.solve()
+                self.assertIs(binary_cpm.graph, project.graph)
+                self.assertEqual(project.earliest_end, cpm.project.earliest_end)
+                self.assertListEqual(project.activities, cpm.project.activities)
+                for act, correct_act in zip(project.activities, cpm.project.activities):
+                    self.assertListEqual([pred.id for pred in act.predecessors],
+                                         sorted(pred.id for pred in correct_act.predecessors))
+                del project, binary_cpm
+
+    @params(*((problem_dir, solve_cpm) for problem_dir in (ProblemsPaths.problem_1_dir,
+                                                           ProblemsPaths.problem_3_dir)
+              for solve_cpm in (False, True)))
+    def test_solve_binary_without_activities(self, problem_dir: str, solve_cpm: bool):
+        """
+        Tests that a project loaded from the binary file is solved without creating its
+        activities, and that the results equal those of the CSV.
+        """
+
+        acts_file_path = f"{problem_dir}/input.csv"
+        csv_cpm = CPM(acts_file_path, 6)
+        csv_cpm.solve()
+
+        with TemporaryDirectory() as temp_dir:
+            binary_file_path = Path(temp_dir, "graph.bin")
+            ProjectGraphFile.convert(acts_file_path, binary_file_path, solve_cpm)
+
+            project = Project.from_binary(binary_file_path, 6)
+            cpm = CPM.from_project(project)
+            cpm.solve()
+
+            self.assertEqual(cpm.engine, "vectorized")
+            self.assertEqual(project.earliest_end, csv_cpm.project.earliest_end)
+            for name in Project.columns:
+                self.assertListEqual(project.get_column(name),
+                                     csv_cpm.project.get_column(name))
+            self.assertFalse(project.has_activities)
+            del project, cpm
+
+    @params(*((problem_dir, solve_cpm) for problem_dir in (ProblemsPaths.problem_1_dir,
+                                                           ProblemsPaths.problem_3_dir)
+              for solve_cpm in (False, True)))
+    def test_schedule_from_binary_without_activities(self, problem_dir: str, solve_cpm: bool):
+        """
+        Tests that a project loaded from the binary file is solved and scheduled without
+        creating its activities, and that the schedules equal those of the CSV.
+        """
+
+        acts_file_path = f"{problem_dir}/input.csv"
+        with TemporaryDirectory() as temp_dir:
+            binary_file_path = Path(temp_dir, "graph.bin")
+            ProjectGraphFile.convert(acts_file_path, binary_file_path, solve_cpm)
+
+            project = Project.from_binary(binary_file_path, 6)
+            cpm = CPM.from_project(project)
+            for method_class in (SHM, PHM, PHMDP):
+                schedule = method_class.from_cpm(cpm).solve()
+                self.assertEqual(schedule, method_class(acts_file_path, 6).solve())
+
+            self.assertEqual(cpm.engine, "vectorized")
+            self.assertFalse(project.has_activities)
+            del project, cpm
+
+    ## Test failures
+    def test_opening_non_binary_file_should_fail(self):
+        """Tests that opening a file that is not in the binary format fails."""
+
+        with self.assertRaises(ValueError, msg="Opening the file should have failed as it is" +
+                               " not a binary project graph file!"):
+            ProjectGraphFile(f"{ProblemsPaths.problem_1_dir}/input.csv")
+
+    ## Helpful functions
+    def _assert_graphs_equal(self, graph: ProjectGraph, correct_graph: ProjectGraph):
+        """Asserts that the base arrays of the graphs are equal."""
+
+        for name in correct_graph.base_arrays:
+            self.assertListEqual(getattr(graph, name).tolist(),
+                                 getattr(correct_graph, name).tolist(), msg=name)
@@ -2,6 +2,8 @@ from random import shuffle
 import unittest
 from typing import List
 from nose2.tools import params
+from heuristics.core.cpm import CriticalPathMethod as CPM
+from heuristics.core.graph import ProjectGraph
 from heuristics.core.project import Project
 from heuristics.core.activities.activity import Activity
 from tests.resources.problems.problems import ProblemsPaths
@@ -84,3 +86,37 @@ class ProjectTestSuite(unittest.TestCase):
         cpm_proj_2 = Project(shuffled_activities, r_max)
 
         self.assertListEqual(activities, cpm_proj_2.activities)
+
+    @params(ProblemsPaths.problem_1_dir, ProblemsPaths.problem_3_dir)
+    def test_columns_from_graph(self, problem_dir: str):
+        """
+        Tests that the columns of a project backed by a graph are read without creating its
+        activities and equal those read from the activities.
+        """
+
+        cpm = CPM(f"{problem_dir}/input.csv", 6)
+        cpm.solve()
+        graph = ProjectGraph.from_project(cpm.project)
+        project = Project(None, 6, graph=graph)
+
+        self.assertEqual(project.num_activities, len(cpm.project.activities))
+        for name in Project.columns:
+            self.assertListEqual(project.get_column(name), cpm.project.get_column(name))
+        self.assertListEqual(project.get_num_predecessors(),
+                             cpm.project.get_num_predecessors())
+        self.assertListEqual(project.get_predecessors_positions(),
+                             cpm.project.get_predecessors_positions())
+        self.assertListEqual(project.get_successors_positions(),
+                             cpm.project.get_successors_positions())
+        self.assertFalse(project.has_activities)
+
+        self.assertListEqual(project.activities, cpm.project.activities)
+        self.assertTrue(project.has_activities)
+
+    ## Test failures
+    def test_getting_unsupported_column_should_fail(self):
+        """Tests that getting a column which is not a property of activities fails."""
+
+        with self.assertRaises(ValueError, msg="Getting the column should have failed as" +
+                               " 'id' is not supported!"):
+            Project(self.activities.copy(), self.r_max_1).get_column("id")
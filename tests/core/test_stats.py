@@ -0,0 +1,126 @@
+import json
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from nose2.tools import params
+from heuristics.core.cpm import CriticalPathMethod as CPM
+from heuristics.core.stats import SolveStats
+from heuristics.methods.phm import ParallelHeuristicMethod as PHM
+from heuristics.methods.phmdp import ParallelHeuristicMethodDynamicPriorities as PHMDP
+from heuristics.methods.shm import SerialHeuristicMethod as SHM
+from tests.resources.problems.problems import ProblemsPaths
+
+
+class SolveStatsTestSuite(unittest.TestCase):
+    """Tests that assure SolveStats works correctly."""
+
+    acts_file_path = f"{ProblemsPaths.problem_3_dir}/input.csv"
+
+    ## Test correct behavior
+    @params("python", "vectorized")
+    def test_cpm_solve(self, engine: str):
+        """Tests that solving CPM with stats measures its phases."""
+
+        stats = SolveStats()
+        cpm = CPM(self.acts_file_path, 8, engine=engine)
+        cpm.solve(stats)
+
+        phase_names = ["cpm_vectorized"] if engine == "vectorized" else \
+                      ["cpm_forward_walk", "cpm_backward_walk", "cpm_time_reserves"]
+        self.assertIs(cpm.stats, stats)
+        self.assertListEqual(list(stats.phases), phase_names)
+        self.assertEqual(stats.counters['cpm_activities'], len(cpm.project.activities))
+
+    @params((SHM, ["init", "scheduling"]),
+            (PHM, ["init", "priorities", "scheduling", "finalize"]),
+            (PHMDP, ["init", "priorities", "scheduling", "finalize"]))
+    def test_method_solve(self, method_class: type, phase_names: list):
+        """
+        Tests that solving a method with stats measures the phases of CPM and of the method
+        and does not change the schedule.
+        """
+
+        stats = SolveStats()
+        method = method_class(self.acts_file_path, 8)
+        schedule = method.solve(stats)
+
+        self.assertIs(method.stats, stats)
+        self.assertEqual(schedule, method_class(self.acts_file_path, 8).solve())
+        self.assertListEqual([name for name in stats.phases if not name.startswith("cpm_")],
+                             phase_names)
+        self.assertTrue(all(seconds >= 0 for seconds in stats.phases.values()))
+        self.assertGreater(stats.counters['events'], 0)
+        self.assertGreaterEqual(stats.counters['resource_checks'],
+                                len(method.cpm.project.activities))
+
+    @params("tree", "skyline")
+    def test_shm_resource_checks(self, profile: str):
+        """Tests that SHM records the slots probed by the searches of the resource profile."""
+
+        stats = SolveStats()
+        shm = SHM(self.acts_file_path, 8, profile=profile)
+        shm.solve(stats)
+
+        self.assertGreater(shm.resource_profile.num_probes, 0)
+        self.assertEqual(stats.counters['resource_checks'], shm.resource_profile.num_probes)
+
+    def test_ready_queue(self):
+        """Tests that PHM records the sizes of its ready queue."""
+
+        stats = SolveStats()
+        phm = PHM(self.acts_file_path, 8)
+        phm.solve(stats)
+
+        self.assertEqual(stats.counters['ready_queue_total'], stats.counters['resource_checks'])
+        self.assertGreaterEqual(stats.maxima['ready_queue_max'], 1)
+        self.assertLessEqual(stats.maxima['ready_queue_max'], len(phm.cpm.project.activities))
+
+    def test_solve_without_stats(self):
+        """Tests that no stats are kept if they are not given."""
+
+        method = PHM(self.acts_file_path, 8)
+        method.solve()
+
+        self.assertIsNone(method.stats)
+        self.assertIsNone(method.cpm.stats)
+
+    def test_accumulate(self):
+        """Tests that phases and counters of the same names are added up."""
+
+        stats = SolveStats()
+        for _ in range(2):
+            with stats.phase("phase"):
+                stats.count("counter", 2)
+            stats.observe("maximum", 3)
+        stats.observe("maximum", -1)
+
+        self.assertListEqual(list(stats.phases), ["phase"])
+        self.assertEqual(stats.counters, {'counter': 4})
+        self.assertEqual(stats.maxima, {'maximum': 3})
+        self.assertEqual(stats.total_seconds, stats.phases["phase"])
+
+    def test_trace_memory(self):
+        """Tests that the peak memory is traced only if it is requested."""
+
+        stats = SolveStats(trace_memory=True)
+        with stats.phase("phase"):
+            data = [0] * 100000
+
+        self.assertGreaterEqual(stats.peak_memory['phase'], 8 * len(data))
+        self.assertDictEqual(SolveStats().peak_memory, {})
+
+    def test_to_json(self):
+        """Tests that the stats are exported as JSON."""
+
+        stats = SolveStats()
+        SHM(self.acts_file_path, 8).solve(stats)
+
+        with TemporaryDirectory() as temp_dir:
+            json_file_path = Path(temp_dir, "stats.json")
+            stats.to_json_file(json_file_path)
+            with open(json_file_path, encoding="utf-8") as file:
+                data = json.load(file)
+
+        self.assertDictEqual(data, json.loads(stats.to_json()))
+        self.assertDictEqual(data['counters'], stats.counters)
+        self.assertAlmostEqual(data['total_seconds'], stats.total_seconds)
@@ -0,0 +1,114 @@
+from csv import DictReader
+from pathlib import Path
+from shutil import copyfile
+from tempfile import TemporaryDirectory
+import unittest
+from nose2.tools import params
+from heuristics.methods.batch import BatchResult, BatchSolver, main
+from heuristics.methods.phm import ParallelHeuristicMethod as PHM
+from heuristics.methods.phmdp import ParallelHeuristicMethodDynamicPriorities as PHMDP
+from heuristics.methods.shm import SerialHeuristicMethod as SHM
+from tests.resources.problems.problems import ProblemsPaths
+
+
+class BatchSolverTestSuite(unittest.TestCase):
+    """Tests that assure BatchSolver works correctly."""
+
+    problem_files = [f"{problem_dir}/input.csv" for problem_dir in
+                     (ProblemsPaths.problem_1_dir, ProblemsPaths.problem_2_dir,
+                      ProblemsPaths.problem_3_dir, ProblemsPaths.problem_4_dir)]
+
+    ## Test correct behavior
+    @params((1, None), (2, 1), (2, None))
+    def test_solve(self, max_workers: int, chunksize: int):
+        """Tests that the results match the schedules of the methods themselves."""
+
+        solver = BatchSolver(("shm", "phm", "phmdp"), max_workers, chunksize)
+        results = solver.solve(self.problem_files, 8)
+
+        self.assertEqual(len(results), 3 * len(self.problem_files))
+        for result, (path, method_class) in zip(results, ((path, method_class)
+                                                          for path in self.problem_files
+                                                          for method_class in (SHM, PHM, PHMDP))):
+            method = method_class(path, 8)
+            schedule = method.solve()
+
+            self.assertFalse(result.failed)
+            self.assertEqual(result.path, path)
+            self.assertIs(BatchSolver.methods[result.method], method_class)
+            self.assertEqual(result.makespan, schedule.actual_end)
+            self.assertListEqual(list(result.starts), schedule.starts)
+            self.assertEqual(result.total_resources,
+                             sum(act.duration * act.resources
+                                 for act in method.cpm.project.activities))
+
+    def test_solve_single_file(self):
+        """Tests that a single path to a data file is solved as a batch of that file."""
+
+        results = BatchSolver(("shm", "phm"), max_workers=1).solve(self.problem_files[0], 7)
+
+        self.assertListEqual([(result.path, result.method) for result in results],
+                             [(self.problem_files[0], "shm"), (self.problem_files[0], "phm")])
+        self.assertFalse(any(result.failed for result in results))
+
+    def test_solve_directory(self):
+        """
+        Tests that the files of a directory are solved in the order of their names and that
+        failing files are recorded.
+        """
+
+        with TemporaryDirectory() as temp_dir:
+            for name, path in (("b.csv", self.problem_files[0]), ("a.csv", self.problem_files[1]),
+                               ("c.csv", f"{ProblemsPaths.invalid_problems_dir}" +
+                                         "/problem_duplicate_activity_id.csv"),
+                               ("d.txt", self.problem_files[2])):
+                copyfile(path, Path(temp_dir, name))
+
+            results = BatchSolver(max_workers=1).solve(temp_dir, 7)
+
+        self.assertListEqual([Path(result.path).name for result in results],
+                             ["a.csv", "b.csv", "c.csv"])
+        self.assertListEqual([result.failed for result in results], [False, False, True])
+        self.assertIn("ValueError", results[2].error)
+        self.assertIsNone(results[2].makespan)
+
+    def test_main(self):
+        """Tests that the entry point writes the results to a CSV file."""
+
+        with TemporaryDirectory() as temp_dir:
+            csv_file_path = Path(temp_dir, "results.csv")
+            exit_code = main([*self.problem_files[:2], "-r", "7", "-m", "shm", "phm",
+                              "-w", "1", "-o", str(csv_file_path)])
+
+            with open(csv_file_path, encoding="utf-8") as file:
+                rows = list(DictReader(file))
+
+        self.assertEqual(exit_code, 0)
+        self.assertListEqual([(row['method'], int(row['makespan'])) for row in rows],
+                             [("shm", 24), ("phm", 20), ("shm", 12), ("phm", 15)])
+        self.assertEqual(rows[0]['starts'], "0 4 10 10 13 17 21")
+        self.assertEqual(rows[0]['error'], "")
+
+    def test_result_equality(self):
+        """Tests comparing compact results."""
+
+        results = BatchSolver(max_workers=1).solve(self.problem_files[:1], 7)
+        self.assertEqual(results, BatchSolver(max_workers=2).solve(self.problem_files[:1], 7))
+        self.assertNotEqual(results[0], BatchResult(self.problem_files[0], "phm", 7))
+
+    ## Test failures
+    @params(({'method_names': ("phm", "ga")}), ({'profile': "list"}), ({'max_workers': 0}),
+            ({'chunksize': 0}))
+    def test_creating_solver_with_invalid_arguments_should_fail(self, kwargs: dict):
+        """Tests that the solver is not created with invalid arguments."""
+
+        with self.assertRaises(ValueError, msg="Creating the solver should have failed as" +
+                               f" the arguments '{kwargs}' are invalid!"):
+            BatchSolver(**kwargs)
+
+    def test_solving_missing_directory_should_fail(self):
+        """Tests that solving the files of a directory that does not exist fails."""
+
+        with self.assertRaises(NotADirectoryError, msg="Solving should have failed as the" +
+                               " directory does not exist!"):
+            BatchSolver(max_workers=1).solve("missing_directory", 7)
@@ -0,0 +1,103 @@
+import json
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+import numpy as np
+from nose2.tools import params
+from heuristics.core.activities.activity import Activity
+from heuristics.methods.export import ScheduleExporter
+from heuristics.methods.phm import ParallelHeuristicMethod as PHM
+from tests.resources.problems.problems import ProblemsPaths
+
+
+class ScheduleExporterTestSuite(unittest.TestCase):
+    """Tests that assure ScheduleExporter works correctly."""
+
+    ## Test correct behavior
+    @params(("phm", 65536), ("phm", 2), ("cpm", 1), ("cpm", 3))
+    def test_json(self, act_timeframe_type: str, block_size: int):
+        """Tests that the compact JSON holds the same data as the Gantt JSON."""
+
+        phm = PHM(f"{ProblemsPaths.problem_3_dir}/input.csv", 8)
+        phm.solve()
+        exporter = ScheduleExporter.from_method(phm, "PHM", act_timeframe_type)
+        exporter.block_size = block_size
+
+        with TemporaryDirectory() as temp_dir:
+            gantt_data = self._load_json(exporter.to_file(Path(temp_dir, "gantt.json")))
+            data = self._load_json(exporter.to_file(Path(temp_dir, "compact.json"), "json"))
+
+        self.assertDictEqual(data, gantt_data)
+        self.assertEqual(data['title'], "PHM - Gantt chart")
+        self.assertEqual(len(data['packages']), len(phm.schedule))
+
+    @params(1, 4, 65536)
+    def test_ndjson(self, block_size: int):
+        """Tests that every line of the NDJSON file is the time frame of an activity."""
+
+        phm = PHM(f"{ProblemsPaths.problem_1_dir}/input.csv", 7)
+        phm.solve()
+        exporter = ScheduleExporter.from_method(phm, "PHM", "phm")
+        exporter.block_size = block_size
+
+        with TemporaryDirectory() as temp_dir:
+            ndjson_file_path = exporter.to_file(Path(temp_dir, "schedule.ndjson"), "ndjson")
+            with open(ndjson_file_path, encoding="utf-8") as file:
+                lines = file.read().splitlines()
+
+        self.assertListEqual([json.loads(line) for line in lines],
+                             phm.schedule.get_time_frames())
+
+    def test_npz(self):
+        """Tests that the columns of the schedule are written as arrays."""
+
+        phm = PHM(f"{ProblemsPaths.problem_1_dir}/input.csv", 7)
+        phm.solve()
+
+        with TemporaryDirectory() as temp_dir:
+            npz_file_path = phm.activities_schedule_to_json_file(
+                json_file_path=Path(temp_dir, "schedule.columns"), export_format="npz")
+            with np.load(npz_file_path) as arrays:
+                columns = {name: arrays[name].tolist() for name in arrays.files}
+
+        activities = phm.cpm.project.activities
+        self.assertListEqual(sorted(columns), sorted(ScheduleExporter.columns))
+        self.assertListEqual(columns['start_nodes'], [act.id.start_node for act in activities])
+        self.assertListEqual(columns['end_nodes'], [act.id.end_node for act in activities])
+        self.assertListEqual(columns['starts'], phm.schedule.starts)
+        self.assertListEqual(columns['ends'], phm.schedule.ends)
+        self.assertListEqual(columns['resources'], [act.resources for act in activities])
+
+    @params("json", "ndjson")
+    def test_unscheduled_activities(self, export_format: str):
+        """Tests that unscheduled activities are exported with null start and end."""
+
+        activities = [Activity("1-2", 1, 1), Activity("2-3", 2, 1)]
+        exporter = ScheduleExporter("Partial", activities, [0, None], [1, None])
+
+        with TemporaryDirectory() as temp_dir:
+            with open(exporter.to_file(Path(temp_dir, "schedule"), export_format),
+                      encoding="utf-8") as file:
+                contents = file.read()
+
+        time_frames = json.loads(contents)['packages'] if export_format == "json" else \
+                      [json.loads(line) for line in contents.splitlines()]
+        self.assertDictEqual(time_frames[1], {'label': "2-3", 'start': None, 'end': None,
+                                              'resource': 1})
+
+    ## Test failures
+    def test_exporting_to_unsupported_format_should_fail(self):
+        """Tests that exporting to an unsupported format fails."""
+
+        exporter = ScheduleExporter("Empty", [], [], [])
+        with self.assertRaises(ValueError, msg="Exporting should have failed as the format" +
+                               " 'xml' is not supported!"):
+            exporter.to_file("schedule.xml", "xml")
+
+    ## Helpful functions
+    @staticmethod
+    def _load_json(json_file_path: str) -> dict:
+        """Loads the JSON file."""
+
+        with open(json_file_path, encoding="utf-8") as file:
+            return json.load(file)
@@ -1,12 +1,9 @@
 import unittest
 from os import remove
-from typing import List
-from csv import reader as csv_reader
 from nose2.tools import params
 from heuristics.core.activities.activity import Activity
-from heuristics.core.activities.activity_id import ActivityID as ID
+from heuristics.core.project import Project
 from heuristics.methods.phm import ParallelHeuristicMethod as PHM
-from tests.core.test_cpm import CPMTestSuite
 from tests.methods.test_shm import SHMTestSuite
 from tests.resources.problems.problems import ProblemsPaths
 
@@ -27,15 +24,16 @@ class PHMTestSuite(unittest.TestCase):
         phm_correct_acts_file = f"{problem_dir}/phm_solution.csv"
 
         phm = PHM(problem_file, r_max)
-        phm.solve()
+        schedule = phm.solve()
 
-        # Verify that activities have correct values
-        correct_activities = self.get_correct_activities(cpm_correct_acts_file,
-                                                         phm_correct_acts_file)
-        self.assertListEqual(phm.cpm.project.activities, correct_activities)
+        # Verify that activities and the schedule have correct values
+        correct_schedule = SHMTestSuite.get_correct_schedule(cpm_correct_acts_file,
+                                                             phm_correct_acts_file)
+        self.assertListEqual(phm.cpm.project.activities, correct_schedule.project.activities)
+        self.assertEqual(schedule, correct_schedule)
 
         # Verify that the project end is correct
-        self.assertEqual(phm.cpm.project.actual_end, phm_project_end)
+        self.assertEqual(schedule.actual_end, phm_project_end)
 
         # Verify that the resources available in each time point were not overstepped
         num_time_points = phm_project_end + 1
@@ -54,11 +52,11 @@ class PHMTestSuite(unittest.TestCase):
         cpm_acts_file = f"{problem_dir}/cpm_solution.csv"
         phm_acts_file = f"{problem_dir}/phm_solution.csv"
 
-        activities = self.get_correct_activities(cpm_acts_file,
-                                                 phm_acts_file)
+        schedule = SHMTestSuite.get_correct_schedule(cpm_acts_file, phm_acts_file)
 
         phm = PHM(problem_file, r_max)
-        phm.cpm.project.activities = activities
+        phm.cpm.project = schedule.project
+        phm.schedule = schedule
 
         cpm_json_file = phm.activities_schedule_to_json_file(
             "CPM", "cpm", "cpm_activities_schedule.json")
@@ -84,21 +82,62 @@ class PHMTestSuite(unittest.TestCase):
         remove(cpm_json_file)
         remove(phm_json_file)
 
-    ## Helpful functions
-    @staticmethod
-    def get_correct_activities(cpm_correct_acts_file: str,
-                               phm_correct_acts_file: str) -> List[Activity]:
-        """Returns the activities with correct values of a particular problem from a given file."""
-        activities = CPMTestSuite.get_correct_activities(cpm_correct_acts_file).activities
-
-        with open(phm_correct_acts_file, encoding='utf-8') as sol:
-            lines = csv_reader(sol, delimiter=' ')
-            next(lines) # Skip CSV headers
-            for line in lines:
-                id = ID.from_str(str(line[0]))
-                act = SHMTestSuite.get_act_by_id(id, activities)
-                act.actual_start = int(line[1])
-                act.actual_end = int(line[2])
-                act.priority = int(line[3])
-
-        return activities
+    def test_solve_with_zero_duration_activities(self):
+        """
+        Tests that activities with zero duration finish when they start and their successors
+        are scheduled at the next event.
+        """
+
+        project = Project([Activity("1-2", 0, 1), Activity("2-3", 2, 1), Activity("3-4", 0, 1),
+                           Activity("1-4", 1, 1)], 1)
+
+        schedule = PHM.from_project(project).solve()
+
+        # Activities are sorted by ID: 1-2, 1-4, 2-3, 3-4
+        self.assertListEqual(schedule.starts, [0, 0, 1, 3])
+        self.assertListEqual(schedule.ends, [0, 1, 3, 3])
+        self.assertEqual(schedule.actual_end, 3)
+
+    @params(ProblemsPaths.problem_1_dir, ProblemsPaths.problem_2_dir,
+            ProblemsPaths.problem_3_dir, ProblemsPaths.problem_4_dir)
+    def test_solve_iter(self, problem_dir: str):
+        """
+        Tests that the activities are yielded in the order of their starts and that the
+        complete schedule matches the one of `solve`.
+        """
+
+        phm = PHM(f"{problem_dir}/input.csv", 7)
+        schedule = PHM(f"{problem_dir}/input.csv", 7).solve()
+
+        items = list(phm.solve_iter())
+
+        self.assertEqual(phm.schedule, schedule)
+        self.assertEqual(phm.schedule.actual_end, schedule.actual_end)
+        self.assertEqual(len(items), len(schedule))
+        self.assertListEqual([start for _, start, _ in items],
+                             sorted(start for _, start, _ in items))
+        for act_id, start, end in items:
+            self.assertEqual(start, schedule.start_of(act_id))
+            self.assertEqual(end, schedule.end_of(act_id))
+
+    def test_solve_iter_cancel(self):
+        """Tests that closing the generator stops the solve with an incomplete schedule."""
+
+        phm = PHM(f"{ProblemsPaths.problem_3_dir}/input.csv", 8)
+        items = phm.solve_iter()
+        first_items = [next(items) for _ in range(3)]
+        items.close()
+
+        self.assertListEqual([start for _, start, _ in first_items], [0, 0, 6])
+        self.assertIn(None, phm.schedule.starts)
+        self.assertIsNone(phm.schedule.actual_end)
+
+    ## Test failures
+    def test_solving_with_insufficient_resources_should_fail(self):
+        """Tests that solving fails if an activity requires more resources than available."""
+
+        project = Project([Activity("1-2", 1, 1), Activity("2-3", 1, 5)], 3)
+
+        with self.assertRaises(RuntimeError, msg="Solving should have failed as activity" +
+                               " '2-3' requires more resources than available!"):
+            PHM.from_project(project).solve()
@@ -3,7 +3,6 @@ from os import remove
 from nose2.tools import params
 from heuristics.methods.phmdp import ParallelHeuristicMethodDynamicPriorities as PHMDP
 from tests.methods.test_shm import SHMTestSuite
-from tests.methods.test_phm import PHMTestSuite
 from tests.resources.problems.problems import ProblemsPaths
 
 
@@ -24,15 +23,16 @@ class PHMDPTestSuite(unittest.TestCase):
         phmdp_correct_acts_file = f"{problem_dir}/phmdp_solution.csv"
 
         phmdp = PHMDP(problem_file, r_max)
-        phmdp.solve()
+        schedule = phmdp.solve()
 
-        # Verify that activities have correct values
-        correct_activities = PHMTestSuite.get_correct_activities(
+        # Verify that activities and the schedule have correct values
+        correct_schedule = SHMTestSuite.get_correct_schedule(
             cpm_correct_acts_file, phmdp_correct_acts_file)
-        self.assertListEqual(phmdp.cpm.project.activities, correct_activities)
+        self.assertListEqual(phmdp.cpm.project.activities, correct_schedule.project.activities)
+        self.assertEqual(schedule, correct_schedule)
 
         # Verify that the project end is correct
-        self.assertEqual(phmdp.cpm.project.actual_end, phmdp_project_end)
+        self.assertEqual(schedule.actual_end, phmdp_project_end)
 
         # Verify that the resources available in each time point were not overstepped
         num_time_points = phmdp_project_end + 1
@@ -51,11 +51,11 @@ class PHMDPTestSuite(unittest.TestCase):
         cpm_acts_file = f"{problem_dir}/cpm_solution.csv"
         phmdp_acts_file = f"{problem_dir}/phmdp_solution.csv"
 
-        activities = PHMTestSuite.get_correct_activities(
-            cpm_acts_file, phmdp_acts_file)
+        schedule = SHMTestSuite.get_correct_schedule(cpm_acts_file, phmdp_acts_file)
 
         phmdp = PHMDP(problem_file, r_max)
-        phmdp.cpm.project.activities = activities
+        phmdp.cpm.project = schedule.project
+        phmdp.schedule = schedule
 
         cpm_json_file = phmdp.activities_schedule_to_json_file(
             "CPM", "cpm", "cpm_activities_schedule.json")
@@ -80,3 +80,13 @@ class PHMDPTestSuite(unittest.TestCase):
         # Clean up generated files
         remove(cpm_json_file)
         remove(phmdp_json_file)
+
+    def test_solve_iter(self):
+        """Tests that the activities yielded by PHMDP make up the schedule of `solve`."""
+
+        acts_file_path = f"{ProblemsPaths.problem_3_dir}/input.csv"
+        phmdp = PHMDP(acts_file_path, 8)
+        items = list(phmdp.solve_iter())
+
+        self.assertEqual(phmdp.schedule, PHMDP(acts_file_path, 8).solve())
+        self.assertListEqual(sorted(phmdp.schedule.starts), [start for _, start, _ in items])
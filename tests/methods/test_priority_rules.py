@@ -0,0 +1,207 @@
+import unittest
+from tempfile import TemporaryDirectory
+from nose2.tools import params
+from heuristics.core.activities.activity import Activity
+from heuristics.core.cpm import CriticalPathMethod as CPM
+from heuristics.core.graph_file import ProjectGraphFile
+from heuristics.core.project import Project
+from heuristics.methods.phm import ParallelHeuristicMethod as PHM
+from heuristics.methods.phmdp import ParallelHeuristicMethodDynamicPriorities as PHMDP
+from heuristics.methods.priority_rules import (PriorityKeys, PriorityRule,
+                                               PriorityRulePortfolio, RandomRule,
+                                               TimeReserveRule)
+from tests.resources.problems.problems import ProblemsPaths
+
+
+class PriorityRulesTestSuite(unittest.TestCase):
+    """Tests that assure the priority rules and PriorityRulePortfolio work correctly."""
+
+    problems = ((ProblemsPaths.problem_1_dir, 7), (ProblemsPaths.problem_2_dir, 6),
+                (ProblemsPaths.problem_3_dir, 8), (ProblemsPaths.problem_4_dir, 6))
+    """Directories of the problems and their r_max values."""
+
+    ## Test correct behavior
+    @params(("tr", [0, 3, 0, 3, 0]), ("lft", [2, 4, 5, 6, 6]), ("lst", [0, 3, 2, 4, 5]),
+            ("mts", [-2, -1, -1, 0, 0]), ("grpw", [-5, -3, -4, -2, -1]),
+            ("mr", [-1, -3, -2, -2, -1]), ("spt", [2, 1, 3, 2, 1]))
+    def test_rule(self, rule_name: str, priorities: list):
+        """Tests that the built-in rules compute the priorities from the CPM results."""
+
+        project = self._get_solved_project()
+        rule = PriorityRulePortfolio.get_rule(rule_name)
+
+        self.assertEqual(rule.name, rule_name)
+        self.assertListEqual(rule.get_project_priorities(project), priorities)
+
+    def test_random_rule(self):
+        """Tests that the random priorities are a permutation given by the seed."""
+
+        project = self._get_solved_project()
+        priorities = RandomRule(seed=1).get_project_priorities(project)
+
+        self.assertListEqual(sorted(priorities), list(range(len(project.activities))))
+        self.assertListEqual(RandomRule(seed=1).get_project_priorities(project), priorities)
+
+    @params(*problems)
+    def test_num_total_successors(self, problem_dir: str, r_max: int):
+        """Tests that the successors are counted the same as by walking the network."""
+
+        cpm = CPM(f"{problem_dir}/input.csv", r_max)
+        cpm.solve()
+        keys = PriorityKeys.from_project(cpm.project)
+
+        self.assertListEqual(keys.get_num_total_successors(),
+                             [len(self._get_total_successors(act))
+                              for act in cpm.project.activities])
+
+    @params(*problems)
+    def test_time_reserve_rule(self, problem_dir: str, r_max: int):
+        """Tests that PHM with the time reserve rule produces the default schedule."""
+
+        phm = PHM(f"{problem_dir}/input.csv", r_max)
+        phm.priority_rule = TimeReserveRule()
+
+        self.assertEqual(phm.solve(), PHM(f"{problem_dir}/input.csv", r_max).solve())
+
+    def test_phmdp_ignores_rule(self):
+        """Tests that PHMDP keeps its dynamic priorities if a rule is set."""
+
+        acts_file_path = f"{ProblemsPaths.problem_3_dir}/input.csv"
+        phmdp = PHMDP(acts_file_path, 8)
+        phmdp.priority_rule = PriorityRulePortfolio.get_rule("spt")
+
+        self.assertEqual(phmdp.solve(), PHMDP(acts_file_path, 8).solve())
+
+    @params(*((*problem, max_workers) for problem in problems for max_workers in (1, 2)))
+    def test_portfolio_solve(self, problem_dir: str, r_max: int, max_workers: int):
+        """
+        Tests that the portfolio returns the schedule of the rule with the lowest makespan,
+        which is never worse than PHM.
+        """
+
+        acts_file_path = f"{problem_dir}/input.csv"
+        portfolio = PriorityRulePortfolio(tuple(PriorityRulePortfolio.rules), max_workers)
+        schedule = portfolio.solve(CPM(acts_file_path, r_max))
+
+        makespans = {}
+        for rule in portfolio.priority_rules:
+            phm = PHM(acts_file_path, r_max)
+            phm.priority_rule = rule
+            makespans[rule.name] = phm.solve().actual_end
+            if rule.name == portfolio.best_rule:
+                best_schedule = phm.schedule
+
+        self.assertDictEqual(portfolio.makespans, makespans)
+        self.assertEqual(schedule.actual_end, min(makespans.values()))
+        self.assertLessEqual(schedule.actual_end, PHM(acts_file_path, r_max).solve().actual_end)
+        self.assertEqual(schedule, best_schedule)
+
+    @params(1, 2)
+    def test_portfolio_solve_binary_project(self, max_workers: int):
+        """
+        Tests that the portfolio schedules a project loaded from a binary file without
+        creating its activities.
+        """
+
+        acts_file_path = f"{ProblemsPaths.problem_3_dir}/input.csv"
+        portfolio = PriorityRulePortfolio(max_workers=max_workers)
+        schedule = portfolio.solve(CPM(acts_file_path, 8))
+
+        with TemporaryDirectory() as temp_dir:
+            binary_file_path = f"{temp_dir}/input.bin"
+            ProjectGraphFile.convert(acts_file_path, binary_file_path)
+            cpm = CPM.from_project(Project.from_binary(binary_file_path, 8))
+            binary_portfolio = PriorityRulePortfolio(max_workers=max_workers)
+            binary_schedule = binary_portfolio.solve(cpm)
+
+        self.assertFalse(cpm.project.has_activities)
+        self.assertDictEqual(binary_portfolio.makespans, portfolio.makespans)
+        self.assertListEqual(binary_schedule.starts, schedule.starts)
+
+    def test_default_portfolio(self):
+        """
+        Tests that the default portfolio schedules the rules in the calling process and
+        leaves out the expensive MTS rule.
+        """
+
+        portfolio = PriorityRulePortfolio()
+        portfolio.solve(CPM(f"{ProblemsPaths.problem_3_dir}/input.csv", 8))
+
+        self.assertEqual(portfolio.max_workers, 1)
+        self.assertListEqual(list(portfolio.makespans),
+                             [name for name in PriorityRulePortfolio.rules if name != "mts"])
+
+    def test_portfolio_custom_rule(self):
+        """Tests that the portfolio schedules custom rules."""
+
+        class LongestDurationRule(PriorityRule):
+            """Longest duration first."""
+
+            name = "lpt"
+
+            def get_priorities(self, keys: PriorityKeys):
+                return -keys.durations
+
+        portfolio = PriorityRulePortfolio(["tr", LongestDurationRule()], max_workers=1)
+        portfolio.solve(CPM(f"{ProblemsPaths.problem_3_dir}/input.csv", 8))
+
+        self.assertListEqual(list(portfolio.makespans), ["tr", "lpt"])
+
+    ## Test failures
+    def test_unsupported_rule_should_fail(self):
+        """Tests that creating a portfolio with an unsupported rule fails."""
+
+        with self.assertRaises(ValueError, msg="Creating the portfolio should have failed as" +
+                               " the rule 'fifo' is not supported!"):
+            PriorityRulePortfolio(["tr", "fifo"])
+
+    @params([], ["tr", "tr"])
+    def test_invalid_rules_should_fail(self, rule_names: list):
+        """Tests that creating a portfolio without rules or with duplicate rules fails."""
+
+        with self.assertRaises(ValueError, msg="Creating the portfolio should have failed as" +
+                               f" its rules '{rule_names}' are invalid!"):
+            PriorityRulePortfolio(rule_names)
+
+    def test_invalid_max_workers_should_fail(self):
+        """Tests that creating a portfolio without worker processes fails."""
+
+        with self.assertRaises(ValueError, msg="Creating the portfolio should have failed as" +
+                               " 'max_workers' is not positive!"):
+            PriorityRulePortfolio(max_workers=0)
+
+    def test_rule_without_priorities_should_fail(self):
+        """Tests that a rule which does not implement its priorities fails."""
+
+        with self.assertRaises(NotImplementedError, msg="Computing the priorities should have" +
+                               " failed as the rule does not implement them!"):
+            PriorityRule().get_project_priorities(self._get_solved_project())
+
+    ## Helpful functions
+    @staticmethod
+    def _get_solved_project() -> Project:
+        """
+        Returns a small project solved by CPM.
+
+        The network consists of the chains 1-2 -> 2-4 -> 4-5 and 1-3 -> 3-5.
+        """
+
+        activities = [Activity("1-2", 2, 1), Activity("1-3", 1, 3), Activity("2-4", 3, 2),
+                      Activity("3-5", 2, 2), Activity("4-5", 1, 1)]
+        project = Project(activities, 3)
+        CPM.from_project(project).solve()
+
+        return project
+
+    @staticmethod
+    def _get_total_successors(act: Activity) -> set:
+        """Returns the IDs of all direct and indirect successors of the activity."""
+
+        successors, stack = set(), list(act.successors)
+        while stack:
+            succ = stack.pop()
+            if succ.id not in successors:
+                successors.add(succ.id)
+                stack.extend(succ.successors)
+
+        return successors
@@ -0,0 +1,124 @@
+from random import Random
+from typing import List
+import unittest
+from nose2.tools import params
+from heuristics.methods.resource_profile import ResourceProfile
+
+
+class ResourceProfileTestSuite(unittest.TestCase):
+    """Tests that assure ResourceProfile works correctly."""
+
+    ## Test correct behavior
+    def test_add_and_queries(self):
+        """Tests adding resources to ranges and querying them."""
+
+        profile = ResourceProfile(5, 10)
+        profile.add(2, 6, -3)
+        profile.add(4, 8, -1)
+
+        self.assertListEqual(profile.to_list(), [5, 5, 2, 2, 1, 1, 4, 4, 5, 5])
+        self.assertEqual(profile.get(5), 1)
+        self.assertEqual(profile.min(0, 10), 1)
+        self.assertEqual(profile.min(6, 9), 4)
+        self.assertIsNone(profile.min(3, 3))
+        self.assertTrue(profile.fits(6, 10, 4))
+        self.assertFalse(profile.fits(3, 7, 2))
+        self.assertEqual(profile.find_last_below(0, 10, 3), 5)
+        self.assertEqual(profile.find_last_below(0, 10, 5), 7)
+        self.assertIsNone(profile.find_last_below(6, 10, 4))
+
+    def test_extend_until(self):
+        """Tests that time units are added with all resources available."""
+
+        profile = ResourceProfile(3)
+        self.assertEqual(len(profile), 0)
+
+        profile.extend_until(2)
+        profile.add(0, 3, -2)
+        profile.extend_until(20)
+        profile.extend_until(5)
+
+        self.assertEqual(len(profile), 21)
+        self.assertListEqual(profile.to_list(), [1, 1, 1] + [3] * 18)
+
+    @params((0, 2, 3, 0), (0, 3, 3, 6), (0, 5, 3, 8), (3, 2, 2, 6), (1, 6, 0, 1),
+            (0, 6, 2, None))
+    def test_find_earliest_start(self, start_time: int, resources: int, duration: int,
+                                 correct_start_time: int):
+        """Tests finding the earliest time unit from which the resources are available."""
+
+        profile = ResourceProfile(5, 10)
+        profile.add(2, 6, -3)
+        profile.add(4, 8, -1)
+
+        self.assertEqual(profile.find_earliest_start(start_time, resources, duration),
+                         correct_start_time)
+
+    @params(1, 2, 3, 4, 5)
+    def test_random_operations(self, seed: int):
+        """Tests that random operations give the same results as a list of resources."""
+
+        random = Random(seed)
+        capacity = random.randint(1, 10)
+        profile = ResourceProfile(capacity, random.randint(1, 10))
+        resources = [capacity] * len(profile)
+
+        for _ in range(300):
+            start_time = random.randint(0, len(resources))
+            end_time = random.randint(start_time, len(resources))
+            amount = random.randint(-5, 5)
+            operation = random.random()
+
+            if operation < 0.1:
+                profile.extend_until(len(resources) + amount + 5)
+                resources += [capacity] * (len(profile) - len(resources))
+            elif operation < 0.5:
+                profile.add(start_time, end_time, amount)
+                resources[start_time:end_time] = [resource + amount for resource
+                                                  in resources[start_time:end_time]]
+            else:
+                self.assertEqual(profile.min(start_time, end_time),
+                                 min(resources[start_time:end_time], default=None))
+                self.assertEqual(profile.fits(start_time, end_time, amount),
+                                 all(resource >= amount for resource
+                                     in resources[start_time:end_time]))
+                self.assertEqual(profile.find_last_below(start_time, end_time, amount),
+                                 max((time for time in range(start_time, end_time)
+                                      if resources[time] < amount), default=None))
+                self.assertEqual(profile.find_earliest_start(start_time, amount, end_time),
+                                 self.find_earliest_start(resources, capacity, start_time,
+                                                          amount, end_time))
+
+            self.assertListEqual(profile.to_list(), resources)
+
+    ## Test failures
+    @params((-1, 2), (0, 11))
+    def test_accessing_missing_time_units_should_fail(self, start_time: int, end_time: int):
+        """Tests that accessing time units that were not added to the profile fails."""
+
+        profile = ResourceProfile(5, 10)
+
+        with self.assertRaises(IndexError, msg="Adding resources should have failed as the" +
+                               " time units are not part of the profile!"):
+            profile.add(start_time, end_time, -1)
+
+        with self.assertRaises(IndexError, msg="Finding the min. should have failed as the" +
+                               " time units are not part of the profile!"):
+            profile.min(start_time, end_time)
+
+    ## Helpful functions
+    @staticmethod
+    def find_earliest_start(resources: List[int], capacity: int, start_time: int,
+                            required_resources: int, duration: int) -> int:
+        """
+        Returns the earliest start found by checking every time unit from `start_time`, or
+        None if there is no such time unit.
+        """
+
+        # From the end of the resources on, all time units have the same resources available
+        for time in range(start_time, max(start_time, len(resources)) + 1):
+            if all((resources[unit] if unit < len(resources) else capacity) >=
+                   required_resources for unit in range(time, time + duration)):
+                return time
+
+        return None
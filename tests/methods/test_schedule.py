@@ -0,0 +1,87 @@
+from concurrent.futures import ThreadPoolExecutor
+import unittest
+from nose2.tools import params
+from heuristics.core.activities.activity import Activity
+from heuristics.core.cpm import CriticalPathMethod as CPM
+from heuristics.core.project import Project
+from heuristics.methods.phm import ParallelHeuristicMethod as PHM
+from heuristics.methods.phmdp import ParallelHeuristicMethodDynamicPriorities as PHMDP
+from heuristics.methods.schedule import Schedule
+from heuristics.methods.shm import SerialHeuristicMethod as SHM
+from tests.resources.problems.problems import ProblemsPaths
+
+
+class ScheduleTestSuite(unittest.TestCase):
+    """Tests that assure Schedule works correctly."""
+
+    activities = [Activity("1-2", 4, 3), Activity("1-3", 6, 5), Activity("2-3", 3, 3)]
+
+    ## Test correct behavior
+    def test_schedule_activity(self):
+        """Tests that scheduling an activity does not modify the project."""
+
+        project = Project(list(self.activities), 6)
+        schedule = Schedule(project, "Test")
+
+        schedule.schedule_activity(1, 2)
+
+        self.assertTrue(schedule.is_scheduled(1))
+        self.assertFalse(schedule.is_scheduled(0))
+        self.assertFalse(schedule.is_finished(1, 7))
+        self.assertTrue(schedule.is_finished(1, 8))
+        self.assertEqual(schedule.start_of("1-3"), 2)
+        self.assertEqual(schedule.end_of("1-3"), 8)
+        self.assertIsNone(schedule.priority_of("1-3"))
+        self.assertEqual(schedule.get_actual_end(), 8)
+        self.assertDictEqual(schedule.get_time_frame(1),
+                             {'label': "1-3", 'start': 2, 'end': 8, 'resource': 5})
+        self.assertNotIn('actual_start', project.activities[1].as_dict())
+
+    @params((ProblemsPaths.problem_1_dir, 7), (ProblemsPaths.problem_2_dir, 6),
+            (ProblemsPaths.problem_3_dir, 8), (ProblemsPaths.problem_4_dir, 6))
+    def test_methods_sharing_project(self, problem_dir: str, r_max: int):
+        """
+        Tests that many methods scheduling one project concurrently, with different r_max,
+        produce the same schedules as methods each loading their own project.
+        """
+
+        acts_file_path = f"{problem_dir}/input.csv"
+        cpm = CPM(acts_file_path, r_max)
+        cpm.solve()
+        activities = [act.as_dict() for act in cpm.project.activities]
+
+        methods = [method_class.from_cpm(cpm, method_r_max)
+                   for method_class in (SHM, PHM, PHMDP) for method_r_max in (r_max, r_max + 2)]
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            schedules = list(executor.map(lambda method: method.solve(), methods))
+
+        for method, schedule in zip(methods, schedules):
+            correct_method = type(method)(acts_file_path, method.r_max)
+            self.assertIs(schedule.project, cpm.project)
+            self.assertEqual(schedule, correct_method.solve())
+
+        self.assertListEqual([act.as_dict() for act in cpm.project.activities], activities)
+
+    def test_method_from_project(self):
+        """Tests that a method solves CPM of a project that is not solved yet."""
+
+        project = Project.from_file_and_args(f"{ProblemsPaths.problem_1_dir}/input.csv", 7)
+        schedule = SHM.from_project(project).solve()
+
+        self.assertEqual(schedule.actual_end, 24)
+        self.assertEqual(schedule.method_name, "Serial Heuristic Method (SHM)")
+
+    ## Test failures
+    def test_creating_schedule_with_wrong_length_should_fail(self):
+        """Tests that the schedule is not created if its lists do not match the activities."""
+
+        with self.assertRaises(ValueError, msg="Creating the schedule should have failed as" +
+                               " there are more starts than activities!"):
+            Schedule(Project(list(self.activities), 6), starts=[0, 0, 0, 0])
+
+    def test_getting_missing_activity_should_fail(self):
+        """Tests that getting the start of an activity that is not in the project fails."""
+
+        with self.assertRaises(ValueError, msg="Getting the start should have failed as" +
+                               " activity '5-6' is not part of the project!"):
+            Schedule(Project(list(self.activities), 6)).start_of("5-6")
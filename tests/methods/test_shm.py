@@ -6,6 +6,8 @@ from csv import reader as csv_reader
 from nose2.tools import params
 from heuristics.core.activities.activity import Activity
 from heuristics.core.activities.activity_id import ActivityID as ID
+from heuristics.core.project import Project
+from heuristics.methods.schedule import Schedule
 from heuristics.methods.shm import SerialHeuristicMethod as SHM
 from tests.core.test_cpm import CPMTestSuite
 from tests.resources.problems.problems import ProblemsPaths
@@ -27,15 +29,17 @@ class SHMTestSuite(unittest.TestCase):
         shm_correct_acts_file = f"{problem_dir}/shm_solution.csv"
 
         shm = SHM(problem_file, r_max)
-        shm.solve()
+        schedule = shm.solve()
 
-        # Verify that activities have correct values
-        correct_activities = self.get_correct_activities(cpm_correct_acts_file,
-                                                         shm_correct_acts_file)
-        self.assertListEqual(shm.cpm.project.activities, correct_activities)
+        # Verify that activities and the schedule have correct values
+        correct_schedule = self.get_correct_schedule(cpm_correct_acts_file,
+                                                     shm_correct_acts_file)
+        self.assertListEqual(shm.cpm.project.activities, correct_schedule.project.activities)
+        self.assertIs(shm.schedule, schedule)
+        self.assertEqual(schedule, correct_schedule)
 
         # Verify that the project end is correct
-        self.assertEqual(shm.cpm.project.actual_end, shm_project_end)
+        self.assertEqual(schedule.actual_end, shm_project_end)
 
         # Verify that the resources available in each time point were not overstepped
         num_time_points = shm_project_end + 1
@@ -54,11 +58,11 @@ class SHMTestSuite(unittest.TestCase):
         cpm_acts_file = f"{problem_dir}/cpm_solution.csv"
         shm_acts_file = f"{problem_dir}/shm_solution.csv"
 
-        activities = self.get_correct_activities(cpm_acts_file,
-                                                 shm_acts_file)
+        schedule = self.get_correct_schedule(cpm_acts_file, shm_acts_file)
 
         shm = SHM(problem_file, r_max)
-        shm.cpm.project.activities = activities
+        shm.cpm.project = schedule.project
+        shm.schedule = schedule
 
         cpm_json_file = shm.activities_schedule_to_json_file(
             "CPM", "cpm", "cpm_activities_schedule.json")
@@ -83,23 +87,41 @@ class SHMTestSuite(unittest.TestCase):
         remove(cpm_json_file)
         remove(shm_json_file)
 
+    ## Test failures
+    def test_solving_with_insufficient_resources_should_fail(self):
+        """Tests that solving fails if an activity requires more resources than available."""
+
+        project = Project([Activity("1-2", 1, 1), Activity("2-3", 1, 5)], 3)
+
+        with self.assertRaises(RuntimeError, msg="Solving should have failed as activity" +
+                               " '2-3' requires more resources than available!"):
+            SHM.from_project(project).solve()
+
     ## Helpful functions
     @staticmethod
-    def get_correct_activities(cpm_correct_acts_file: str,
-                               shm_correct_acts_file: str) -> List[Activity]:
-        """Returns the activities with correct values of a particular problem from a given file."""
-        activities = CPMTestSuite.get_correct_activities(cpm_correct_acts_file).activities
+    def get_correct_schedule(cpm_correct_acts_file: str,
+                             correct_schedule_file: str) -> Schedule:
+        """
+        Returns the schedule with correct values of a particular problem from a given file.
 
-        with open(shm_correct_acts_file, encoding='utf-8') as sol:
+        The priorities are read only if the file contains them.
+        """
+        project = CPMTestSuite.get_correct_activities(cpm_correct_acts_file)
+        schedule = Schedule(project)
+
+        with open(correct_schedule_file, encoding='utf-8') as sol:
             lines = csv_reader(sol, delimiter=' ')
             next(lines) # Skip CSV headers
             for line in lines:
-                id = ID.from_str(str(line[0]))
-                act = SHMTestSuite.get_act_by_id(id, activities)
-                act.actual_start = int(line[1])
-                act.actual_end = int(line[2])
+                position = project.positions[ID.from_str(str(line[0]))]
+                schedule.starts[position] = int(line[1])
+                schedule.ends[position] = int(line[2])
+                if len(line) > 3:
+                    schedule.priorities[position] = int(line[3])
+
+        schedule.actual_end = schedule.get_actual_end()
 
-        return activities
+        return schedule
 
     @staticmethod
     def get_act_by_id(id: ID, activities: List[Activity]) -> Activity:
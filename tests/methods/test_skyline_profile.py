@@ -0,0 +1,143 @@
+from random import Random
+import unittest
+from nose2.tools import params
+from heuristics.methods.phm import ParallelHeuristicMethod as PHM
+from heuristics.methods.phmdp import ParallelHeuristicMethodDynamicPriorities as PHMDP
+from heuristics.methods.resource_profile import ResourceProfile
+from heuristics.methods.shm import SerialHeuristicMethod as SHM
+from heuristics.methods.skyline_profile import SkylineProfile
+from tests.resources.problems.problems import ProblemsPaths
+
+
+class SkylineProfileTestSuite(unittest.TestCase):
+    """Tests that assure SkylineProfile works correctly."""
+
+    ## Test correct behavior
+    def test_add_and_queries(self):
+        """Tests adding resources to ranges and querying them."""
+
+        profile = SkylineProfile(5, 10)
+        profile.add(2, 6, -3)
+        profile.add(4, 8, -1)
+
+        self.assertListEqual(profile.to_list(), [5, 5, 2, 2, 1, 1, 4, 4, 5, 5])
+        self.assertEqual(profile.get(5), 1)
+        self.assertEqual(profile.min(0, 10), 1)
+        self.assertEqual(profile.min(6, 9), 4)
+        self.assertIsNone(profile.min(3, 3))
+        self.assertTrue(profile.fits(6, 10, 4))
+        self.assertFalse(profile.fits(3, 7, 2))
+        self.assertEqual(profile.find_last_below(0, 10, 3), 5)
+        self.assertEqual(profile.find_last_below(0, 10, 5), 7)
+        self.assertIsNone(profile.find_last_below(6, 10, 4))
+
+    def test_breakpoints_are_merged(self):
+        """Tests that only the time units where the resources change are stored."""
+
+        profile = SkylineProfile(5)
+        profile.extend_until(10**9)
+        profile.add(10, 20, -2)
+        profile.add(20, 10**6, -2)
+        self.assertEqual(repr(profile),
+                         "SkylineProfile(capacity=5, time_points=1000000001, breakpoints=3)")
+
+        profile.add(10, 10**6, 2)
+        self.assertEqual(repr(profile),
+                         "SkylineProfile(capacity=5, time_points=1000000001, breakpoints=1)")
+        self.assertEqual(profile.min(0, 10**9), 5)
+
+    @params((0, 2, 3, 0), (0, 3, 3, 6), (0, 5, 3, 8), (3, 2, 2, 6), (1, 6, 0, 1),
+            (0, 6, 2, None))
+    def test_find_earliest_start(self, start_time: int, resources: int, duration: int,
+                                 correct_start_time: int):
+        """Tests finding the earliest time unit from which the resources are available."""
+
+        profile = SkylineProfile(5, 10)
+        profile.add(2, 6, -3)
+        profile.add(4, 8, -1)
+
+        self.assertEqual(profile.find_earliest_start(start_time, resources, duration),
+                         correct_start_time)
+
+    @params((0, 2, 3, 0, 2), (0, 3, 3, 6, 5), (4, 3, 3, 6, 3), (1, 6, 0, 1, 0))
+    def test_find_earliest_start_probes(self, start_time: int, resources: int, duration: int,
+                                        correct_start_time: int, num_probes: int):
+        """Tests that finding the earliest start counts the steps it probes."""
+
+        profile = SkylineProfile(5, 10)
+        profile.add(2, 6, -3)
+        profile.add(4, 8, -1)
+
+        self.assertEqual(profile.find_earliest_start(start_time, resources, duration),
+                         correct_start_time)
+        self.assertEqual(profile.num_probes, num_probes)
+
+    @params(1, 2, 3, 4, 5)
+    def test_random_operations(self, seed: int):
+        """Tests that random operations give the same results as ResourceProfile."""
+
+        random = Random(seed)
+        capacity = random.randint(1, 10)
+        num_time_points = random.randint(1, 10)
+        profile = SkylineProfile(capacity, num_time_points)
+        tree_profile = ResourceProfile(capacity, num_time_points)
+
+        for _ in range(300):
+            start_time = random.randint(0, len(profile))
+            end_time = random.randint(start_time, len(profile))
+            amount = random.randint(-5, 5)
+            operation = random.random()
+
+            if operation < 0.1:
+                profile.extend_until(len(profile) + amount + 5)
+                tree_profile.extend_until(len(profile) - 1)
+            elif operation < 0.5:
+                profile.add(start_time, end_time, amount)
+                tree_profile.add(start_time, end_time, amount)
+            else:
+                for query in ("fits", "find_last_below"):
+                    self.assertEqual(getattr(profile, query)(start_time, end_time, amount),
+                                     getattr(tree_profile, query)(start_time, end_time, amount))
+                self.assertEqual(profile.min(start_time, end_time),
+                                 tree_profile.min(start_time, end_time))
+                self.assertEqual(profile.find_earliest_start(start_time, amount, end_time),
+                                 tree_profile.find_earliest_start(start_time, amount, end_time))
+
+            self.assertListEqual(profile.to_list(), tree_profile.to_list())
+
+    @params((ProblemsPaths.problem_1_dir, 7), (ProblemsPaths.problem_2_dir, 6),
+            (ProblemsPaths.problem_3_dir, 8), (ProblemsPaths.problem_4_dir, 6))
+    def test_methods_with_skyline_profile(self, problem_dir: str, r_max: int):
+        """Tests that methods produce the same schedules with both profiles."""
+
+        acts_file_path = f"{problem_dir}/input.csv"
+        for method_class in (SHM, PHM, PHMDP):
+            method = method_class(acts_file_path, r_max, profile="skyline")
+            correct_method = method_class(acts_file_path, r_max)
+
+            self.assertEqual(method.solve(), correct_method.solve())
+            self.assertIsInstance(method.resource_profile, SkylineProfile)
+            self.assertListEqual(method.available_resources,
+                                 correct_method.available_resources)
+
+    ## Test failures
+    @params((-1, 2), (0, 11))
+    def test_accessing_missing_time_units_should_fail(self, start_time: int, end_time: int):
+        """Tests that accessing time units that were not added to the profile fails."""
+
+        profile = SkylineProfile(5, 10)
+
+        with self.assertRaises(IndexError, msg="Adding resources should have failed as the" +
+                               " time units are not part of the profile!"):
+            profile.add(start_time, end_time, -1)
+
+        with self.assertRaises(IndexError, msg="Finding the min. should have failed as the" +
+                               " time units are not part of the profile!"):
+            profile.min(start_time, end_time)
+
+    def test_unsupported_profile_should_fail(self):
+        """Tests that a method is not created with an unsupported profile."""
+
+        with self.assertRaises(ValueError, msg="Creating the method should have failed as" +
+                               " the profile is not supported!"):
+            SHM(f"{ProblemsPaths.problem_1_dir}/input.csv", 7, profile="list")
@@ -0,0 +1,85 @@
+import unittest
+from nose2.tools import params
+from heuristics.core.activities.activity import Activity
+from heuristics.core.cpm import CriticalPathMethod as CPM
+from heuristics.core.project import Project
+from heuristics.methods.phm import ParallelHeuristicMethod as PHM
+from heuristics.methods.phmdp import ParallelHeuristicMethodDynamicPriorities as PHMDP
+from heuristics.methods.shm import SerialHeuristicMethod as SHM
+from heuristics.methods.sweep import RMaxSweep
+from tests.resources.problems.problems import ProblemsPaths
+
+
+class RMaxSweepTestSuite(unittest.TestCase):
+    """Tests that assure RMaxSweep works correctly."""
+
+    ## Test correct behavior
+    @params(ProblemsPaths.problem_1_dir, ProblemsPaths.problem_2_dir,
+            ProblemsPaths.problem_3_dir, ProblemsPaths.problem_4_dir)
+    def test_solve(self, problem_dir: str):
+        """Tests that the curves match the methods solved for each r_max separately."""
+
+        acts_file_path = f"{problem_dir}/input.csv"
+        sweep = RMaxSweep.from_file(acts_file_path)
+        r_max_range = sweep.get_r_max_range()
+        curves = sweep.solve(stop_early=False)
+
+        for method_name, method_class in (("shm", SHM), ("phm", PHM), ("phmdp", PHMDP)):
+            curve = curves[method_name]
+            self.assertListEqual(curve.r_max_values, list(r_max_range))
+            self.assertListEqual(curve.makespans,
+                                 [method_class(acts_file_path, r_max).solve().actual_end
+                                  for r_max in r_max_range])
+
+            # No activity is delayed by the resources at the end of the range
+            self.assertEqual(curve.makespans[-1], sweep.cpm.project.earliest_end)
+
+    def test_stop_early(self):
+        """Tests that the sweep of a method stops once the earliest end is reached."""
+
+        sweep = RMaxSweep.from_file(f"{ProblemsPaths.problem_3_dir}/input.csv")
+        curves = sweep.solve()
+
+        self.assertEqual(sweep.get_r_max_range(), range(4, 13))
+        for curve in curves.values():
+            self.assertEqual(curve.get_points()[-1], (10, 39))
+            self.assertTrue(curve.reaches_earliest_end)
+            self.assertNotIn(39, curve.makespans[:-1])
+
+    @params("python", "vectorized")
+    def test_solve_in_worker_processes(self, engine: str):
+        """
+        Tests that worker processes, which receive the solved graph of the project, produce
+        the same curves as the calling process.
+        """
+
+        cpm = CPM(f"{ProblemsPaths.problem_3_dir}/input.csv", 6, engine=engine)
+        method_names = ("phm", "shm", "phmdp")
+        curves = RMaxSweep(cpm, method_names).solve([9, 5, 7, 6, 8])
+        for max_workers in (2, None):
+            process_curves = RMaxSweep(cpm, method_names, max_workers).solve([9, 5, 7, 6, 8])
+
+            for method_name, curve in curves.items():
+                self.assertListEqual(curve.r_max_values, [5, 6, 7, 8, 9])
+                self.assertListEqual(process_curves[method_name].get_points(),
+                                     curve.get_points())
+
+    def test_r_max_range(self):
+        """
+        Tests that the range ends at the peak resources of the earliest starts schedule.
+        """
+
+        project = Project([Activity("1-2", 2, 3), Activity("1-3", 4, 2), Activity("2-3", 2, 4),
+                           Activity("3-4", 0, 1)], 1)
+        sweep = RMaxSweep(CPM.from_project(project))
+
+        self.assertEqual(sweep.get_r_max_range(), range(4, 7))
+
+    ## Test failures
+    @params(({'method_names': ("phm", "ga")}), ({'profile': "list"}), ({'max_workers': 0}))
+    def test_creating_sweep_with_invalid_arguments_should_fail(self, kwargs: dict):
+        """Tests that the sweep is not created with invalid arguments."""
+
+        with self.assertRaises(ValueError, msg="Creating the sweep should have failed as" +
+                               f" the arguments '{kwargs}' are invalid!"):
+            RMaxSweep(CPM(f"{ProblemsPaths.problem_1_dir}/input.csv", 6), **kwargs)
@@ -0,0 +1,61 @@
+import json
+import subprocess
+import sys
+import unittest
+from nose2.tools import params
+
+
+class ImportTimeTestSuite(unittest.TestCase):
+    """
+    Tests that assure the solver modules import quickly and without the plotting
+    dependencies.
+    """
+
+    budget_seconds = 0.5
+    """Max. time of importing the modules in a fresh interpreter."""
+
+    heavy_modules = ("numpy", "matplotlib")
+    """Modules that must be imported only when they are used."""
+
+    modules = ("heuristics.core.cpm", "heuristics.core.cache", "heuristics.core.graph_file",
+               "heuristics.core.stats", "heuristics.core.activities.generator",
+               "heuristics.methods.shm", "heuristics.methods.phmdp", "heuristics.methods.batch",
+               "heuristics.methods.sweep", "heuristics.methods.priority_rules",
+               "heuristics.methods.export", "heuristics.benchmarks.runner",
+               "heuristics.visualization.gantt")
+
+    ## Test correct behavior
+    @params(*modules)
+    def test_import_without_heavy_modules(self, module: str):
+        """Tests that importing the module does not import NumPy or matplotlib."""
+
+        imported = self._import([module])
+
+        self.assertListEqual(imported['heavy_modules'], [])
+
+    def test_import_time_budget(self):
+        """Tests that importing all of the modules fits into the budget."""
+
+        imported = self._import(self.modules)
+
+        self.assertLess(imported['seconds'], self.budget_seconds,
+                        msg=f"Importing the modules took {imported['seconds']:.3f} s!")
+
+    ## Helpful functions
+    def _import(self, modules: tuple) -> dict:
+        """
+        Imports the modules in a fresh interpreter and returns the time it took and
+        the heavy modules that were imported.
+        """
+
+        code = ("import json, sys, time\n" +
+                "time_start = time.perf_counter()\n" +
+                "".join(f"import {module}\n" for module in modules) +
+                "seconds = time.perf_counter() - time_start\n" +
+                f"heavy_modules = [name for name in {self.heavy_modules!r}" +
+                " if name in sys.modules]\n" +
+                "print(json.dumps({'seconds': seconds, 'heavy_modules': heavy_modules}))\n")
+        output = subprocess.run([sys.executable, "-c", code], check=True, capture_output=True,
+                                text=True).stdout
+
+        return json.loads(output)
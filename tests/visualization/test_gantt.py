@@ -0,0 +1,162 @@
+import json
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+import matplotlib
+import matplotlib.pyplot as plt
+from nose2.tools import params
+from heuristics.methods.phm import ParallelHeuristicMethod as PHM
+from heuristics.visualization.gantt import Gantt, render_schedules
+from tests.resources.problems.problems import ProblemsPaths
+
+matplotlib.use("Agg")
+
+
+class GanttTestSuite(unittest.TestCase):
+    """Tests that assure Gantt works correctly."""
+
+    ## Test correct behavior
+    @params((10, "auto", "bars"), (10, "collection", "collection"),
+            (Gantt.maxBars + 1, "auto", "collection"), (Gantt.maxBars + 1, "bars", "bars"))
+    def test_render_mode(self, num_packages: int, mode: str, rendered_mode: str):
+        """Tests that large charts are rendered as a single collection."""
+
+        gantt = self._get_gantt(self._get_packages(num_packages))
+        gantt.render(mode)
+
+        self.assertEqual(hasattr(gantt, "collection"), rendered_mode == "collection")
+        self.assertEqual(hasattr(gantt, "barlist"), rendered_mode == "bars")
+        plt.close(gantt.fig)
+
+    def test_render_mode_for_long_bars(self):
+        """
+        Tests that a few long bars are rendered as a collection, as the bars mode would draw
+        a resource label per time unit.
+        """
+
+        packages = [{'label': f"{idx + 1}-{idx + 2}", 'start': 0, 'end': Gantt.maxBarLabels,
+                     'resource': 1} for idx in range(3)]
+        gantt = self._get_gantt(packages)
+        gantt.render()
+
+        self.assertEqual(gantt.countBarLabels(), 3 * Gantt.maxBarLabels)
+        self.assertTrue(hasattr(gantt, "collection"))
+        self.assertFalse(hasattr(gantt, "barlist"))
+        plt.close(gantt.fig)
+
+    @params((10, 10), (Gantt.maxRows * 3, Gantt.maxRows))
+    def test_render_collection_rows(self, num_packages: int, num_rows: int):
+        """Tests that the packages are merged into at most maxRows rows."""
+
+        gantt = self._get_gantt(self._get_packages(num_packages))
+        gantt.render("collection")
+
+        self.assertEqual(len(gantt.collection.get_paths()), num_packages)
+        self.assertEqual(len(set(gantt.yPos.tolist())), num_rows)
+        self.assertEqual(gantt.yPos[0], num_rows)
+        plt.close(gantt.fig)
+
+    def test_resource_profile(self):
+        """Tests that the aggregated profile sums the resources in each point in time."""
+
+        packages = [{'label': "1-2", 'start': 0, 'end': 4, 'resource': 2},
+                    {'label': "1-3", 'start': 2, 'end': 6, 'resource': 3},
+                    {'label': "2-3", 'start': 4, 'end': 5, 'resource': 1}]
+        gantt = self._get_gantt(packages)
+        gantt.render("collection")
+        gantt.add_resource_profile()
+
+        times, levels = gantt.resourceAx.lines[0].get_data()
+        self.assertListEqual(list(times), [0, 2, 4, 5, 6])
+        self.assertListEqual(list(levels), [2, 5, 4, 3, 0])
+        plt.close(gantt.fig)
+
+    @params((20, 20), (Gantt.maxXticks + 1, 0))
+    def test_xticks(self, project_end: int, num_xticks: int):
+        """Tests that there is one xtick per time unit only for short projects."""
+
+        gantt = self._get_gantt([{'label': "1-2", 'start': 0, 'end': project_end,
+                                  'resource': 1}])
+
+        self.assertEqual(len(gantt.xticks), num_xticks)
+
+    def test_from_schedule(self):
+        """Tests that the chart of a schedule is the same as the one loaded from its file."""
+
+        phm = PHM(f"{ProblemsPaths.problem_3_dir}/input.csv", 8)
+        schedule = phm.solve()
+
+        with TemporaryDirectory() as temp_dir:
+            file_gantt = Gantt(phm.activities_schedule_to_json_file(
+                json_file_path=Path(temp_dir, "gantt.json"), method_name="PHM"))
+        gantt = Gantt.from_schedule(schedule, title="PHM - Gantt chart", backend="Agg")
+
+        self.assertEqual(gantt.title, file_gantt.title)
+        self.assertListEqual(gantt.labels, file_gantt.labels)
+        self.assertListEqual(gantt.start, file_gantt.start)
+        self.assertListEqual(gantt.end, file_gantt.end)
+        self.assertListEqual(gantt.resources, file_gantt.resources)
+
+    def test_from_arrays_without_unscheduled(self):
+        """Tests that unscheduled packages are left out of the chart."""
+
+        gantt = Gantt.from_arrays(["1-2", "2-3"], [0, None], [2, None], [1, 1])
+
+        self.assertListEqual(gantt.labels, ["1-2"])
+
+    @params(([], [], [], []), (["1-2"], [None], [None], [1]))
+    def test_render_empty_schedule(self, labels: list, starts: list, ends: list,
+                                   resources: list):
+        """Tests that a chart without scheduled packages is rendered in both modes."""
+
+        for mode in ("bars", "collection"):
+            gantt = Gantt.from_arrays(labels, starts, ends, resources, backend="Agg")
+            gantt.render(mode)
+
+            self.assertEqual(gantt.nPackages, 0)
+            self.assertTupleEqual(gantt.ax.get_xlim(), (0, 1))
+            self.assertTupleEqual(gantt.ax.get_ylim(), (1, 2))
+            gantt.close()
+
+    @params(1, 2)
+    def test_render_schedules(self, max_workers: int):
+        """Tests that the charts of schedules are saved to image files."""
+
+        schedules = [PHM(f"{ProblemsPaths.problem_1_dir}/input.csv", 7).solve(),
+                     (["1-2", "2-3"], [0, 2], [2, 5], [1, 3], "Arrays")]
+
+        with TemporaryDirectory() as temp_dir:
+            image_files = [str(Path(temp_dir, f"gantt_{idx}.png")) for idx in range(2)]
+            saved_files = render_schedules(schedules, image_files, maxWorkers=max_workers)
+
+            self.assertListEqual(saved_files, image_files)
+            self.assertTrue(all(Path(image_file).stat().st_size > 0
+                                for image_file in image_files))
+
+    ## Test failures
+    def test_render_with_unsupported_mode_should_fail(self):
+        """Tests that rendering fails for an unsupported mode."""
+
+        gantt = self._get_gantt(self._get_packages(2))
+        with self.assertRaises(ValueError, msg="Rendering should have failed as the mode" +
+                               " 'svg' is not supported!"):
+            gantt.render("svg")
+
+    ## Helpful functions
+    @staticmethod
+    def _get_packages(num_packages: int) -> list:
+        """Returns packages, each starting one time unit after the previous one."""
+
+        return [{'label': f"{idx + 1}-{idx + 2}", 'start': idx, 'end': idx + 3,
+                 'resource': idx % 4} for idx in range(num_packages)]
+
+    @staticmethod
+    def _get_gantt(packages: list) -> Gantt:
+        """Returns the Gantt chart of the packages loaded from a JSON file."""
+
+        with TemporaryDirectory() as temp_dir:
+            json_file_path = Path(temp_dir, "gantt.json")
+            with open(json_file_path, "w", encoding="utf-8") as file:
+                json.dump({'packages': packages, 'title': "Test"}, file)
+
+            return Gantt(json_file_path)